@@ -0,0 +1,70 @@
+"""
+Benchmark for rendering the attrs of 10k table cells, where the cell attrs
+are partly static and partly evaluated per row. `render_attrs` is the
+rendering without the render cache of the attrs declaration.
+
+Run with:
+
+    python -m benchmarks.attrs_rendering
+"""
+import os
+import timeit
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from iommi import (  # noqa: E402
+    Column,
+    Table,
+)
+from iommi.attrs import render_attrs  # noqa: E402
+from tests.helpers import req  # noqa: E402
+
+NUMBER_OF_ROWS = 1000
+NUMBER_OF_COLUMNS = 10
+
+
+def column():
+    return Column(
+        cell__value=lambda row, **_: row,
+        cell__attrs=dict(
+            class__cell=True,
+            class__odd=lambda row, **_: row % 2 == 1,
+            style__width='10em',
+            title='A cell',
+        ),
+    )
+
+
+def main(number=5):
+    table = Table(
+        columns={f'column_{i}': column() for i in range(NUMBER_OF_COLUMNS)},
+        rows=list(range(NUMBER_OF_ROWS)),
+        page_size=None,
+    ).refine_done()
+    request = req('get')
+
+    cells = [cell for cells in table.bind(request=request).cells_for_rows() for cell in cells]
+    assert len(cells) == NUMBER_OF_ROWS * NUMBER_OF_COLUMNS
+
+    def render_attrs_uncached():
+        for cell in cells:
+            render_attrs(cell.attrs)
+
+    def render_cell_attrs():
+        for cell in cells:
+            cell.attrs.__html__()
+
+    def render_table():
+        table.bind(request=request).__html__()
+
+    for f in [render_attrs_uncached, render_cell_attrs, render_table]:
+        duration = timeit.timeit(f, number=number)
+        print(f'{f.__name__:>21}: {duration / number * 1000:7.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
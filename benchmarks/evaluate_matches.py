@@ -0,0 +1,86 @@
+"""
+Micro-benchmark for the signature matching in `iommi.evaluate`.
+
+Compares `matches` to the previous string based implementation, for the
+caller/callee signature pairs seen when evaluating the cells of a table.
+
+Run with:
+
+    python -m benchmarks.evaluate_matches
+"""
+import os
+import timeit
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from iommi.evaluate import (  # noqa: E402
+    evaluate,
+    get_signature,
+    matches,
+    signature_from_kwargs,
+)
+
+_legacy_matches_cache = {}
+
+
+def legacy_matches(caller_parameters, callee_parameters, __match_empty=False):
+    cache_key = ';'.join((caller_parameters, callee_parameters, str(int(__match_empty))))
+    cached_value = _legacy_matches_cache.get(cache_key, None)
+    if cached_value is not None:
+        return cached_value
+
+    caller = set(caller_parameters.split(',')) if caller_parameters else set()
+
+    a, b, c = callee_parameters.split('|')
+    required = set(a.split(',')) if a else set()
+    optional = set(b.split(',')) if b else set()
+    wildcard = c == '*'
+
+    if not __match_empty and not required and not optional and wildcard:
+        result = False
+    else:
+        if wildcard:
+            result = caller >= required
+        else:
+            result = required <= caller <= required.union(optional)
+
+    _legacy_matches_cache[cache_key] = result
+    return result
+
+
+CELL_PARAMETERS = dict.fromkeys(
+    ['request', 'table', 'column', 'traversable', 'cells', 'row', 'bound_cell', 'value', 'params']
+)
+
+CALLEES = [
+    lambda row, **_: row,
+    lambda column, row, **_: (column, row),
+    lambda value, **_: value,
+    lambda table, column, row, value, **_: value,
+    lambda row, cells: row,
+    lambda **_: None,
+]
+
+
+def main(number=200_000):
+    caller = signature_from_kwargs(CELL_PARAMETERS)
+    callees = [get_signature(f) for f in CALLEES]
+
+    for name, f in [('legacy', legacy_matches), ('bitset', matches)]:
+        duration = timeit.timeit(lambda: [f(caller, callee, True) for callee in callees], number=number)
+        print(f'{name:>8} matches: {duration / (number * len(callees)) * 1e9:7.1f} ns/call')
+
+    def evaluate_cell():
+        for callee in CALLEES:
+            evaluate(callee, __signature=caller, **CELL_PARAMETERS)
+
+    duration = timeit.timeit(evaluate_cell, number=number)
+    print(f'       evaluate: {duration / (number * len(CALLEES)) * 1e9:7.1f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
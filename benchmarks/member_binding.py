@@ -0,0 +1,53 @@
+"""
+Benchmark for the lazy binding of members, with a table of 200 columns.
+
+Run with:
+
+    python -m benchmarks.member_binding
+"""
+import os
+import timeit
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from iommi import (  # noqa: E402
+    Column,
+    Table,
+)
+from tests.helpers import req  # noqa: E402
+
+NUMBER_OF_COLUMNS = 200
+
+
+def main(number=50):
+    table = Table(
+        columns={f'column_{i}': Column() for i in range(NUMBER_OF_COLUMNS)},
+        rows=[],
+    ).refine_done()
+    names = [f'column_{i}' for i in range(NUMBER_OF_COLUMNS)]
+    request = req('get')
+
+    def bind_in_order():
+        columns = table.bind(request=request).columns
+        for name in names:
+            columns[name]
+
+    def bind_in_reverse_order():
+        columns = table.bind(request=request).columns
+        for name in reversed(names):
+            columns[name]
+
+    def bind_all():
+        list(table.bind(request=request).columns.values())
+
+    for f in [bind_in_order, bind_in_reverse_order, bind_all]:
+        duration = timeit.timeit(f, number=number)
+        print(f'{f.__name__:>22}: {duration / number * 1000:7.2f} ms per table')
+
+
+if __name__ == '__main__':
+    main()
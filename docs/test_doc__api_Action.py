@@ -0,0 +1,236 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Action
+======
+
+Base class: :doc:`Fragment`
+
+"""
+def test_base():
+    # language=rst
+    """
+The `Action` class describes buttons and links.
+
+Examples:
+
+    """
+
+    # @test
+    actions = [
+    # @end
+
+    # Link
+    Action(attrs__href='http://example.com'),
+
+    # Link with icon
+    Action.icon('edit', attrs__href="edit/"),
+
+    # Button
+    Action.button(display_name='Button title!'),
+
+    # A submit button
+    Action.submit(display_name='Do this'),
+
+    # The primary submit button on a form.
+    Action.primary(),
+
+    # @test
+    ]
+
+    from iommi.refinable import Prio
+    foo = Page(
+        parts={
+            f'button_{i}': html.div(action.refine(display_name='Action', prio=Prio.shortcut))
+            for i, action in enumerate(actions)
+        }
+    )
+    show_output(foo)
+    # @end
+
+    # language=rst
+    """
+    Notice that because forms
+with a single primary submit button are so common, iommi assumes
+that if you have an action called submit and do NOT explicitly
+specify the action that it is a primary action. This is only
+done for the action called submit, inside the Forms actions
+Namespace.
+
+For that reason this works:
+
+    """
+
+    class MyForm(Form):
+        class Meta:
+            @staticmethod
+            def actions__submit__post_handler(form, **_):
+                if not form.is_valid():
+                    return
+
+                ...
+
+    # language=rst
+    """
+    and is roughly equivalent to
+
+    """
+
+    def on_submit(form, **_):
+        if not form.is_valid():
+            return
+
+    class MyOtherForm(Form):
+        class Meta:
+            actions__submit = Action.primary(post_handler=on_submit)
+
+    # @test
+    r = req('post', **{'-submit': ''})
+    MyForm().bind(request=r).render_to_response()
+    MyOtherForm().bind(request=r).render_to_response()
+    # @end
+    # language=rst
+    """
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `attrs`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Attrs`
+
+
+* `children`
+
+* `display_name`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+    Default: `lambda action, **_: capitalize(action._name).replace('_', ' ')`
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `group`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `post_handler`
+    Type: `Callable`
+
+
+* `tag`       (:ref:`evaluated <evaluate>`)
+    Default: `a`
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+
+Shortcuts
+---------
+
+`button`
+^^^^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `button`
+
+`delete`
+^^^^^^^^
+
+`icon`
+^^^^^^
+
+`primary`
+^^^^^^^^^
+
+`submit`
+^^^^^^^^
+
+Defaults
+++++++++
+
+* `attrs__accesskey`
+    * `s`
+* `attrs__name`
+    * `lambda action, **_: action.own_target_marker()`
+* `display_name`
+    * `Submit`
+
+Methods
+-------
+
+`is_target`
+^^^^^^^^^^^
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`own_target_marker`
+^^^^^^^^^^^^^^^^^^^
+
+    """
@@ -0,0 +1,90 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Container
+=========
+
+Base class: :doc:`Fragment`
+
+"""
+def test_base():
+    # language=rst
+    """
+The main container for iommi. This class is useful when you want to apply styling or change the tag of what iommi produces for its content inside your body tag.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `attrs`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Attrs`
+
+
+* `children`
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `tag`       (:ref:`evaluated <evaluate>`)
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+
+    """
@@ -0,0 +1,140 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Fragment
+========
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+`Fragment` is a class used to build small HTML fragments that plug into iommi's structure.
+
+    """
+
+    # @test
+    from iommi.fragment import Fragment
+    # @end
+
+    h1 = Fragment(children__text='Tony', tag='h1')
+
+    # language=rst
+    """
+    It's easiest to use via the html builder:
+
+    """
+
+    h1 = html.h1('Tony')
+
+    # language=rst
+    """
+    Fragments are useful because attrs, template and tag are evaluated, so if
+you have a `Page` with a fragment in it you can configure it later:
+
+    """
+
+    class MyPage(Page):
+        header = html.h1(
+            'Hi!',
+            attrs__class__staff=
+                lambda request, **_: request.user.is_staff,
+        )
+
+    # language=rst
+    """
+    Rendering a `MyPage` will result in a `<h1>`, but if you do
+`MyPage(parts__header__tag='h2')` it will be rendered with a `<h2>`.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `attrs`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Attrs`
+
+
+* `children`
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `tag`       (:ref:`evaluated <evaluate>`)
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+
+Methods
+-------
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`render_text_or_children`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    """
@@ -0,0 +1,102 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Header
+======
+
+Base class: :doc:`Fragment`
+
+"""
+def test_base():
+    # language=rst
+    """
+`Header` is a special fragment that automatically calculates its level.
+This means that you will get `h1` for the top level, `h2` for the next level,
+and so on. If you want a specific `h1`/`h2`/etc tag use `Fragment`.
+
+The header level is only increased by the existence of `Header` objects,
+so putting a manual `h1` somewhere won't make the next `Header` into a
+`h2` tag.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `attrs`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Attrs`
+
+
+* `children`
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `tag`       (:ref:`evaluated <evaluate>`)
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+
+Methods
+-------
+
+`on_bind`
+^^^^^^^^^
+
+    """
@@ -0,0 +1,134 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Menu
+====
+
+Base class: `MenuBase`
+
+"""
+def test_base():
+    # language=rst
+    """
+Class that describes menus.
+
+Example:
+
+    """
+
+    menu = Menu(
+        sub_menu=dict(
+            root=MenuItem(url='/'),
+
+            albums=MenuItem(url='/albums/'),
+
+            # url defaults to /<name>/ so we
+            # don't need to write /musicians/ here
+            musicians=MenuItem(),
+        ),
+    )
+    # language=rst
+    """
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `attrs`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Attrs`
+
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `items_container`
+
+* `sort`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+    Default: `False`
+
+* `sub_menu`
+    Type: `Dict`
+
+
+* `tag`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+
+Methods
+-------
+
+`on_bind`
+^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`set_active`
+^^^^^^^^^^^^
+
+`validate`
+^^^^^^^^^^
+
+    """
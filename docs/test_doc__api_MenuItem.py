@@ -0,0 +1,134 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+MenuItem
+========
+
+Base class: `MenuBase`
+
+"""
+def test_base():
+    # language=rst
+    """
+Class that is used for the clickable menu items in a menu.
+
+See :doc:`Menu` for more complete examples.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `a`
+
+* `active_class`
+
+* `active_class_on_item`
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `attrs`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Attrs`
+
+
+* `display_name`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+    Default: `lambda menu_item, **_: capitalize(menu_item.iommi_name()).replace('_', ' ')`
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `group`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `regex`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+    Default: `lambda menu_item, **_: '^' + str(menu_item.url) if menu_item.url else None`
+
+* `sort`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `sub_menu`
+    Type: `Dict`
+
+
+* `tag`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+
+* `url`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+    Default: `lambda menu_item, **_: (       '/' + path_join(getattr(menu_item.iommi_parent(), 'url', None), menu_item.iommi_name()) + '/'     )`
+
+Methods
+-------
+
+`on_bind`
+^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    """
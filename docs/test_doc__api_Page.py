@@ -0,0 +1,113 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Page
+====
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+A page is used to compose iommi parts into a bigger whole.
+
+See the `howto <https://docs.iommi.rocks/en/latest/cookbook_parts_pages.html#parts-pages>`_ for example usages.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `context`       (:ref:`evaluated <evaluate>`)
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `h_tag`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[iommi.fragment.Fragment, str]`
+
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `member_class`
+    Type: `Type[iommi.fragment.Fragment]`
+
+
+* `parts`
+    Type: `Dict[str, Union[iommi.part.Part, str, iommi._web_compat.Template]]`
+
+
+* `title`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+
+Methods
+-------
+
+`as_view`
+^^^^^^^^^
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    """
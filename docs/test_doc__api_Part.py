@@ -0,0 +1,110 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Part
+====
+
+Base class: :doc:`Traversable`
+
+"""
+def test_base():
+    # language=rst
+    """
+`Part` is the base class for parts of a page that can be rendered as html, and can respond to ajax and post.
+
+See the `howto <https://docs.iommi.rocks/en/latest/cookbook_parts_pages.html#parts-pages>`_ for example usages.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+    Default: `True`
+
+* `iommi_style`
+    Type: `str`
+
+
+Methods
+-------
+
+`bind`
+^^^^^^
+
+`iommi_collected_assets`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`perform_dispatch`
+^^^^^^^^^^^^^^^^^^
+
+`render_to_response`
+^^^^^^^^^^^^^^^^^^^^
+
+`render_to_streaming_response`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+
+Like `render_to_response`, but the rows of the tables in the part are
+streamed to the client in chunks, after the rest of the page. See
+`stream_root`.
+
+
+
+    """
@@ -0,0 +1,170 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Query
+=====
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+Declare a query language. Example:
+
+    """
+
+    class AlbumQuery(Query):
+        year = Filter.integer()
+        name = Filter()
+
+    query_set = Album.objects.filter(
+        AlbumQuery().bind(request=request).get_q()
+    )
+    # language=rst
+    """
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `advanced`
+    Type: `Namespace`
+
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `auto`
+    Type: `Namespace`
+
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `filter`
+
+* `filters`
+    Type: `Namespace`
+
+
+* `form`
+    Type: `Namespace`
+
+
+* `form_class`
+
+* `form_container`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Fragment`
+
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `member_class`
+
+* `model`       (:ref:`evaluated <evaluate>`)
+    Type: `Type[django.db.models.base.Model]`
+
+
+* `postprocess`
+
+* `rows`
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+
+Methods
+-------
+
+`get_advanced_query_param`
+^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`get_q`
+^^^^^^^
+
+
+
+Create a query set based on the data in the request.
+
+
+
+`get_query_string`
+^^^^^^^^^^^^^^^^^^
+
+
+
+Based on the data in the request, return the equivalent query string that you can use with parse_query_string() to create a query set.
+
+
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`parse_query_string`
+^^^^^^^^^^^^^^^^^^^^
+
+Class methods
+-------------
+
+`filters_from_model`
+^^^^^^^^^^^^^^^^^^^^
+
+    """
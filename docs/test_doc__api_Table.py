@@ -0,0 +1,387 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req, show_output
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+    
+Table
+=====
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+Describe a table. Example:
+
+    """
+
+    class AlbumTable(Table):
+        name = Column()
+        artist = Column()
+
+        class Meta:
+            sortable = False
+
+    # @test
+    artist = Artist.objects.create(name='Black Sabbath')
+    Album.objects.create(name='Heaven & Hell', artist=artist, year=1980),
+    Album.objects.create(name='Mob Rules', artist=artist, year=1981),
+
+    show_output(AlbumTable(rows=Album.objects.all()))
+    # @end
+    # language=rst
+    """
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+* `action_class`
+    Type: `Type[iommi.action.Action]`
+
+
+* `actions`
+    Type: `Dict[str, iommi.action.Action]`
+
+
+* `actions_below`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+    Default: `False`
+
+* `actions_template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+    Default: `iommi/form/actions.html`
+
+* `after`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[int, str]`
+
+
+* `assets`
+    Type: `Namespace`
+
+
+* `attrs`       (:ref:`evaluated <evaluate>`)
+    dict of strings to string/callable of HTML attributes to apply to the table
+
+    Type: :doc:`Attrs`
+
+
+* `auto`
+
+* `auto_data_retrieval`
+    use `select_related` for the foreign keys and `prefetch_related` for the reverse and many to many relations in the `attr` paths of the columns. Default: `True`
+
+    Type: `bool`
+
+    Default: `True`
+
+* `bulk`       (:ref:`evaluated <evaluate>`)
+    Type: `Optional[iommi.form.Form]`
+
+
+* `bulk_container`
+    Type: :doc:`Fragment`
+
+
+* `bulk_exclude`       (:ref:`evaluated <evaluate>`)
+    exclude filters to apply to the `QuerySet` before performing the bulk operation
+
+    Type: `Namespace`
+
+    Default: `{}`
+
+* `bulk_filter`       (:ref:`evaluated <evaluate>`)
+    filters to apply to the `QuerySet` before performing the bulk operation
+
+    Type: `Namespace`
+
+    Default: `{}`
+
+* `cell`       (:ref:`evaluated <evaluate>`)
+    Type: `CellConfig`
+
+
+* `cells_class`
+    Type: `Type[iommi.table.Cells]`
+
+
+* `columns`
+    (use this only when not using the declarative style) a list of Column objects
+
+    Type: `Dict[str, iommi.table.Column]`
+
+
+* `container`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Fragment`
+
+
+* `default_sort_order`
+
+* `empty_message`
+    Type: `str`
+
+
+* `endpoints`
+    Type: `Namespace`
+
+
+* `extra`
+    Type: `Dict[str, Any]`
+
+
+* `extra_evaluated`
+    Type: `Dict[str, Any]`
+
+
+* `extra_params`
+
+* `form_class`
+    Type: `Type[iommi.form.Form]`
+
+
+* `h_tag`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[iommi.fragment.Fragment, str]`
+
+
+* `header`
+
+* `include`       (:ref:`evaluated <evaluate>`)
+    Type: `bool`
+
+
+* `invalid_form_message`
+    Type: `str`
+
+
+* `iommi_style`
+    Type: `str`
+
+
+* `member_class`
+
+* `model`       (:ref:`evaluated <evaluate>`)
+    Type: `Type[django.db.models.base.Model]`
+
+
+* `only_needed_fields`
+    set to `True` to only load the fields of the model that the columns use, via `QuerySet.only()`. If callbacks like `cell__url` use other fields, pass a list of those field paths instead of `True`. This is skipped if a column has an `attr` that isn't a model field path or a custom `cell__value`.
+
+    Default: `False`
+
+* `outer`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Fragment`
+
+
+* `page_class`
+    Type: `Type[iommi.page.Page]`
+
+
+* `page_size`       (:ref:`evaluated <evaluate>`)
+    Type: `int`
+
+    Default: `16`
+
+* `parts`
+    Type: `Namespace`
+
+
+* `post_bulk_edit`
+
+* `preprocess_row`
+
+* `preprocess_rows`
+
+* `query`
+
+* `query_class`
+    Type: `Type[iommi.query.Query]`
+
+
+* `query_from_indexes`
+    Type: `bool`
+
+
+* `row`       (:ref:`evaluated <evaluate>`)
+    Type: `RowConfig`
+
+
+* `row_group_class`
+    Type: `Type[iommi.table.RowGroup]`
+
+
+* `rows`       (:ref:`evaluated <evaluate>`)
+    a list or QuerySet of objects
+
+
+* `sortable`       (:ref:`evaluated <evaluate>`)
+    set this to `False` to turn off sorting for all columns
+
+    Type: `bool`
+
+    Default: `True`
+
+* `sorter`
+
+* `stream_chunk_size`
+    the number of rows per chunk when the table is rendered with `render_to_streaming_response`. This is also the chunk size used for `QuerySet.iterator()`.
+
+    Type: `int`
+
+    Default: `1000`
+
+* `superheader`
+    Type: `Namespace`
+
+
+* `table_tag_wrapper`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Fragment`
+
+
+* `tag`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+    Default: `table`
+
+* `tbody`       (:ref:`evaluated <evaluate>`)
+    Type: :doc:`Fragment`
+
+
+* `template`       (:ref:`evaluated <evaluate>`)
+    Type: `Union[str, iommi._web_compat.Template]`
+
+    Default: `iommi/table/table.html`
+
+* `title`       (:ref:`evaluated <evaluate>`)
+    Type: `str`
+
+
+Shortcuts
+---------
+
+`div`
+^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+* `tbody__tag`
+    * `div`
+* `cell__tag`
+    * `None`
+* `row__tag`
+    * `div`
+* `header__template`
+    * `None`
+
+Methods
+-------
+
+`as_view`
+^^^^^^^^^
+
+`bulk_queryset`
+^^^^^^^^^^^^^^^
+
+
+Return the queryset that contains only the selected rows with
+        bulk_filter and bulk_exclude applied.
+
+        For use in post_handlers. Only valid when rows was a queryset.
+
+
+
+`cells_for_row`
+^^^^^^^^^^^^^^^
+
+
+Create a bound Cells instance for a row.
+
+        The row config is refined once per bound table into a template that is then bound once per row.
+
+
+`cells_for_rows`
+^^^^^^^^^^^^^^^^
+
+
+Yield a Cells instance for each visible row on the screen.
+
+        If `iterator_chunk_size` is given, a `QuerySet` that hasn't been evaluated
+        yet is iterated with `QuerySet.iterator()` so the rows are not cached.
+
+
+`compiled_row_fragment_is_plain`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+Rows can be rendered without a `Fragment` if the style doesn't configure `Fragment`.
+
+
+`get_compiled_cell`
+^^^^^^^^^^^^^^^^^^^
+
+
+Get the compiled cell config of a column. `cells` is used to create the first cell if needed.
+
+
+`get_visible_rows`
+^^^^^^^^^^^^^^^^^^
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`selection`
+^^^^^^^^^^^
+
+
+Return the selected rows.
+
+        For use in post_handlers. It's a queryset if rows is a queryset and a list otherwise.
+        Unlike bulk_queryset neither bulk_filter nor bulk_exclude are applied.
+
+
+
+Class methods
+-------------
+
+`columns_from_model`
+^^^^^^^^^^^^^^^^^^^^
+
+    """
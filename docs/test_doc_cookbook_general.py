@@ -1,3 +1,5 @@
+from docs.models import *
+from iommi import *
 from tests.helpers import req
 
 request = req('get')
@@ -75,3 +77,74 @@ def test_how_do_i_find_the_path_to_a_parameter():
     """
     # @test
     assert True  # Until I come up with a nice way to test this
+
+
+# noinspection PyUnusedLocal
+def test_how_do_i_turn_off_debug_checks_in_production():
+    # language=rst
+    """
+    How do I turn off the debug checks in production?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    In debug mode iommi records where each part was declared, and checks the
+    debug settings every time it renders attributes. To skip this work in
+    production put this in your settings:
+
+
+    """
+    IOMMI_PRODUCTION_MODE = True
+
+    # language=rst
+    """
+    With production mode on, `IOMMI_DEBUG` is off regardless of `DEBUG`, and
+    the settings are read once instead of on every use. Error reports still
+    point to the line that declared the part.
+
+    """
+    # @test
+    from django.test import override_settings
+
+    with override_settings(IOMMI_DEBUG=True, IOMMI_PRODUCTION_MODE=True):
+        page = Page(parts__header=html.h1('Hello'))
+        assert 'data-iommi-path' not in page.bind(request=request).__html__()
+        assert page._instantiated_at_info[0] == __file__
+
+    with override_settings(IOMMI_DEBUG=True):
+        assert 'data-iommi-path' in Page(parts__header=html.h1('Hello')).bind(request=request).__html__()
+
+
+# noinspection PyUnusedLocal
+def test_how_do_i_reuse_declarations_between_requests():
+    # language=rst
+    """
+    How do I reuse declarations between requests?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A view that returns a new declaration on every request, like
+    `Table(auto__model=Album)`, pays for resolving the style and creating the
+    columns from the model every time. With the `intern_declarations`
+    decorator, iommi keeps a shared, fully set up copy of the declaration and
+    only binds it for each request:
+
+
+    """
+    @intern_declarations
+    def albums(request):
+        return Table(auto__model=Album, columns__name__filter__include=True)
+
+    # language=rst
+    """
+    Declarations are compared by their config. Functions are compared by their
+    code and the values they use from the enclosing scope, so a lambda in
+    the view matches the same lambda from the previous request. Objects that
+    can't be compared by value, like model instances, are compared by identity.
+
+    To do this for all views rendered by the iommi middleware, set
+    `IOMMI_INTERN_DECLARATIONS = True` in your settings. The number of cached
+    declarations is set with `IOMMI_DECLARATION_CACHE_SIZE` (default 100), and
+    `iommi.declaration_cache.declaration_cache_info()` returns the hit and miss
+    counts.
+
+    """
+    # @test
+    assert albums(request).is_refine_done
@@ -58,3 +58,67 @@ def test_how_do_i_control_what_q_is_produced():
     `Q` object. The default handles `__`, different operators, negation
     and special handling of when the user searches for `null`.
     """
+
+
+def test_how_do_i_filter_a_table_of_python_objects():
+    # language=rst
+    """
+    How do I filter a table of python objects?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    If the rows of a table are a list, the `Q` object from the query is
+    evaluated in python instead of in the database. The lookups produced by
+    the query language (`exact`, `iexact`, `contains`, `icontains`, `gt`,
+    `gte`, `lt`, `lte`, `in` and `isnull`) are supported.
+
+    For big lists that you keep around between requests, like cached report
+    data, wrap them in `IndexedRows`. Equality and range filters then use hash
+    and sorted indexes that are built the first time they are needed.
+    """
+
+    from iommi.query_in_memory import IndexedRows
+    from iommi.struct import Struct
+
+    report = IndexedRows([
+        Struct(name='Black Sabbath', plays=1200),
+        Struct(name='Ozzy Osbourne', plays=800),
+        Struct(name='Dio', plays=400),
+    ])
+
+    table = Table(
+        columns__name=Column(filter__include=True),
+        columns__plays=Column.number(filter__include=True),
+        rows=report,
+    )
+
+    # @test
+    t = table.bind(request=req('get', **{'-query/query': 'plays>500'}))
+    assert [x.name for x in t.sorted_and_filtered_rows] == ['Black Sabbath', 'Ozzy Osbourne']
+    # @end
+
+
+def test_how_do_i_tune_the_parsing_of_queries():
+    # language=rst
+    """
+    How do I tune the parsing of queries?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The grammar of the query language is built once per `Query` class, and
+    parsed query strings are kept in a cache, so a popular filter URL is only
+    parsed once. The number of cached query strings is set with
+    `IOMMI_QUERY_CACHE_SIZE` (default 500), and
+    `iommi.query.query_cache_info()` returns the hit and miss counts.
+
+    For long and deeply nested queries you can turn on packrat parsing with
+    `IOMMI_QUERY_PACKRAT_PARSING = True`. Note that pyparsing only has a global
+    switch for this, so it is turned on for all pyparsing grammars in the
+    process.
+    """
+
+    # @test
+    from iommi.query import query_cache_info
+
+    t = Table(auto__model=Album, columns__name__filter__include=True)
+    t.bind(request=req('get', **{'-query/query': 'name="foo"'})).sorted_and_filtered_rows
+    assert query_cache_info()['currsize'] >= 1
+    # @end
@@ -920,3 +920,165 @@ def test_insert_arbitrary_html(big_discography):
 
     show_output(t)
     # @end
+
+
+def test_how_do_i_stream_a_big_table(big_discography):
+    # language=rst
+    """
+    How do I stream a big table?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    For tables without pagination with many rows you can stream the response
+    with `render_to_streaming_response`. The page is sent first, and the rows
+    follow in chunks of `stream_chunk_size` rows. If the rows are a `QuerySet`
+    it is iterated with `QuerySet.iterator()`, so the rows are not kept in
+    memory.
+    """
+
+    def albums(request):
+        table = Table(
+            auto__model=Album,
+            page_size=None,
+            stream_chunk_size=500,
+        )
+        return table.bind(request=request).render_to_streaming_response()
+
+    # @test
+    response = albums(req('get'))
+    assert 'Heaven &amp; Hell' in b''.join(response.streaming_content).decode()
+    # @end
+
+
+def test_how_do_i_paginate_a_big_table_without_offset(big_discography):
+    # language=rst
+    """
+    How do I paginate a big table without OFFSET?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The default pagination slices the rows with OFFSET, which gets slow for
+    deep pages since the database has to skip all earlier rows. With keyset
+    pagination the paginator instead seeks past the last row of the
+    previous page, using the sort order of the table plus the primary key
+    as a tie-breaker. The position is encoded in the page URL parameter,
+    and only previous/next links are shown since the rows are never counted.
+
+    If the rows can't be paginated by keyset, for example when sorting on
+    something that isn't a non-nullable model field, the paginator falls
+    back to the normal pagination.
+    """
+
+    from iommi.table import PaginationMethods
+
+    table = Table(
+        auto__model=Track,
+        page_size=5,
+        parts__page__method=PaginationMethods.keyset,
+    )
+
+    # @test
+    t = table.bind(request=req('get'))
+    assert t.paginator.context['has_next']
+    t = table.bind(request=req('get', page=t.paginator.context['next']))
+    assert len(t.get_visible_rows()) == 5
+    assert t.paginator.context['has_previous']
+    show_output(t)
+    # @end
+
+
+def test_how_do_i_paginate_without_counting_the_rows(big_discography):
+    # language=rst
+    """
+    How do I paginate without counting the rows?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Counting the rows for the paginator can be as expensive as fetching the
+    page itself. With `PaginationMethods.count_free` the paginator fetches
+    one row more than the page size to know if there is a next page, and only
+    shows first/previous/next links. With `lazy_count` the total is fetched
+    from the `count` endpoint of the table after the page has loaded.
+    """
+
+    from iommi.table import PaginationMethods
+
+    table = Table(
+        auto__model=Track,
+        page_size=5,
+        parts__page__method=PaginationMethods.count_free,
+        parts__page__lazy_count=True,
+    )
+
+    # @test
+    t = table.bind(request=req('get', page='2'))
+    assert t.paginator.context['has_next']
+    assert 'data-endpoint="?/count"' in t.__html__()
+    show_output(t)
+    # @end
+
+
+def test_how_do_i_cache_the_row_count_of_a_table(big_discography):
+    # language=rst
+    """
+    How do I cache the row count of a table?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Use `cached_count` as the count of the paginator. The counts are cached in
+    the Django cache framework, keyed on the SQL of the filtered rows. For
+    tables that aren't filtered you can give an `estimate` hook, like
+    `postgresql_estimated_count`, to use the planner estimate of the database
+    instead. Estimated counts are marked as approximate with the `approximate`
+    variable in the paginator template. The estimate is only shown: the rows
+    of each page, and where the last page is, come from the rows themselves.
+    """
+
+    from iommi.table import (
+        cached_count,
+        postgresql_estimated_count,
+    )
+
+    table = Table(
+        auto__model=Track,
+        page_size=5,
+        parts__page__count=cached_count(
+            timeout=300,
+            estimate=postgresql_estimated_count,
+        ),
+    )
+
+    # @test
+    t = table.bind(request=req('get'))
+    assert t.paginator.count == Track.objects.count()
+    show_output(t)
+    # @end
+
+
+def test_how_do_i_load_the_data_for_a_column_once_per_page(small_discography):
+    # language=rst
+    """
+    How do I load the data for a column once per page?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A computed column that needs to look up data for each row with
+    `cell__value` results in one query per row. With `batch_loader` the
+    lookup is done once for all the rows of the page. It gets the rows and
+    returns a dict from `pk` to the value of the cell:
+    """
+
+    from django.db.models import Count
+
+    def number_of_albums(rows, **_):
+        return dict(
+            Artist.objects.filter(pk__in=[x.pk for x in rows])
+            .annotate(n=Count('albums'))
+            .values_list('pk', 'n')
+        )
+
+    table = Table(
+        auto__model=Artist,
+        columns__albums=Column.number(batch_loader=number_of_albums),
+    )
+
+    # @test
+    t = table.bind(request=req('get'))
+    assert [cells['albums'].value for cells in t.cells_for_rows()] == [2]
+    show_output(t)
+    # @end
@@ -8,9 +8,14 @@
     register_factory,
     setup_db_compat,
 )
+from iommi._web_compat import settings
 from iommi.action import Action
 from iommi.asset import Asset
 from iommi.base import MISSING
+from iommi.declaration_cache import (
+    intern_declaration,
+    intern_declarations,
+)
 from iommi.edit_table import (
     EditColumn,
     EditTable,
@@ -60,10 +65,14 @@ def render_if_needed(request, response):
     if isinstance(response, Part):
         try:
             if not response._is_bound:
+                if getattr(settings, 'IOMMI_INTERN_DECLARATIONS', False):
+                    response = intern_declaration(response)
                 response = response.bind(request=request)
             return response.render_to_response()
         except Exception as e:
-            filename, lineno = response._instantiated_at_info
+            from iommi.debug import filename_and_line_num_from_part
+
+            filename, lineno = filename_and_line_num_from_part(response)
             from iommi.synthetic_traceback import SyntheticException
 
             fake = SyntheticException(
@@ -132,6 +141,7 @@ def inner(request, *args, **kwargs):
     'Style',
     'html',
     'iommi_render',
+    'intern_declarations',
 ]
 
 if django.VERSION[:2] < (3, 2):
@@ -1,3 +1,7 @@
+import threading
+from collections import OrderedDict
+
+from django.core.signals import setting_changed
 from django.template.utils import InvalidTemplateEngineError
 
 from django.core.exceptions import (
@@ -6,6 +10,7 @@
 )
 from django.core.validators import validate_email, URLValidator
 from django.http import HttpResponse
+from django.http import StreamingHttpResponse  # noqa: F401
 from django.http import QueryDict  # noqa: F401
 from django.template import RequestContext
 from django.template.loader import render_to_string
@@ -43,16 +48,78 @@
 except ImproperlyConfigured:
     pass
 
+DEFAULT_TEMPLATE_CACHE_SIZE = 500
+
+_compiled_templates = OrderedDict()
+_compiled_templates_lock = threading.Lock()
+_compiled_templates_stats = dict(hits=0, misses=0)
+
+
+def get_compiled_template(template_string, engine='django'):
+    """
+    Compile a template from a string, or get it from the cache of compiled
+    templates. `engine` is `'django'` or `'jinja2'` for a template of that
+    template language, or `'from_string'` for a template from the default
+    template backend.
+    """
+    key = (engine, template_string)
+    with _compiled_templates_lock:
+        template = _compiled_templates.get(key)
+        if template is not None:
+            _compiled_templates.move_to_end(key)
+            _compiled_templates_stats['hits'] += 1
+            return template
+
+    if engine == 'django':
+        template = DjangoTemplate(template_string)
+    elif engine == 'jinja2':
+        template = JinjaTemplate(template_string)
+    else:
+        assert engine == 'from_string', f'Unknown template engine {engine}'
+        template = get_template_from_string(template_string)
+
+    maxsize = getattr(settings, 'IOMMI_TEMPLATE_CACHE_SIZE', DEFAULT_TEMPLATE_CACHE_SIZE)
+    with _compiled_templates_lock:
+        _compiled_templates_stats['misses'] += 1
+        _compiled_templates[key] = template
+        while len(_compiled_templates) > maxsize:
+            _compiled_templates.popitem(last=False)
+    return template
+
+
+def template_cache_info():
+    with _compiled_templates_lock:
+        return dict(
+            **_compiled_templates_stats,
+            maxsize=getattr(settings, 'IOMMI_TEMPLATE_CACHE_SIZE', DEFAULT_TEMPLATE_CACHE_SIZE),
+            currsize=len(_compiled_templates),
+        )
+
+
+def clear_template_cache(**_):
+    with _compiled_templates_lock:
+        _compiled_templates.clear()
+        _compiled_templates_stats.update(hits=0, misses=0)
+
+
+def _clear_template_cache_on_setting_changed(setting, **_):
+    if setting in ('TEMPLATES', 'INSTALLED_APPS'):
+        clear_template_cache()
+
+
+setting_changed.connect(_clear_template_cache_on_setting_changed)
+
+
 class Template:
     def __init__(self, template_string):
         self.s = template_string
 
     def render(self, context):
         if DjangoTemplate is not None:
-            return DjangoTemplate(self.s).render(context=context)
+            return get_compiled_template(self.s).render(context=context)
         else:
             assert JinjaTemplate is not None
-            return JinjaTemplate(self.s).render(**context.flatten())
+            return get_compiled_template(self.s, engine='jinja2').render(**context.flatten())
 
 template_types = template_types + (Template,)
 
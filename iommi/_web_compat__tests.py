@@ -1,9 +1,16 @@
-from django.template import RequestContext
+from django.template import (
+    Context,
+    RequestContext,
+)
+from django.test import override_settings
 
 from iommi._web_compat import (
+    clear_template_cache,
     format_html,
+    get_compiled_template,
     render_template,
     Template,
+    template_cache_info,
 )
 from iommi.form import (
     Field,
@@ -105,3 +112,17 @@ def test_format_html7():
 def test_render_template():
     actual = render_template(req('get'), Template('{{foo}}'), dict(foo=1))
     assert type(actual) == SafeText
+
+
+def test_compiled_template_cache():
+    clear_template_cache()
+    assert Template('{{ foo }}!').render(Context(dict(foo=1))) == '1!'
+    assert Template('{{ foo }}!').render(Context(dict(foo=2))) == '2!'
+    assert get_compiled_template('{{ foo }}!') is get_compiled_template('{{ foo }}!')
+
+    info = template_cache_info()
+    assert (info['hits'], info['misses'], info['currsize']) == (3, 1, 1)
+
+    with override_settings(IOMMI_TEMPLATE_CACHE_SIZE=1):
+        get_compiled_template('{{ bar }}')
+        assert template_cache_info()['currsize'] == 1
@@ -1,16 +1,19 @@
 from iommi.declarative.namespace import Namespace
 
 from iommi._web_compat import mark_safe
-from iommi.base import items
+from iommi.base import (
+    iommi_debug_on,
+    items,
+    values,
+)
 from iommi.evaluate import (
     evaluate_as_needed,
     evaluate_strict,
+    is_callable,
 )
 
 
 def evaluate_attrs(obj, **kwargs):
-    from iommi.debug import iommi_debug_on
-
     attrs = obj.attrs or {}
 
     if not attrs and not iommi_debug_on():  # pragma: no mutate
@@ -38,7 +41,7 @@ def evaluate_attrs(obj, **kwargs):
 
         field__style={'background-color': 'blue'}"""
 
-    return Attrs(
+    result = Attrs(
         _parent=obj,
         **{
             **{
@@ -48,6 +51,22 @@ def evaluate_attrs(obj, **kwargs):
             **evaluate_as_needed(attrs, kwargs, ignore=('class', 'style')),
         },
     )
+    result.set_render_cache(attrs_render_cache(attrs))
+    return result
+
+
+def attrs_are_static(attrs):
+    """
+    Check if an attrs namespace contains no callables, so that evaluating it gives the same result every time.
+    """
+    if not attrs:
+        return True
+    for k, v in items(attrs):
+        if is_callable(v):
+            return False
+        if k in ('class', 'style') and isinstance(v, dict) and any(is_callable(x) for x in values(v)):
+            return False
+    return True
 
 
 def render_attrs(attrs):
@@ -94,6 +113,93 @@ def parts():
     return '' if r == ' ' else r
 
 
+class AttrsRenderCache:
+    """
+    Internal class that remembers how the attrs evaluated from one attrs
+    declaration were rendered. The attrs of a declaration are mostly static,
+    or only vary between a few values (like an `odd` class on every other
+    row), so the same html is rendered over and over.
+
+    The html is looked up on the evaluated values, so changing the attrs after
+    they were evaluated gives the correct html. Only attrs with str, bool, int
+    and None values are cached. Declarations with attrs that are unique for
+    every evaluation stop being cached.
+    """
+
+    max_size = 100
+
+    def __init__(self):
+        self.rendered = {}
+        self.hits = 0
+        self.misses = 0
+        self.enabled = True
+
+    def render(self, attrs):
+        if not self.enabled:
+            return render_attrs(attrs)
+
+        key = attrs_render_key(attrs)
+        if key is None:
+            return render_attrs(attrs)
+        result = self.rendered.get(key)
+
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = render_attrs(attrs)
+        if len(self.rendered) < self.max_size:
+            self.rendered[key] = result
+        elif self.misses > 2 * self.max_size and self.misses > self.hits:
+            self.enabled = False
+            self.rendered = {}
+        return result
+
+
+# Values of these types are equal only if they render the same, as long as the
+# type is part of the key: True and 1 are equal, but render differently. This is
+# not true for other types, like Decimal('1.0') and Decimal('1.00'), or datetimes
+# in different timezones.
+_render_key_types = {str, bool, int, type(None)}
+
+
+def attrs_render_key(attrs):
+    """
+    A key for evaluated attrs that is equal for attrs that render the same, or
+    `None` if the attrs have values that can't be part of the key.
+    """
+    key = []
+    for k, v in dict.items(attrs):
+        if type(v) is dict:
+            key.append(k)
+            for name, x in dict.items(v):
+                if type(x) not in _render_key_types:
+                    return None
+                key += (name, type(x), x)
+            key.append(None)
+        elif type(v) in _render_key_types:
+            key += (k, type(v), v)
+        else:
+            return None
+    return tuple(key)
+
+
+def attrs_render_cache(attrs):
+    """
+    The render cache for the attrs evaluated from the attrs declaration `attrs`,
+    or `None` if it can't hold one.
+    """
+    if not isinstance(attrs, Namespace):
+        return None
+    try:
+        return object.__getattribute__(attrs, '_render_cache')
+    except AttributeError:
+        render_cache = AttrsRenderCache()
+        object.__setattr__(attrs, '_render_cache', render_cache)
+        return render_cache
+
+
 class Attrs(Namespace):
     # language=rst
     """
@@ -150,22 +256,41 @@ class Attrs(Namespace):
     """
 
     def __init__(self, _parent, **attrs):
-        from iommi.debug import iommi_debug_on
-
         if iommi_debug_on() and getattr(_parent, '_name', None) is not None:
             attrs['data-iommi-path'] = _parent.iommi_dunder_path
             attrs['data-iommi-type'] = type(_parent).__name__
 
         super(Attrs, self).__init__(attrs)
 
+    def set_render_cache(self, render_cache):
+        object.__setattr__(self, '_iommi_render_cache', render_cache)
+
     def __str__(self):
         return self.__html__()
 
     # noinspection PyUnusedLocal
     def __html__(self):
+        render_cache = self.__dict__.get('_iommi_render_cache')
+        if render_cache is not None:
+            return render_cache.render(self)
         return render_attrs(self)
 
 
+def copy_attrs(attrs):
+    """
+    A shallow copy of evaluated attrs, with its own `class` and `style` dicts,
+    that renders with the same render cache.
+    """
+    result = Attrs.__new__(Attrs)
+    dict.update(result, attrs)
+    for k in ('class', 'style'):
+        v = dict.get(attrs, k)
+        if type(v) is dict:
+            dict.__setitem__(result, k, dict(v))
+    result.set_render_cache(attrs.__dict__.get('_iommi_render_cache'))
+    return result
+
+
 def render_class(class_dict):
     return ' '.join(sorted(name for name, flag in items(class_dict) if flag))
 
@@ -1,4 +1,10 @@
 import itertools
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from decimal import Decimal
 from unittest import mock
 
 import pytest
@@ -6,6 +12,8 @@
 
 from iommi import Fragment
 from iommi.attrs import (
+    attrs_render_cache,
+    AttrsRenderCache,
     evaluate_attrs,
     render_attrs,
 )
@@ -359,3 +367,55 @@ def side_effect(func_or_value, __signature=None, __match_empty=True, **kwargs):
         == ' apple="red" banana="orange" class="bar foo" style="fie: foe; fum: bink"'
     )
     assert next(counter) == 3
+
+
+def test_render_cache():
+    values = {}
+    declaration = Fragment(
+        attrs__class__odd=lambda **_: values['odd'],
+        attrs__checked=lambda **_: values['checked'],
+    ).refine_done()
+
+    def render(**kwargs):
+        values.update(kwargs)
+        return str(declaration.bind().attrs)
+
+    assert render(odd=True, checked=True) == ' checked class="odd"'
+    assert render(odd=False, checked=True) == ' checked'
+    # True and 1 are equal, but do not render the same
+    assert render(odd=True, checked=1) == ' checked="1" class="odd"'
+    assert render(odd=True, checked=True) == ' checked class="odd"'
+
+    render_cache = attrs_render_cache(declaration.attrs)
+    assert (render_cache.hits, render_cache.misses) == (1, 3)
+
+    # Changing the attrs after evaluation changes the html
+    attrs = declaration.bind().attrs
+    attrs['class']['foo'] = True
+    attrs.title = 'bar'
+    assert str(attrs) == ' checked class="foo odd" title="bar"'
+
+
+def test_render_cache_equal_values_that_render_differently():
+    render_cache = AttrsRenderCache()
+    assert render_cache.render(dict(value=Decimal('1.0'))) == ' value="1.0"'
+    assert render_cache.render(dict(value=Decimal('1.00'))) == ' value="1.00"'
+
+    utc = datetime(2020, 1, 1, 12, tzinfo=timezone.utc)
+    plus_one = utc.astimezone(timezone(timedelta(hours=1)))
+    assert utc == plus_one
+    assert render_cache.render(dict(value=utc)) == ' value="2020-01-01 12:00:00+00:00"'
+    assert render_cache.render(dict(value=plus_one)) == ' value="2020-01-01 13:00:00+01:00"'
+
+    assert render_cache.render(dict(value=0.0)) == ' value="0.0"'
+    assert render_cache.render(dict(value=-0.0)) == ' value="-0.0"'
+
+    assert render_cache.rendered == {}
+
+
+def test_render_cache_is_disabled_for_unique_attrs():
+    render_cache = AttrsRenderCache()
+    for i in range(3 * AttrsRenderCache.max_size):
+        assert render_cache.render(dict(id=i)) == f' id="{i}"'
+    assert not render_cache.enabled
+    assert render_cache.rendered == {}
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.db.models import QuerySet
 from django.utils.encoding import force_str
 from django.utils.safestring import SafeText
@@ -26,6 +27,35 @@ def __repr__(self):
 MISSING = Missing()
 
 
+_production_mode = None
+
+
+def iommi_production_mode():
+    """
+    With `settings.IOMMI_PRODUCTION_MODE` on, the debug checks are resolved
+    once instead of on every use, and debug mode is off.
+    """
+    global _production_mode
+    if _production_mode is None:
+        _production_mode = bool(getattr(settings, 'IOMMI_PRODUCTION_MODE', False))
+    return _production_mode
+
+
+def iommi_debug_on():
+    if _production_mode or (_production_mode is None and iommi_production_mode()):
+        return False
+    return getattr(settings, 'IOMMI_DEBUG', settings.DEBUG)
+
+
+def _reset_production_mode(setting, **_):
+    global _production_mode
+    if setting == 'IOMMI_PRODUCTION_MODE':
+        _production_mode = None
+
+
+setting_changed.connect(_reset_production_mode)
+
+
 def model_and_rows(model, rows):
     if rows is None and model is not None:
         rows = model.objects.all()
@@ -20,6 +20,8 @@
     capitalize,
     get_display_name,
     get_wrapped_view,
+    iommi_debug_on,
+    iommi_production_mode,
     model_and_rows,
     UnknownMissingValueException,
 )
@@ -142,6 +144,20 @@ def test_refine_done_optimization(optimize):
             assert not view.__iommi_target__.is_refine_done
 
 
+def test_production_mode():
+    with override_settings(IOMMI_DEBUG=True):
+        assert not iommi_production_mode()
+        assert iommi_debug_on()
+        assert Page()._instantiated_at_info[0] == __file__
+
+        with override_settings(IOMMI_PRODUCTION_MODE=True):
+            assert iommi_production_mode()
+            assert not iommi_debug_on()
+            assert Page()._instantiated_at_info[0] == __file__
+
+        assert not iommi_production_mode()
+
+
 def test_not_bound_yet_error():
     with pytest.raises(AssertionError) as e:
         Page().iommi_dunder_path
@@ -14,6 +14,7 @@
     mark_safe,
     Template,
 )
+from iommi.base import iommi_debug_on  # noqa: F401
 from iommi.base import items
 from iommi.member import (
     MemberBinder,
@@ -27,10 +28,6 @@
 from ._web_compat import settings
 
 
-def iommi_debug_on():
-    return getattr(settings, 'IOMMI_DEBUG', settings.DEBUG)
-
-
 def dunder_path__format(row, **_):
     if row.dunder_path is None:
         return ''
@@ -195,20 +192,33 @@ def should_ignore_frame(frame, env_paths):
     return False
 
 
-def get_instantiated_at_info(frame):
-    import os
+# Whether frames running a code object should be skipped, by the id of the
+# code. The answer only depends on the code and its module, so it's worked out
+# once. The code is kept in the value, so the id can't be reused.
+_ignored_code = {}
 
-    env_paths = {dirname(os.__file__), dirname(dirname(sys.executable))}
+
+def get_instantiated_at_info(frame):
+    env_paths = None
 
     for _ in range(100):
         frame = frame.f_back
         if frame is None:
             break
 
-        if should_ignore_frame(frame, env_paths):
+        code = frame.f_code
+        entry = _ignored_code.get(id(code))
+        if entry is None:
+            if env_paths is None:
+                import os
+
+                env_paths = {dirname(os.__file__), dirname(dirname(sys.executable))}
+            entry = (code, should_ignore_frame(frame, env_paths))
+            _ignored_code[id(code)] = entry
+        if entry[1]:
             continue
 
-        return frame.f_code.co_filename, frame.f_lineno
+        return code.co_filename, frame.f_lineno
     return None, None
 
 
@@ -216,8 +226,12 @@ def filename_and_line_num_from_part(part):
     filename, line_num = getattr(part, '_instantiated_at_info', (None, None))
     if (filename, line_num) == (None, None) and isinstance(part, Traversable):
         # inspect.findsource() parses the full AST of the file, so beware the performance implications
-        filename = inspect.getsourcefile(part.__class__)
-        line_num = inspect.findsource(part.__class__)[1] + 1
+        try:
+            filename = inspect.getsourcefile(part.__class__)
+            line_num = inspect.findsource(part.__class__)[1] + 1
+        except (OSError, TypeError):
+            # No source for classes created dynamically, or in the REPL
+            filename, line_num = None, None
         setattr(part, '_instantiated_at_info', (filename, line_num))
     return filename, line_num
 
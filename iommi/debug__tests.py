@@ -143,6 +143,11 @@ def test_filename_and_line_num_from_part_empty_case():
     assert filename_and_line_num_from_part(part=Struct(_instantiated_at_info=('foo.py', 17))) == ('foo.py', 17)
 
 
+def test_filename_and_line_num_from_part_without_source():
+    part = type('DynamicPage', (Page,), {})(_collect_instantiated_at_info=False)
+    assert filename_and_line_num_from_part(part=part) == (None, None)
+
+
 def test_source_url_from_part(settings):
     settings.DEBUG = True
 
@@ -159,3 +164,22 @@ def test_source_url_from_part(settings):
 def test_get_instantiated_at_info_base_case():
     frame = Struct(f_back=None)
     assert get_instantiated_at_info(frame) == (None, None)
+
+
+def test_get_instantiated_at_info_skips_ignored_frames():
+    def frame(module_name, filename, f_back):
+        return Struct(
+            f_globals={'__name__': module_name},
+            f_code=compile('', filename, 'exec'),
+            f_lineno=17,
+            f_back=f_back,
+        )
+
+    user_frame = frame('my_app.views', 'my_app/views.py', f_back=None)
+    pydev_frame = frame('_pydev_bundle.pydev_monkey', 'pydev_monkey.py', f_back=user_frame)
+    admin_frame = frame('iommi.admin', 'admin.py', f_back=pydev_frame)
+    frame = Struct(f_back=admin_frame)
+
+    assert get_instantiated_at_info(frame) == ('my_app/views.py', 17)
+    # Again, with the answers for the code objects remembered
+    assert get_instantiated_at_info(frame) == ('my_app/views.py', 17)
@@ -0,0 +1,217 @@
+"""
+Cross-request reuse of refine_done'd declarations.
+
+A view like `def view(request): return Table(auto__model=Album)` builds the
+same declaration on every request, and `refine_done` (style resolution,
+creating the members from the model, sorting the members) is repeated every
+time. With the declaration cache, the declaration is identified by its
+config, and a shared refine_done'd template is bound for the request instead.
+
+Values in the config are compared like this:
+
+- strings, numbers, classes, `Template` objects and the like by value
+- dicts, lists, tuples and sets by their items
+- refinable objects, like columns, by their type and config
+- functions by their code, defaults and the values they close over, so a lambda
+  written inside the view matches the same lambda from the previous request
+- anything else by identity
+
+Declarations that contain objects that are made for the request, like
+querysets, requests, model instances, lazy objects (like `request.user`) and
+classes defined in the view, are not cached. They would never match the
+declaration of the next request, but would push out the entries that do.
+Values that contain themselves (like a recursive local function) are not
+cached either.
+
+Opt in for a view with the `intern_declarations` decorator, or for all views
+rendered by the iommi middleware and `iommi_render` with
+`settings.IOMMI_INTERN_DECLARATIONS = True`.
+"""
+import functools
+import threading
+import types
+from collections import OrderedDict
+from enum import Enum
+
+from django.db.models import (
+    Model,
+    QuerySet,
+)
+from django.utils.functional import LazyObject
+
+from iommi.struct import Struct
+
+from ._web_compat import (
+    HttpRequest,
+    settings,
+    Template,
+)
+
+DEFAULT_DECLARATION_CACHE_SIZE = 100
+
+_lock = threading.Lock()
+_cache = OrderedDict()
+_stats = Struct(hits=0, misses=0, uncachable=0)
+
+
+class _Uncachable(Exception):
+    pass
+
+
+class _Identity:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        # The key keeps a reference to the value, so the id can't be reused while the entry is cached
+        self.value = value
+
+    def __eq__(self, other):
+        return type(other) is _Identity and other.value is self.value
+
+    def __hash__(self):
+        return id(self.value)
+
+
+def _key(value, active):
+    from iommi.refinable import RefinableObject
+
+    if isinstance(value, LazyObject):
+        # Checked first, the other checks would evaluate it. Lazy objects, like request.user, are per request.
+        raise _Uncachable()
+    if value is None or isinstance(value, (str, int, bytes)):
+        return type(value), value
+    if isinstance(value, (float, complex)):
+        # 0.0 == -0.0, but they are not the same declaration
+        return type(value), repr(value)
+    if isinstance(value, type) and '<locals>' in value.__qualname__:
+        # A class defined in the view is a new class on every request
+        raise _Uncachable()
+    if isinstance(value, (type, Enum)):
+        return value
+    if isinstance(value, (QuerySet, HttpRequest, Model)):
+        # Built for the request, so an equal declaration on the next request would be keyed on a different object
+        raise _Uncachable()
+    if type(value) is Template:
+        return Template, value.s
+    if isinstance(value, RefinableObject) and value.is_refine_done:
+        return _Identity(value)
+
+    # Values that contain themselves, like a recursive local function, can't be keyed
+    if id(value) in active:
+        raise _Uncachable()
+    active.add(id(value))
+    try:
+        return _key_of_container(value, active)
+    finally:
+        active.discard(id(value))
+
+
+def _key_of_container(value, active):
+    from iommi.refinable import RefinableObject
+
+    if isinstance(value, RefinableObject):
+        return type(value), _key(value.iommi_namespace.as_stack(), active)
+    if isinstance(value, dict):
+        return type(value), tuple((k, _key(v, active)) for k, v in dict.items(value))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_key(v, active) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_key(v, active) for v in value)
+    if isinstance(value, types.FunctionType):
+        try:
+            closure = tuple(cell.cell_contents for cell in value.__closure__ or ())
+        except ValueError:
+            # Empty cell, the variable is not assigned yet
+            raise _Uncachable()
+        return (
+            type(value),
+            value.__code__,
+            _Identity(value.__globals__),
+            _key(value.__defaults__, active),
+            _key(value.__kwdefaults__, active),
+            _key(closure, active),
+        )
+    if isinstance(value, types.MethodType):
+        return type(value), _key(value.__func__, active), _key(value.__self__, active)
+    if isinstance(value, functools.partial):
+        return type(value), _key(value.func, active), _key(value.args, active), _key(value.keywords, active)
+    return _Identity(value)
+
+
+def declaration_key(part):
+    """
+    The key a declaration is cached on, or `None` if the declaration can't be cached.
+    """
+    try:
+        return _key(part, set())
+    except (_Uncachable, RecursionError):
+        return None
+
+
+def intern_declaration(part):
+    """
+    Return a refine_done'd declaration equivalent to `part`. If an equivalent
+    declaration was refine_done'd before, that one is returned.
+    """
+    if part.is_refine_done:
+        return part
+
+    key = declaration_key(part)
+    if key is None:
+        with _lock:
+            _stats.uncachable += 1
+        return part.refine_done()
+
+    with _lock:
+        template = _cache.get(key)
+        if template is not None:
+            _cache.move_to_end(key)
+            _stats.hits += 1
+            return template
+
+    template = part.refine_done()
+
+    maxsize = getattr(settings, 'IOMMI_DECLARATION_CACHE_SIZE', DEFAULT_DECLARATION_CACHE_SIZE)
+    with _lock:
+        _stats.misses += 1
+        _cache[key] = template
+        while len(_cache) > maxsize:
+            _cache.popitem(last=False)
+    return template
+
+
+def intern_declarations(view):
+    """
+    Decorator for views that return an iommi declaration. The declaration is
+    replaced by a shared refine_done'd template, that the iommi middleware or
+    `iommi_render` then binds for the request.
+    """
+    from iommi.part import Part
+
+    @functools.wraps(view)
+    def inner(request, *args, **kwargs):
+        result = view(request, *args, **kwargs)
+        if isinstance(result, Part) and not result._is_bound:
+            result = intern_declaration(result)
+        return result
+
+    return inner
+
+
+def declaration_cache_info():
+    with _lock:
+        return Struct(
+            hits=_stats.hits,
+            misses=_stats.misses,
+            uncachable=_stats.uncachable,
+            maxsize=getattr(settings, 'IOMMI_DECLARATION_CACHE_SIZE', DEFAULT_DECLARATION_CACHE_SIZE),
+            currsize=len(_cache),
+        )
+
+
+def clear_declaration_cache():
+    with _lock:
+        _cache.clear()
+        _stats.hits = 0
+        _stats.misses = 0
+        _stats.uncachable = 0
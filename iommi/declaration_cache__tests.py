@@ -0,0 +1,182 @@
+import pytest
+from django.test import override_settings
+from django.utils.functional import SimpleLazyObject
+
+from iommi import (
+    Column,
+    Form,
+    iommi_render,
+    Table,
+)
+from iommi._web_compat import Template
+from iommi.struct import Struct
+from iommi.declaration_cache import (
+    clear_declaration_cache,
+    declaration_cache_info,
+    declaration_key,
+    intern_declaration,
+    intern_declarations,
+)
+from tests.helpers import req
+from tests.models import TFoo
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_declaration_cache()
+    yield
+    clear_declaration_cache()
+
+
+def test_declaration_key():
+    def table(**kwargs):
+        return Table(
+            columns__a=Column(cell__format=lambda value, **_: value * 2),
+            columns__b__cell__value=lambda row, **_: row.b,
+            **kwargs,
+        )
+
+    assert declaration_key(table()) == declaration_key(table())
+    assert declaration_key(table(title='foo')) == declaration_key(table(title='foo'))
+    assert declaration_key(table(title='foo')) != declaration_key(table(title='bar'))
+    assert declaration_key(table(page_size=1)) != declaration_key(table(page_size=True))
+    assert declaration_key(table(page_size=1)) != declaration_key(table(page_size=1.0))
+    assert declaration_key(table(rows=[0.0])) == declaration_key(table(rows=[0.0]))
+    assert declaration_key(table(rows=[0.0])) != declaration_key(table(rows=[-0.0]))
+    assert declaration_key(table(rows=[0j])) != declaration_key(table(rows=[complex(0.0, -0.0)]))
+    assert declaration_key(table(rows=[1])) == declaration_key(table(rows=[1]))
+    assert declaration_key(table(rows=[1])) != declaration_key(table(rows=[2]))
+
+    def with_closure(x):
+        return table(columns__c__cell__value=lambda **_: x)
+
+    assert declaration_key(with_closure(1)) == declaration_key(with_closure(1))
+    assert declaration_key(with_closure(1)) != declaration_key(with_closure(2))
+
+    # Objects without a structural comparison are compared by identity
+    assert declaration_key(table(rows=object())) != declaration_key(table(rows=object()))
+
+
+def test_declaration_key_uncachable():
+    def f():
+        return x
+
+    t = Table(columns__a__cell__value=f)
+    assert declaration_key(t) is None
+    x = 1
+    assert declaration_key(t) is not None
+
+    intern_declaration(Table(columns__a__cell__value=lambda **_: y))
+    assert declaration_cache_info().uncachable == 1
+    y = 1
+
+
+def test_declaration_key_recursive():
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert declaration_key(Table(columns__a__cell__value=lambda row, **_: fib(row))) is None
+
+    rows = []
+    rows.append(rows)
+    assert declaration_key(Table(rows=rows)) is None
+
+    shared = [1]
+    assert declaration_key(Table(rows=[shared, shared])) is not None
+
+
+@pytest.mark.django_db
+def test_declaration_key_per_request_objects():
+    assert declaration_key(Table(auto__rows=TFoo.objects.all())) is None
+    assert declaration_key(Table(auto__model=TFoo, extra__request=req('get'))) is None
+    assert declaration_key(Table(auto__model=TFoo)) is not None
+
+
+@pytest.mark.django_db
+def test_per_request_objects_are_not_cached():
+    instance = TFoo.objects.create(a=1, b='1')
+    user = SimpleLazyObject(lambda: Struct(username='user'))
+
+    class LocalTFoo:
+        pass
+
+    declarations = [
+        lambda: Form.edit(auto__instance=instance),
+        lambda: Table(auto__model=TFoo, extra__user=user),
+        lambda: Table(auto__model=TFoo, extra__row_class=LocalTFoo),
+    ]
+    for declaration in declarations:
+        assert declaration_key(declaration()) is None
+        intern_declaration(declaration())
+    assert declaration_cache_info().currsize == 0
+    assert declaration_cache_info().uncachable == len(declarations)
+
+    # Templates are keyed on their source, so a template made in the view matches the next request
+    table = lambda: Table(auto__model=TFoo, template=Template('{{ table.title }}'))
+    assert intern_declaration(table()) is intern_declaration(table())
+
+
+def test_render_recursive_declaration():
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    @iommi_render
+    def view(request):
+        return Table(columns__a__cell__value=lambda row, **_: fib(row), rows=[5])
+
+    with override_settings(IOMMI_INTERN_DECLARATIONS=True):
+        assert '<td>5</td>' in view(req('get')).content.decode()
+    assert declaration_cache_info().uncachable == 1
+
+
+def test_intern_declaration():
+    first = intern_declaration(Table(rows=[], columns__a=Column()))
+    assert first.is_refine_done
+    assert intern_declaration(Table(rows=[], columns__a=Column())) is first
+    assert intern_declaration(Table(rows=[], columns__b=Column())) is not first
+    assert intern_declaration(first) is first
+
+    info = declaration_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+@override_settings(IOMMI_DECLARATION_CACHE_SIZE=2)
+def test_intern_declaration_lru():
+    a = intern_declaration(Table(title='a'))
+    b = intern_declaration(Table(title='b'))
+    assert intern_declaration(Table(title='a')) is a
+    intern_declaration(Table(title='c'))
+
+    assert declaration_cache_info().currsize == 2
+    assert intern_declaration(Table(title='a')) is a
+    assert intern_declaration(Table(title='b')) is not b
+
+
+@pytest.mark.django_db
+def test_intern_declarations_decorator():
+    TFoo.objects.create(a=1, b='foo')
+
+    @iommi_render
+    @intern_declarations
+    def view(request):
+        return Table(auto__model=TFoo, columns__a__cell__format=lambda value, **_: f'<{value}>')
+
+    for _ in range(2):
+        assert '&lt;1&gt;' in view(req('get')).content.decode()
+
+    info = declaration_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.django_db
+@override_settings(IOMMI_INTERN_DECLARATIONS=True)
+def test_intern_declarations_setting():
+    @iommi_render
+    def view(request):
+        return Table(auto__model=TFoo)
+
+    view(req('get'))
+    view(req('get'))
+
+    info = declaration_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
@@ -146,6 +146,20 @@ class FrozenNamespace(Frozen, Namespace):
 EMPTY = FrozenNamespace()
 
 
+def copy_namespaces(namespace, result=None):
+    """
+    Copy the structure of nested namespaces, but not the values. Frozen
+    namespaces can't be changed, so they are shared instead of copied.
+    """
+    if result is None:
+        result = type(namespace)()
+    for key, value in dict.items(namespace):
+        if isinstance(value, Namespace) and not isinstance(value, Frozen):
+            value = copy_namespaces(value)
+        dict.__setitem__(result, key, value)
+    return result
+
+
 def flatten(namespace):
     return dict(flatten_items(namespace))
 
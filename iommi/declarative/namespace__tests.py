@@ -2,6 +2,7 @@
 from iommi.struct import Struct
 
 from iommi.declarative.namespace import (
+    copy_namespaces,
     EMPTY,
     flatten,
     func_from_namespace,
@@ -545,3 +546,15 @@ def g():
     )
     assert n() == 'g'
     assert func_from_namespace(n) is F.g
+
+
+def test_copy_namespaces():
+    value = object()
+    namespace = Namespace(a__b__c=value)
+    dict.__setitem__(namespace, 'd', EMPTY)
+    result = copy_namespaces(namespace)
+    assert result == namespace
+    assert result.a is not namespace.a
+    assert result.a.b is not namespace.a.b
+    assert result.a.b.c is value
+    assert result.d is EMPTY
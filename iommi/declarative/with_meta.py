@@ -1,6 +1,9 @@
 import functools
 
-from .namespace import Namespace
+from .namespace import (
+    copy_namespaces,
+    Namespace,
+)
 from .util import add_args_to_init_call
 
 
@@ -34,14 +37,22 @@ def get_meta(cls):
     Collect all members of any contained :code:`Meta` class declarations from the given class or any of its base classes.
     (Sub class values take precedence.)
 
+    The members are collected once per class, the first time they are asked for. The Meta of a class (and of its
+    base classes) is frozen from then on: changing it afterwards is not picked up. Each call returns a copy of the
+    structure of the nested namespaces, so changing the result doesn't change the Meta of the class.
+
     :type cls: class
     :rtype: Struct
     """
-    merged_attributes = Namespace()
-    for class_ in reversed(cls.mro()):
-        if hasattr(class_, 'Meta'):
-            for key in class_.Meta.__dict__:
-                if not key.startswith('__'):
-                    value = getattr(class_.Meta, key)
-                    merged_attributes.setitem_path(key, value)
-    return merged_attributes
+    try:
+        merged_attributes = cls.__dict__['_iommi_merged_meta']
+    except KeyError:
+        merged_attributes = Namespace()
+        for class_ in reversed(cls.mro()):
+            if hasattr(class_, 'Meta'):
+                for key in class_.Meta.__dict__:
+                    if not key.startswith('__'):
+                        value = getattr(class_.Meta, key)
+                        merged_attributes.setitem_path(key, value)
+        type.__setattr__(cls, '_iommi_merged_meta', merged_attributes)
+    return copy_namespaces(merged_attributes)
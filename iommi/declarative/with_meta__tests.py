@@ -341,3 +341,40 @@ def __init__(self, **_):
             pass
 
     assert Foo().get_meta().foo(17) == 17
+
+
+def test_get_meta_is_collected_once_per_class():
+    @with_meta
+    class Test:
+        class Meta:
+            foo__bar = 1
+
+    class Sub(Test):
+        class Meta:
+            foo__baz = 2
+
+    meta = Sub.get_meta()
+    assert meta == Namespace(foo__bar=1, foo__baz=2)
+    assert Test.get_meta() == Namespace(foo__bar=1)
+
+    meta.foo.bar = 3
+    assert Sub.get_meta() == Namespace(foo__bar=1, foo__baz=2)
+    assert Sub.get_meta().foo is not Sub.get_meta().foo
+
+
+def test_get_meta_is_frozen_after_first_use():
+    @with_meta
+    class Test:
+        class Meta:
+            foo = 1
+
+    assert Test.get_meta() == Namespace(foo=1)
+
+    Test.Meta.foo = 2
+    Test.Meta.bar = 3
+    assert Test.get_meta() == Namespace(foo=1)
+
+    class Sub(Test):
+        pass
+
+    assert Sub.get_meta() == Namespace(foo=2, bar=3)
@@ -283,15 +283,17 @@ def default_description(v):
     if refinable_members:
         section(1, 'Refinable members')
         type_hints = get_type_hints(c)
+        declared_refinables = get_declared(c, 'refinable')
         for refinable, value in refinable_members:
             evaluated_marker = ''
-            if isinstance(getattr(c, refinable, None), (EvaluatedRefinable, SpecialEvaluatedRefinable)):
+            # The declaration, the class attribute can be replaced, like Fragment.attrs
+            if isinstance(declared_refinables[refinable], (EvaluatedRefinable, SpecialEvaluatedRefinable)):
                 evaluated_marker = '  \N{NO-BREAK SPACE}\N{NO-BREAK SPACE}\N{NO-BREAK SPACE}  (:ref:`evaluated <evaluate>`)'
 
             w(0, '')
             w(0, '* `' + refinable + '`' + evaluated_marker)
 
-            docstring = getattr(getattr(c, refinable, None), '__doc__')
+            docstring = getattr(declared_refinables[refinable], '__doc__')
             if docstring:
                 _print_rst_or_python(docstring, w, indent=1)
                 w(0, '')
@@ -330,3 +330,9 @@ def test_base():
 
     '''.strip()  # noqa: W293
     )
+
+
+def test_evaluated_marker_for_replaced_class_attribute():
+    ((_, _, doc_generator),) = list(_generate_tests_from_class_docs(classes=[Fragment]))
+    evaluated_marker = '\N{NO-BREAK SPACE}\N{NO-BREAK SPACE}\N{NO-BREAK SPACE}  (:ref:`evaluated <evaluate>`)'
+    assert f'* `attrs`  {evaluated_marker}' in doc_generator()
@@ -6,13 +6,14 @@
 
 from django.db.models import QuerySet
 from django.http import HttpResponseRedirect
-from django.template import (
-    Context,
-    Template,
-)
+from django.template import Context
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy
 
+from iommi._web_compat import (
+    get_compiled_template,
+    Template,
+)
 from iommi.action import Action
 from iommi.asset import Asset
 from iommi.base import (
@@ -83,7 +84,7 @@ def render_cell_contents(self):
             if self.table.edit_errors:
                 errors = self.table.edit_errors.get(path)
                 if errors:
-                    return Template(
+                    return get_compiled_template(
                         '{{ input_html }}<br><span class="text-danger"><ul class="errors">{% for error in errors %}<li>{{ error }}</li>{% endfor %}</ul></a>'
                     ).render(context=Context(dict(input_html=input_html, errors=errors)))
 
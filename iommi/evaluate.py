@@ -1,4 +1,6 @@
 import inspect
+import sys
+import threading
 
 from iommi.base import (
     items,
@@ -9,35 +11,62 @@
     Namespace,
 )
 
-_matches_cache = {}
+_bit_by_name = {}
+_bit_by_name_lock = threading.Lock()
+_caller_mask_by_signature = {}
+_callee_masks_by_signature = {}
 
 
-def matches(caller_parameters, callee_parameters, __match_empty=False):
-    cache_key = ';'.join((caller_parameters, callee_parameters, str(int(__match_empty))))  # pragma: no mutate
-    # (mutation changes this to cached_value = None, which just slows down the code)
-    cached_value = _matches_cache.get(cache_key, None)  # pragma: no mutate
-    if cached_value is not None:
-        return cached_value
+def _intern_name(name):
+    # The check is repeated under the lock so two threads can't give two names the same bit
+    with _bit_by_name_lock:
+        bit = _bit_by_name.get(name)
+        if bit is None:
+            bit = 1 << len(_bit_by_name)
+            _bit_by_name[name] = bit
+        return bit
+
+
+def _mask_from_names(names):
+    mask = 0
+    for name in names.split(',') if names else ():
+        bit = _bit_by_name.get(name)
+        if bit is None:
+            bit = _intern_name(name)
+        mask |= bit
+    return mask
 
-    caller = set(caller_parameters.split(',')) if caller_parameters else set()
 
+def _caller_mask(caller_parameters):
+    mask = _mask_from_names(caller_parameters)
+    _caller_mask_by_signature[caller_parameters] = mask
+    return mask
+
+
+def _callee_masks(callee_parameters):
     a, b, c = callee_parameters.split('|')
-    required = set(a.split(',')) if a else set()
-    optional = set(b.split(',')) if b else set()
-    wildcard = c == '*'
+    required = _mask_from_names(a)
+    masks = (required, required | _mask_from_names(b), c == '*')
+    _callee_masks_by_signature[callee_parameters] = masks
+    return masks
 
-    if not __match_empty and not required and not optional and wildcard:
-        result = False  # Special case to not match no-specification function "lambda **whatever: ..."
-    else:
-        if wildcard:
-            result = caller >= required
-        else:
-            result = required <= caller <= required.union(optional)
 
-    _matches_cache[
-        cache_key
-    ] = result  # pragma: no mutate (mutation changes result to None which just makes things slower)
-    return result
+def matches(caller_parameters, callee_parameters, __match_empty=False):
+    # Parameter names are interned to bits, so the signatures are compared as integer masks
+    caller = _caller_mask_by_signature.get(caller_parameters)
+    if caller is None:
+        caller = _caller_mask(caller_parameters)
+    masks = _callee_masks_by_signature.get(callee_parameters)
+    if masks is None:
+        masks = _callee_masks(callee_parameters)
+    required, allowed, wildcard = masks
+
+    if caller & required != required:
+        return False
+    if wildcard:
+        # Special case to not match no-specification function "lambda **whatever: ..."
+        return bool(allowed or __match_empty)
+    return not caller & ~allowed
 
 
 def get_callable_description(c):
@@ -81,7 +110,7 @@ def evaluate(func_or_value, __signature=None, __strict=False, __match_empty=True
 
 def evaluate_strict(func_or_value, __signature=None, __match_empty=True, **kwargs):
     # noinspection PyArgumentEqualDefault
-    return evaluate(func_or_value, __signature=None, __strict=True, __match_empty=__match_empty, **kwargs)
+    return evaluate(func_or_value, __signature=__signature, __strict=True, __match_empty=__match_empty, **kwargs)
 
 
 def get_signature(func):
@@ -113,7 +142,7 @@ def get_signature(func):
         optional = ''
     wildcard = '*' if varkw is not None else ''
 
-    signature = '|'.join((required, optional, wildcard))
+    signature = sys.intern('|'.join((required, optional, wildcard)))
     try:
         object.__setattr__(func, '__iommi_declarative_signature', signature)
     except TypeError:
@@ -124,18 +153,209 @@ def get_signature(func):
     return signature
 
 
+_signature_by_keys = {}
+
+
 def signature_from_kwargs(kwargs):
-    return ','.join(sorted(keys(kwargs)))
+    if isinstance(kwargs, EvaluateParameters):
+        return kwargs.signature
+    key = tuple(kwargs)
+    signature = _signature_by_keys.get(key)
+    if signature is None:
+        signature = sys.intern(','.join(sorted(key)))
+        _signature_by_keys[key] = signature
+    return signature
+
 
+class EvaluateParameters(dict):
+    """
+    The flattened parameters of a `ParameterScope`, as a dict so they can be
+    passed on with `**`. The signature of the parameters is computed once,
+    instead of for every evaluated callable. Changing the dict resets the
+    signature.
+    """
 
-def evaluate_members(obj, **kwargs):
-    for key in obj._refinables_dynamic:
-        evaluate_member(obj, key, **kwargs)
+    __slots__ = ('_signature',)
 
+    @property
+    def signature(self):
+        try:
+            signature = self._signature
+        except AttributeError:
+            signature = None
+        if signature is None:
+            signature = signature_from_kwargs(dict.keys(self))
+            self._signature = signature
+        return signature
+
+    def __setitem__(self, key, value):
+        self._signature = None
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._signature = None
+        dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        self._signature = None
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._signature = None
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self._signature = None
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._signature = None
+        dict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self._signature = None
+        dict.clear(self)
+
+    def copy(self):
+        return EvaluateParameters(self)
+
+
+_removed = object()
+_signature_by_extension = {}
+
+
+def _extend_signature(signature, names):
+    key = (signature, names)
+    result = _signature_by_extension.get(key)
+    if result is None:
+        all_names = set(signature.split(',')) if signature else set()
+        all_names.update(names)
+        result = sys.intern(','.join(sorted(all_names)))
+        _signature_by_extension[key] = result
+    return result
 
-def evaluate_member(obj, key, strict=True, **kwargs):
+
+class ParameterScope:
+    """
+    The parameters callables in the config are evaluated with. A scope holds
+    the parameters of one layer, like a part of a page, and reads everything
+    else from the scope of its parent, so binding a part doesn't copy the
+    parameters of all the parts above it.
+
+    Callables are called with `**`, which needs a dict. `flat()` builds it,
+    with its signature, the first time something is evaluated in the scope.
+    Parts that don't evaluate anything never build it. Changing the scope
+    also changes the flat dict, but not the flat dicts of scopes below it
+    that have already been built.
+    """
+
+    __slots__ = ('parent', 'layer', '_flat')
+
+    def __init__(self, parent, layer):
+        self.parent = parent
+        self.layer = layer
+        self._flat = None
+
+    @classmethod
+    def from_layer(cls, parent, layer):
+        # The layer is not copied, it belongs to the scope from now on
+        if parent is not None and not isinstance(parent, ParameterScope):
+            parent = cls(None, parent)
+        return cls(parent, layer)
+
+    def flat(self):
+        flat = self._flat
+        if flat is not None:
+            return flat
+
+        layers = []
+        scope = self
+        while scope is not None and scope._flat is None:
+            layers.append(scope.layer)
+            scope = scope.parent
+
+        if scope is None:
+            flat = EvaluateParameters()
+            signature = ''
+        else:
+            flat = EvaluateParameters(scope._flat)
+            signature = scope._flat.signature
+
+        for layer in reversed(layers):
+            removed = [k for k, v in items(layer) if v is _removed]
+            dict.update(flat, layer)
+            if removed:
+                for k in removed:
+                    dict.pop(flat, k)
+                signature = None
+            elif signature is not None and layer:
+                signature = _extend_signature(signature, tuple(layer))
+
+        flat._signature = signature
+        self._flat = flat
+        return flat
+
+    @property
+    def signature(self):
+        return self.flat().signature
+
+    def _find(self, key):
+        scope = self
+        while scope is not None:
+            value = scope.layer.get(key, _removed)
+            if value is not _removed or key in scope.layer:
+                return value
+            scope = scope.parent
+        return _removed
+
+    def __getitem__(self, key):
+        value = self._find(key)
+        if value is _removed:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._find(key)
+        return default if value is _removed else value
+
+    def __contains__(self, key):
+        return self._find(key) is not _removed
+
+    def __setitem__(self, key, value):
+        self.layer[key] = value
+        if self._flat is not None:
+            self._flat[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.layer[key] = _removed
+        if self._flat is not None:
+            del self._flat[key]
+
+    def keys(self):
+        return self.flat().keys()
+
+    def __iter__(self):
+        return iter(self.flat())
+
+    def __len__(self):
+        return len(self.flat())
+
+
+def evaluate_members(obj, __signature=None, **kwargs):
+    dynamic = obj._refinables_dynamic
+    if dynamic and __signature is None:
+        __signature = signature_from_kwargs(kwargs)
+    for key in dynamic:
+        evaluate_member(obj, key, __signature=__signature, **kwargs)
+
+
+def evaluate_member(obj, key, strict=True, __signature=None, **kwargs):
     value = getattr(obj, key)
-    new_value = evaluate(value, __strict=strict, __signature=signature_from_kwargs(kwargs), **kwargs)
+    if __signature is None:
+        __signature = signature_from_kwargs(kwargs)
+    new_value = evaluate(value, __strict=strict, __signature=__signature, **kwargs)
     if new_value is not value:
         setattr(obj, key, new_value)
 
@@ -147,7 +367,11 @@ def find_static_items(d):
 
 def evaluate_as_needed(d, kwargs, ignore=()):
     static_items = getattr(d, '_static_items', [])
-    return {k: d[k] if k in static_items else evaluate_strict(v, **kwargs) for k, v in items(d) if k not in ignore}
+    return {
+        k: d[k] if k in static_items else evaluate_strict(v, __signature=getattr(kwargs, 'signature', None), **kwargs)
+        for k, v in items(d)
+        if k not in ignore
+    }
 
 
 def has_catch_all_kwargs(callback):
@@ -3,12 +3,17 @@
 from iommi.evaluate import (
     evaluate,
     evaluate_member,
+    EvaluateParameters,
     evaluate_strict,
     get_callable_description,
     get_signature,
     has_catch_all_kwargs, matches,
     Namespace,
+    ParameterScope,
+    signature_from_kwargs,
 )
+from iommi import Fragment
+from tests.helpers import req
 
 
 def test_no_evaluate_kwargs_mismatch():
@@ -218,3 +223,108 @@ def __init__(self):
 
     evaluate_member(foo, 'foo', x=3)
     assert foo.foo == 3
+
+
+def test_signature_from_kwargs():
+    assert signature_from_kwargs(dict(b=1, a=2)) == 'a,b'
+    assert signature_from_kwargs(dict(a=2, b=1)) == 'a,b'
+    assert signature_from_kwargs({}) == ''
+
+
+def test_parameter_scope():
+    parent = ParameterScope.from_layer(None, dict(b=1, a=2))
+    scope = ParameterScope.from_layer(parent, dict(c=3, a=4))
+
+    # Reads fall back to the parent without building the flat dict
+    assert scope['b'] == 1
+    assert scope['a'] == 4
+    assert 'c' in scope
+    assert 'd' not in scope
+    assert scope.get('d') is None
+    assert scope._flat is None
+    assert parent._flat is None
+
+    assert scope.flat() == dict(a=4, b=1, c=3)
+    assert scope.signature == 'a,b,c'
+    assert scope.flat() is scope.flat()
+    assert parent._flat is None
+    assert parent.flat() == dict(a=2, b=1)
+    assert parent.signature == 'a,b'
+    assert evaluate(lambda a, c, **_: a + c, **scope.flat()) == 7
+    assert dict(scope) == dict(a=4, b=1, c=3)
+
+    scope['d'] = 5
+    assert scope.signature == 'a,b,c,d'
+    del scope['b']
+    assert 'b' not in scope
+    assert scope.signature == 'a,c,d'
+    assert parent['b'] == 1
+    with pytest.raises(KeyError):
+        del scope['b']
+
+    # Changes are seen by scopes that are flattened later
+    child = ParameterScope.from_layer(scope, dict(e=6))
+    assert child.flat() == dict(a=4, c=3, d=5, e=6)
+    assert child.signature == 'a,c,d,e'
+    scope['f'] = 7
+    assert 'f' in child
+    assert 'f' not in child.flat()
+    assert ParameterScope.from_layer(scope, {}).signature == 'a,c,d,f'
+
+
+def test_evaluate_parameters():
+    parameters = EvaluateParameters(b=1, a=2)
+    assert parameters.signature == 'a,b'
+    parameters['c'] = 3
+    assert parameters.signature == 'a,b,c'
+    del parameters['a']
+    parameters.update(d=4)
+    assert parameters.pop('b') == 1
+    assert parameters.setdefault('e', 5) == 5
+    assert parameters.signature == 'c,d,e'
+    assert signature_from_kwargs(parameters) == 'c,d,e'
+
+    copy = parameters.copy()
+    copy['g'] = 8
+    assert 'g' not in parameters
+    assert copy.signature == 'c,d,e,g'
+
+
+def test_bound_evaluate_parameters_are_scopes():
+    page = Fragment(children__child=Fragment()).bind(request=req('get'))
+    child = page.children.child
+    scope = child._evaluate_parameters
+    assert isinstance(scope, ParameterScope)
+    assert scope.parent is child._parent._evaluate_parameters
+    assert scope.parent.parent is page._evaluate_parameters
+    assert scope['request'] is page.get_request()
+
+    parameters = child.iommi_evaluate_parameters()
+    assert isinstance(parameters, EvaluateParameters)
+    assert parameters['fragment'] is child
+    assert parameters['traversable'] is child
+    assert page.iommi_evaluate_parameters()['fragment'] is page
+    assert parameters.signature == 'fragment,request,traversable'
+
+
+def test_matches_interns_parameter_names():
+    assert matches('', '||')
+    assert not matches('', 'a||')
+    assert matches('', '||*', True)
+    assert not matches('', '||*')
+    assert matches('x,y', 'x|y|')
+    assert not matches('x,y,z', 'x|y|')
+    assert matches('x,y,z', 'x|y|*')
+    assert get_signature(lambda y, x: None) is get_signature(lambda x, y: None)
+
+
+def test_interning_parameter_names_from_many_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from iommi.evaluate import _mask_from_names
+
+    names = [f'interned_from_thread_{i}' for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        bits = list(executor.map(_mask_from_names, names))
+    assert len(set(bits)) == len(names)
+    assert all(bin(bit).count('1') == 1 for bit in bits)
@@ -10,10 +10,13 @@
 )
 from iommi.attrs import (
     Attrs,
+    attrs_render_cache,
+    copy_attrs,
     render_attrs,
 )
 from iommi.base import (
     capitalize,
+    items,
     MISSING,
     NOT_BOUND_MESSAGE,
     values,
@@ -28,6 +31,7 @@
     evaluate_as_needed,
     evaluate_strict,
     find_static_items,
+    is_callable,
 )
 from iommi.member import (
     bind_members,
@@ -105,6 +109,64 @@ def fragment__render(fragment, context):
         )
 
 
+_static_value_types = (str, int, float, type(None))
+
+
+def _attrs_are_constant(attrs):
+    # Stricter than attrs_are_static: lazy translations render differently per language
+    for k, v in items(attrs or {}):
+        if k in ('class', 'style') and isinstance(v, dict):
+            if not all(isinstance(x, _static_value_types) for x in values(v)):
+                return False
+        elif not isinstance(v, _static_value_types):
+            return False
+    return True
+
+
+def _is_static_child(child):
+    if isinstance(child, Fragment):
+        return child._is_static and not is_callable(child.include)
+    return isinstance(child, (str, int, float))
+
+
+def _is_static_fragment(fragment):
+    cls = type(fragment)
+    return (
+        # The level of a Header depends on the page it's in, unless the tag is set
+        (cls.on_bind is Fragment.on_bind or (cls.on_bind is Header.on_bind and fragment.tag is not None))
+        and cls.attrs is Fragment.attrs
+        and cls.__html__ is Fragment.__html__
+        and cls.render_text_or_children is Fragment.render_text_or_children
+        and fragment.template is None
+        and isinstance(fragment.tag, _static_value_types)
+        and _attrs_are_constant(fragment.attrs)
+        and all(_is_static_child(x) for x in values(fragment.iommi_namespace.children))
+    )
+
+
+def _evaluate_constant_attrs(attrs):
+    result = Attrs(
+        None,
+        **{
+            **{k: v for k, v in items(attrs) if k not in ('class', 'style')},
+            'class': dict(attrs.get('class') or {}),
+            'style': dict(attrs.get('style') or {}),
+        },
+    )
+    result.set_render_cache(attrs_render_cache(attrs))
+    return result
+
+
+def _children_unchanged(fragment):
+    # Until a child fragment is bound, or a text child is replaced, the bound
+    # children are the text children of the declaration
+    text_children = fragment._declared._static_text_children
+    bound_children = dict.values(fragment.children)
+    if len(bound_children) != len(text_children):
+        return False
+    return all(a is b for a, b in zip(bound_children, text_children))
+
+
 class Tag:
     def iommi_open_tag(self):
         if self.tag is None:
@@ -160,6 +222,12 @@ class MyPage(Page):
     template: Union[str, Template] = EvaluatedRefinable()
     children = RefinableMembers()
 
+    _attrs = None
+    _is_static = False
+    _static_html = None
+    # The attrs of a static fragment, evaluated once and shared by its binds until they are accessed
+    _shared_attrs = None
+
     class Meta:
         children = EMPTY
         attrs__class = EMPTY
@@ -184,6 +252,17 @@ def on_refine_done(self):
             find_static_items(self.children)
             self._children_static_items = self.children._static_items
 
+        # A fragment without anything evaluated is rendered once, and the
+        # html is reused for every bind of this declaration
+        self._is_static = _is_static_fragment(self)
+        self._static_html = None
+        self._shared_attrs = None
+        if self._is_static:
+            self._shared_attrs = _evaluate_constant_attrs(self.attrs or {})
+            self._static_text_children = tuple(
+                x for x in values(self.iommi_namespace.children) if not isinstance(x, Fragment)
+            )
+
     def render_text_or_children(self, context=None):
         if context is None:
             context = self.get_context()
@@ -203,6 +282,9 @@ def on_bind(self) -> None:
         super().on_bind()
         bind_members(self, name='children')
 
+        if self._is_static:
+            return
+
         # Fragment children are special and they can be raw str/int etc but
         # also callables. We need to evaluate them!
 
@@ -219,16 +301,50 @@ def on_bind(self) -> None:
     )
     def __html__(self, *, render=None):
         assert self._is_bound, NOT_BOUND_MESSAGE
+        if self._is_static and render is fragment__render:
+            return self._render_static()
         context = {**self.get_context(), **self.iommi_evaluate_parameters()}
         return render(
             fragment=self,
             context=context,
         )
 
+    def _render_static(self):
+        # The cached html is only valid if nothing was changed on the bound
+        # fragment. Its attrs are copied when accessed, so if it still has the
+        # shared attrs, they are unchanged.
+        declaration = self._declared
+        if not (
+            declaration.is_refine_done
+            and self._attrs is self._shared_attrs
+            and self.tag == declaration.tag
+            and _children_unchanged(self)
+        ):
+            return fragment__render(fragment=self, context={})
+        if declaration._static_html is None:
+            declaration._static_html = fragment__render(fragment=self, context={})
+        return declaration._static_html
+
     def own_evaluate_parameters(self):
         return dict(fragment=self)
 
 
+def _get_attrs(fragment):
+    attrs = fragment._attrs
+    if attrs is fragment._shared_attrs and attrs is not None and fragment._is_bound:
+        # Copied on access, as the attrs, or the class and style dicts in them, might be changed
+        attrs = fragment._attrs = copy_attrs(attrs)
+    return attrs
+
+
+def _set_attrs(fragment, attrs):
+    fragment._attrs = attrs
+
+
+# Set after the class is created, so `attrs` is still declared as a refinable
+Fragment.attrs = property(_get_attrs, _set_attrs)
+
+
 class Header(Fragment):
     """
     `Header` is a special fragment that automatically calculates its level.
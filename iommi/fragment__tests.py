@@ -358,3 +358,61 @@ def side_effect(func_or_value, __signature=None, __match_empty=True, **kwargs):
     verify_part_html(part=part, expected_html='<p> This is static Not so static </p>')
 
     assert next(counter) == 1
+
+
+def test_static_fragment_is_rendered_once():
+    declaration = html.p('foo', attrs__class__bar=True, attrs__title='<baz>').refine_done()
+    assert declaration._is_static
+
+    first = declaration.bind().__html__()
+    assert first == '<p class="bar" title="<baz>">foo</p>'
+    assert declaration.bind().__html__() is first
+
+    # Changes to the bound fragment are still rendered
+    f = declaration.bind()
+    f.attrs['class']['quux'] = True
+    f.tag = 'div'
+    assert f.__html__() == '<div class="bar quux" title="<baz>">foo</div>'
+    assert declaration.bind().__html__() == '<p class="bar" title="<baz>">foo</p>'
+
+
+def test_static_fragment_detection():
+    def is_static(f):
+        return f.refine_done()._is_static
+
+    assert is_static(Fragment())
+    assert is_static(html.div('foo', attrs__style__color='red'))
+    assert not is_static(html.div(lambda **_: 'foo'))
+    assert is_static(html.div(html.span('foo'), 'bar'))
+    assert not is_static(html.div(html.span(lambda **_: 'foo')))
+    assert not is_static(html.div(html.span('foo', include=lambda **_: True)))
+    assert not is_static(html.div('foo', attrs__class__bar=lambda **_: True))
+    assert not is_static(Fragment('foo', tag=lambda **_: 'span'))
+    assert not is_static(html.div('foo', template=Template('{{ fragment.tag }}')))
+    assert not is_static(Header('foo'))
+    assert is_static(Header('foo', tag='h2'))
+
+
+def test_static_fragment_with_fragment_children():
+    declaration = html.div(html.span('foo', attrs__class__bar=True), 'baz').refine_done()
+    assert declaration._is_static
+
+    first = declaration.bind().__html__()
+    assert first == '<div><span class="bar">foo</span>baz</div>'
+    assert declaration.bind().__html__() is first
+
+    # Shared until accessed
+    f = declaration.bind()
+    assert f._attrs is declaration.bind()._attrs
+    f.attrs['title'] = 'changed'
+    assert f.__html__() == '<div title="changed"><span class="bar">foo</span>baz</div>'
+
+    f = declaration.bind()
+    f.children.child.attrs['class']['quux'] = True
+    assert f.__html__() == '<div><span class="bar quux">foo</span>baz</div>'
+
+    f = declaration.bind()
+    f.children.child2 = 'changed'
+    assert f.__html__() == '<div><span class="bar">foo</span>changed</div>'
+
+    assert declaration.bind().__html__() is first
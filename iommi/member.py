@@ -190,21 +190,35 @@ class ForbiddenNamesException(Exception):
 
 # noinspection PyCallByClass
 class MemberBinder(dict):
+    """
+    The members of a bound container, bound lazily on first access. The dict
+    holds the members bound so far. A member is always appended to the dict
+    when bound, and if it was bound out of declaration order, the order is
+    restored once, when the members are read in bulk (`keys()`, `values()`,
+    `items()`, iteration).
+    """
+
     def __init__(self, parent: Members, _declared_members: Dict[str, Traversable], _unknown_types_fall_through: bool):
-        if _unknown_types_fall_through:
-            bindable_names = []
-            for name, member in items(_declared_members):
-                if not hasattr(member, 'bind'):
-                    self[name] = copy(member)
-                    continue
-                bindable_names.append(name)
-        else:
-            bindable_names = list(keys(_declared_members))
+        super().__init__()
+        index_by_name = {}
+        bindable_names = {}
+        last_index = -1
+        for index, (name, member) in enumerate(items(_declared_members)):
+            index_by_name[name] = index
+            if _unknown_types_fall_through and not hasattr(member, 'bind'):
+                dict.__setitem__(self, name, copy(member))
+                last_index = index
+                continue
+            bindable_names[name] = index
 
         object.__setattr__(self, '_parent', parent)
         object.__setattr__(self, '_bindable_names', bindable_names)
         object.__setattr__(self, '_declared_members', _declared_members)
-        super().__init__()
+        object.__setattr__(self, '_index_by_name', index_by_name)
+        # Members that have been bound, also the ones that were excluded when bound
+        object.__setattr__(self, '_bound_mask', bytearray(len(index_by_name)))
+        object.__setattr__(self, '_last_index', last_index)
+        object.__setattr__(self, '_out_of_order', False)
 
     def __getattribute__(self, name):
         _bindable_names = object.__getattribute__(self, '_bindable_names')
@@ -221,6 +235,12 @@ def __getattribute__(self, name):
     def __setattr__(self, name, value):
         self[name] = value
 
+    def __setitem__(self, name, value):
+        if not dict.__contains__(self, name):
+            # Members set on the binder go after the declared members, when the order is restored
+            object.__setattr__(self, '_out_of_order', True)
+        dict.__setitem__(self, name, value)
+
     def __getitem__(self, name):
         _force_bind(self, name)
         return dict.__getitem__(self, name)
@@ -228,7 +248,7 @@ def __getitem__(self, name):
     def __delitem__(self, name):
         dict.__delitem__(self, name)
         _bindable_names = object.__getattribute__(self, '_bindable_names')
-        _bindable_names.remove(name)
+        del _bindable_names[name]
 
     def get(self, name, *args):
         _force_bind(self, name)
@@ -236,16 +256,22 @@ def get(self, name, *args):
 
     def values(self):
         _force_bind_all(self)
+        _restore_declaration_order(self)
         return super().values()
 
     def items(self):
         _force_bind_all(self)
+        _restore_declaration_order(self)
         return super().items()
 
     def keys(self):
         _force_bind_all(self)
+        _restore_declaration_order(self)
         return super().keys()
 
+    def __iter__(self):
+        return iter(self.keys())
+
     def __len__(self):
         _force_bind_all(self)
         return super().__len__()
@@ -261,30 +287,53 @@ def __repr__(self):
 
 # noinspection PyCallByClass
 def _force_bind(member_binder: MemberBinder, name: str):
-    if name not in member_binder:
+    if dict.__contains__(member_binder, name):
+        return
 
-        _parent = object.__getattribute__(member_binder, '_parent')
-        _bindable_names = object.__getattribute__(member_binder, '_bindable_names')
-        _declared_members = object.__getattribute__(member_binder, '_declared_members')
+    index = object.__getattribute__(member_binder, '_bindable_names').get(name)
+    if index is None:
+        return
+    _bound_mask = object.__getattribute__(member_binder, '_bound_mask')
+    if _bound_mask[index]:
+        return
+    _bound_mask[index] = 1
 
-        if name in _bindable_names:
-            bound_member = _declared_members[name].bind(parent=_parent)
-            if bound_member is not None:
-                bound_members = dict.copy(member_binder)
-                dict.clear(member_binder)  # re-insert values in dict to retain ordering
-                dict.update(
-                    member_binder,
-                    (
-                        (k, bound_member if k == name else bound_members[k])
-                        for k in dict.keys(_declared_members)
-                        if k == name or k in bound_members
-                    ),
-                )
+    _parent = object.__getattribute__(member_binder, '_parent')
+    _declared_members = object.__getattribute__(member_binder, '_declared_members')
+    bound_member = _declared_members[name].bind(parent=_parent)
+    if bound_member is not None:
+        _insert_in_declaration_order(member_binder, name, index, bound_member)
+
+
+# noinspection PyCallByClass
+def _insert_in_declaration_order(member_binder: MemberBinder, name: str, index: int, value):
+    dict.__setitem__(member_binder, name, value)
+    if index > object.__getattribute__(member_binder, '_last_index'):
+        object.__setattr__(member_binder, '_last_index', index)
+    else:
+        # Bound out of order: sorted on the next bulk read instead of moving the later members now
+        object.__setattr__(member_binder, '_out_of_order', True)
+
+
+# noinspection PyCallByClass
+def _restore_declaration_order(member_binder: MemberBinder):
+    if not object.__getattribute__(member_binder, '_out_of_order'):
+        return
+    object.__setattr__(member_binder, '_out_of_order', False)
+
+    bound_members = dict.copy(member_binder)
+    dict.clear(member_binder)
+    for name in object.__getattribute__(member_binder, '_index_by_name'):
+        if name in bound_members:
+            dict.__setitem__(member_binder, name, bound_members.pop(name))
+    # Members set on the binder that were not declared go last
+    dict.update(member_binder, bound_members)
 
 
 # noinspection PyCallByClass
 def _force_bind_all(member_binder: MemberBinder):
     _bindable_names = object.__getattribute__(member_binder, '_bindable_names')
-    for name in _bindable_names:
-        if name not in member_binder:
+    _bound_mask = object.__getattribute__(member_binder, '_bound_mask')
+    for name, index in list(_bindable_names.items()):
+        if not _bound_mask[index]:
             _force_bind(member_binder, name)
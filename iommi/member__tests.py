@@ -326,6 +326,35 @@ class MyBasket(Basket):
     assert str(my_basket.fruits) == '<MemberBinder: banana (bound), orange>'
 
 
+def test_lazy_bind_keeps_declaration_order():
+    parts = Page(
+        parts__apple=html.div('apple'),
+        parts__banana=html.div('banana'),
+        parts__cherry=html.div('cherry', include=False),
+        parts__orange=html.div('orange'),
+    ).bind().parts
+    # noinspection PyStatementEffect
+    parts.orange
+    # noinspection PyStatementEffect
+    parts.apple
+    assert list(dict.keys(parts)) == ['orange', 'apple']
+    assert parts.get('cherry') is None
+    assert list(parts.keys()) == ['apple', 'banana', 'orange']
+    assert list(parts) == ['apple', 'banana', 'orange']
+    assert [x._name for x in parts.values()] == ['apple', 'banana', 'orange']
+
+
+def test_members_set_on_the_binder_go_last():
+    parts = Page(
+        parts__apple=html.div('apple'),
+        parts__banana=html.div('banana'),
+    ).bind().parts
+    parts['cherry'] = 'cherry'
+    # noinspection PyStatementEffect
+    parts.banana
+    assert list(parts.keys()) == ['apple', 'banana', 'cherry']
+
+
 def test_forbidden_names():
     class MyBasket(Basket):
         _name = Fruit()
@@ -1,5 +1,6 @@
 import inspect
 import json
+import re
 from abc import abstractmethod
 from typing import (
     Any,
@@ -8,20 +9,21 @@
 )
 
 from iommi._web_compat import (
-    get_template_from_string,
+    get_compiled_template,
     HttpResponse,
     HttpResponseBase,
     render_template,
+    StreamingHttpResponse,
     Template,
 )
 from iommi.base import (
+    iommi_debug_on,
     items,
     MISSING,
     NOT_BOUND_MESSAGE,
 )
 from iommi.debug import (
     get_instantiated_at_info,
-    iommi_debug_on,
 )
 from iommi.declarative.dispatch import dispatch
 from iommi.declarative.namespace import (
@@ -175,6 +177,21 @@ def render_to_response(self, **kwargs):
         response.iommi_part = self
         return response
 
+    @dispatch
+    def render_to_streaming_response(self, **kwargs):
+        """
+        Like `render_to_response`, but the rows of the tables in the part are
+        streamed to the client in chunks, after the rest of the page. See
+        `stream_root`.
+        """
+        dispatch = self.perform_dispatch(**kwargs)
+        if dispatch is not None:
+            return dispatch
+
+        response = StreamingHttpResponse(stream_root(part=self, **kwargs))
+        response.iommi_part = self
+        return response
+
     def iommi_collected_assets(self):
         return sort_after(self.iommi_root()._iommi_collected_assets)
 
@@ -248,7 +265,39 @@ def render_root(*, part, context, **render):
         + content_block_name
         + ' %}{{ iommi_debug_panel }}{{ content }}{% endblock %}'
     )
-    return get_template_from_string(template_string).render(context=context, request=request)
+    return get_compiled_template(template_string, engine='from_string').render(context=context, request=request)
+
+
+@dispatch(
+    render=EMPTY,
+    context=EMPTY,
+)
+def stream_root(*, part, context, **render):
+    """
+    Generator version of `render_root`. The page is rendered with a marker in
+    place of the body of each table, and the rows of the tables are then
+    yielded in chunks when the output reaches the marker. This keeps the
+    memory use flat for big tables and lets the browser start painting
+    the page before all rows are rendered.
+    """
+    root = part.iommi_root()
+    streamed_bodies = {}
+    root._iommi_streamed_bodies = streamed_bodies
+    try:
+        html = render_root(part=part, context=context, **render)
+    finally:
+        # Only this render gets the markers, later renders of the root render the rows in place
+        root._iommi_streamed_bodies = None
+    if not streamed_bodies:
+        yield html
+        return
+
+    position = 0
+    for marker in re.finditer('|'.join(re.escape(x) for x in streamed_bodies), html):
+        yield html[position : marker.start()]
+        yield from streamed_bodies[marker.group()].stream()
+        position = marker.end()
+    yield html[position:]
 
 
 PartType = Union[Part, str, Template]
@@ -1,4 +1,6 @@
 import operator
+import threading
+from collections import OrderedDict
 from functools import reduce
 from typing import (
     Type,
@@ -25,6 +27,7 @@
     Keyword,
     oneOf,
     ParseException,
+    ParserElement,
     ParseResults,
     QuotedString,
     quotedString,
@@ -34,6 +37,7 @@
 
 from iommi._web_compat import (
     render_template,
+    settings,
     Template,
     ValidationError,
 )
@@ -90,6 +94,7 @@
     Part,
     request_data,
 )
+from iommi.query_in_memory import filter_rows
 from iommi.refinable import (
     EvaluatedRefinable,
     Prio,
@@ -115,6 +120,77 @@ class QueryException(Exception):
 }
 assert PRECEDENCE['and'] > PRECEDENCE['or']  # pragma: no mutate
 
+DEFAULT_QUERY_CACHE_SIZE = 500
+
+_parsed_queries = OrderedDict()
+_parsed_queries_lock = threading.Lock()
+_parsed_queries_stats = dict(hits=0, misses=0)
+
+
+class Statement:
+    """
+    A statement in a parsed query. The parsed query doesn't depend on the
+    query it was parsed for, the statements are converted to `Q` objects
+    by the bound query when the parsed query is compiled.
+    """
+
+    __slots__ = ('to_q', 'token')
+
+    def __init__(self, to_q, token):
+        # The name of the method of Query that converts the statement
+        self.to_q = to_q
+        self.token = tuple(token)
+
+    def __repr__(self):
+        return f'<Statement {self.to_q} {self.token!r}>'
+
+
+def _freeze_tokens(tokens):
+    return tuple(_freeze_tokens(x) if isinstance(x, ParseResults) else x for x in tokens)
+
+
+def parse_query_tokens(grammar, query_string):
+    """
+    Parse a stripped query string with `grammar`, or get the tokens from the
+    cache of parsed queries.
+    """
+    key = (grammar, query_string)
+    with _parsed_queries_lock:
+        tokens = _parsed_queries.get(key)
+        if tokens is not None:
+            _parsed_queries.move_to_end(key)
+            _parsed_queries_stats['hits'] += 1
+            return tokens
+
+    try:
+        tokens = _freeze_tokens(grammar.parseString(query_string, parseAll=True))
+    except ParseException:
+        raise QueryException('Invalid syntax for query')
+
+    maxsize = getattr(settings, 'IOMMI_QUERY_CACHE_SIZE', DEFAULT_QUERY_CACHE_SIZE)
+    with _parsed_queries_lock:
+        _parsed_queries_stats['misses'] += 1
+        _parsed_queries[key] = tokens
+        while len(_parsed_queries) > maxsize:
+            _parsed_queries.popitem(last=False)
+    return tokens
+
+
+def query_cache_info():
+    with _parsed_queries_lock:
+        return dict(
+            **_parsed_queries_stats,
+            maxsize=getattr(settings, 'IOMMI_QUERY_CACHE_SIZE', DEFAULT_QUERY_CACHE_SIZE),
+            currsize=len(_parsed_queries),
+        )
+
+
+def clear_query_cache():
+    with _parsed_queries_lock:
+        _parsed_queries.clear()
+        _parsed_queries_stats.update(hits=0, misses=0)
+
+
 Q_OPERATOR_BY_QUERY_OPERATOR = {
     '>': 'gt',
     '=>': 'gte',
@@ -815,7 +891,10 @@ def filter(query, rows, **_):
             except QueryException:
                 pass
             if q:
-                rows = rows.filter(q)
+                if isinstance(rows, list):
+                    rows = filter_rows(rows, q)
+                else:
+                    rows = rows.filter(q)
 
         return query.invoke_callback(query.postprocess, rows=rows)
 
@@ -835,18 +914,27 @@ def parse_query_string(self, query_string: str) -> Q:
         query_string = query_string.strip()
         if not query_string:
             return Q()
-        parser = self._create_grammar()
-        try:
-            tokens = parser.parseString(query_string, parseAll=True)
-        except ParseException:
-            raise QueryException('Invalid syntax for query')
+        tokens = parse_query_tokens(self._get_grammar(), query_string)
         return self._compile(tokens)
 
+    @classmethod
+    def _get_grammar(cls):
+        grammar = cls.__dict__.get('_iommi_grammar')
+        if grammar is None:
+            if getattr(settings, 'IOMMI_QUERY_PACKRAT_PARSING', False):
+                # Note that this turns on packrat parsing for all pyparsing grammars in the process
+                ParserElement.enable_packrat()
+            grammar = cls._create_grammar()
+            cls._iommi_grammar = grammar
+        return grammar
+
     def _compile(self, tokens) -> Q:
         items = []
         for token in tokens:
-            if isinstance(token, ParseResults):
+            if isinstance(token, (ParseResults, tuple)):
                 items.append(self._compile(token))
+            elif isinstance(token, Statement):
+                items.append(getattr(self, token.to_q)(token.token))
             elif isinstance(token, Q):
                 items.append(token)
             elif token in ('and', 'or'):
@@ -892,7 +980,8 @@ def _tokens_to_rpn(tokens):
             result_q.append(stack.pop()[0])
         return result_q
 
-    def _create_grammar(self):
+    @classmethod
+    def _create_grammar(cls):
         """
         Pyparsing implementation of a where clause grammar based on http://pyparsing.wikispaces.com/file/view/simpleSQL.py
 
@@ -925,9 +1014,13 @@ def _create_grammar(self):
 
         # Define a where expression
         where_expression = Forward()
-        binary_operator_statement = (identifier + binary_op + value_string).setParseAction(self._binary_op_to_q)
-        unary_operator_statement = (identifier | (Char('!') + identifier)).setParseAction(self._unary_op_to_q)
-        free_text_statement = quotedString.copy().setParseAction(self._freetext_to_q)
+        binary_operator_statement = (identifier + binary_op + value_string).setParseAction(
+            lambda token: Statement('_binary_op_to_q', token)
+        )
+        unary_operator_statement = (identifier | (Char('!') + identifier)).setParseAction(
+            lambda token: Statement('_unary_op_to_q', token)
+        )
+        free_text_statement = quotedString.copy().setParseAction(lambda token: Statement('_freetext_to_q', token))
         operator_statement = binary_operator_statement | free_text_statement | unary_operator_statement
         where_condition = Group(operator_statement | ('(' + where_expression + ')'))
         where_expression << where_condition + ZeroOrMore((and_ | or_) + where_expression)
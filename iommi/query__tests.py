@@ -4,6 +4,7 @@
     datetime,
     time,
 )
+from unittest import mock
 
 import pytest
 import time_machine
@@ -12,6 +13,7 @@
     Q,
     QuerySet,
 )
+from django.test import override_settings
 
 from iommi import from_model
 from iommi.base import (
@@ -32,10 +34,12 @@
 from iommi.query import (
     build_query_expression,
     choice_queryset_value_to_q,
+    clear_query_cache,
     Filter,
     FREETEXT_SEARCH_NAME,
     Q_OPERATOR_BY_QUERY_OPERATOR,
     Query,
+    query_cache_info,
     QueryException,
     value_to_str_for_query,
 )
@@ -194,6 +198,50 @@ def test_parenthesis(MyTestQuery):
     )
 
 
+def test_parsed_query_cache(MyTestQuery):
+    clear_query_cache()
+    query_string = 'foo_name="asd" and bar_name = 7'
+
+    query = MyTestQuery().bind(request=None)
+    assert repr(query.parse_query_string(query_string)) == repr(Q(foo__iexact='asd') & Q(bar__exact='7'))
+
+    # The parsed query is compiled for the bound query it is used with
+    query = MyTestQuery(filters__foo_name__attr='quux').bind(request=None)
+    assert repr(query.parse_query_string(f' {query_string} ')) == repr(Q(quux__iexact='asd') & Q(bar__exact='7'))
+
+    info = query_cache_info()
+    assert (info['hits'], info['misses'], info['currsize']) == (1, 1, 1)
+    assert MyTestQuery._get_grammar() is MyTestQuery._get_grammar()
+
+
+def test_create_grammar_override():
+    created_for = []
+
+    class MyQuery(Query):
+        foo = Filter()
+
+        @classmethod
+        def _create_grammar(cls):
+            created_for.append(cls)
+            return super()._create_grammar()
+
+    for _ in range(2):
+        query = MyQuery().bind(request=None)
+        assert repr(query.parse_query_string('foo=1')) == repr(Q(foo__iexact='1'))
+    assert created_for == [MyQuery]
+
+
+def test_packrat_parsing_setting():
+    class PackratQuery(Query):
+        foo = Filter()
+
+    with override_settings(IOMMI_QUERY_PACKRAT_PARSING=True):
+        with mock.patch('iommi.query.ParserElement.enable_packrat') as enable_packrat:
+            query = PackratQuery().bind(request=None)
+            assert repr(query.parse_query_string('foo=1')) == repr(Q(foo__iexact='1'))
+    assert enable_packrat.call_count == 1
+
+
 def test_request_to_q_advanced(MyTestQuery):
 
     q = MyTestQuery().bind(request=req('get'))
@@ -0,0 +1,259 @@
+"""
+Evaluate the `Q` objects produced by `Query` on plain python rows, so that
+the query language works for tables with lists as rows.
+"""
+import operator
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from decimal import (
+    Decimal,
+    InvalidOperation,
+)
+
+from django.db.models import (
+    F,
+    Q,
+)
+
+from iommi.declarative.namespace import getattr_path
+
+
+def _coerce(value, like):
+    # Values from the query language are strings unless the filter parsed them,
+    # the database would convert them to the type of the column for us
+    if not isinstance(value, str) or like is None or isinstance(like, str):
+        return value
+    try:
+        if isinstance(like, bool):
+            return value.lower() in ('1', 'true', 'yes')
+        if isinstance(like, (int, float, Decimal)):
+            return type(like)(value)
+    except (ValueError, InvalidOperation):
+        pass
+    return value
+
+
+def _exact(a, b):
+    if b is None:
+        return a is None
+    return a == _coerce(b, a)
+
+
+def _iexact(a, b):
+    if isinstance(a, str) and isinstance(b, str):
+        return a.casefold() == b.casefold()
+    return _exact(a, b)
+
+
+def _contains(a, b):
+    return a is not None and str(b) in str(a)
+
+
+def _icontains(a, b):
+    return a is not None and str(b).casefold() in str(a).casefold()
+
+
+def _comparison(op):
+    def compare(a, b):
+        if a is None or b is None:
+            return False
+        try:
+            return op(a, _coerce(b, a))
+        except TypeError:
+            return False
+
+    return compare
+
+
+def _in(a, b):
+    return any(_exact(a, x) for x in b)
+
+
+def _isnull(a, b):
+    return (a is None) == bool(b)
+
+
+LOOKUPS = {
+    'exact': _exact,
+    'iexact': _iexact,
+    'contains': _contains,
+    'icontains': _icontains,
+    'gt': _comparison(operator.gt),
+    'gte': _comparison(operator.ge),
+    'lt': _comparison(operator.lt),
+    'lte': _comparison(operator.le),
+    'in': _in,
+    'isnull': _isnull,
+}
+
+
+def split_lookup(key):
+    """Split a `Q` keyword like `foo__bar__gte` into the path and the lookup: `('foo__bar', 'gte')`"""
+    path, _, lookup = key.rpartition('__')
+    if path and lookup in LOOKUPS:
+        return path, lookup
+    return key, 'exact'
+
+
+def q_to_predicate(q):
+    """
+    Compile a `Q` object into a function that takes a row and returns if the
+    row matches. Attribute paths are resolved with `getattr_path` and the
+    lookups in `LOOKUPS` are supported.
+    """
+    if isinstance(q, tuple):
+        key, value = q
+        path, lookup = split_lookup(key)
+        test = LOOKUPS[lookup]
+        if isinstance(value, F):
+            other = value.name
+            return lambda row: test(getattr_path(row, path), getattr_path(row, other))
+        return lambda row: test(getattr_path(row, path), value)
+
+    children = [q_to_predicate(x) for x in q.children]
+    if not children:
+        predicate = lambda row: True
+    elif len(children) == 1:
+        (predicate,) = children
+    elif q.connector == Q.AND:
+        predicate = lambda row: all(x(row) for x in children)
+    else:
+        predicate = lambda row: any(x(row) for x in children)
+
+    if q.negated:
+        return lambda row: not predicate(row)
+    return predicate
+
+
+class IndexedRows(list):
+    """
+    A list of rows that builds indexes on demand to speed up filtering with
+    `filter_rows`. Equality lookups use a hash index and range lookups a
+    sorted index of the attribute, each built the first time it's needed and
+    kept for as long as the `IndexedRows` object lives. This pays off for big
+    lists that are kept around between requests, like cached report data.
+
+    The indexes are not updated if the list is modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(IndexedRows, self).__init__(*args, **kwargs)
+        self._hash_indexes = {}
+        self._sorted_indexes = {}
+
+    def hash_index(self, path):
+        """A dict from value to the set of positions of the rows with that value, or `None` if the values aren't hashable."""
+        if path not in self._hash_indexes:
+            index = {}
+            try:
+                for i, row in enumerate(self):
+                    index.setdefault(getattr_path(row, path), set()).add(i)
+            except TypeError:
+                index = None
+            self._hash_indexes[path] = index
+        return self._hash_indexes[path]
+
+    def sorted_index(self, path):
+        """The non-null values sorted, and the positions of the rows in the same order, or `None` if the values can't be sorted."""
+        if path not in self._sorted_indexes:
+            pairs = [(v, i) for i, v in ((i, getattr_path(row, path)) for i, row in enumerate(self)) if v is not None]
+            try:
+                pairs.sort(key=operator.itemgetter(0))
+            except TypeError:
+                index = None
+            else:
+                index = [v for v, _ in pairs], [i for _, i in pairs]
+            self._sorted_indexes[path] = index
+        return self._sorted_indexes[path]
+
+    def _sample(self, index):
+        # The type of the values in the index, to coerce query values the same way as _exact does
+        return next((x for x in index if x is not None), None)
+
+    def positions(self, q):
+        """The set of positions of the rows matching `q`, or `None` if the indexes can't answer it."""
+        if isinstance(q, tuple):
+            return self._leaf_positions(*q)
+
+        if not q.children:
+            result = set(range(len(self)))
+        elif q.connector == Q.AND:
+            result = None
+            for child in q.children:
+                child_positions = self.positions(child)
+                if child_positions is not None:
+                    result = child_positions if result is None else result & child_positions
+            if result is None:
+                return None
+            # Check the rest of the children on the candidates
+            predicate = q_to_predicate(Q(*q.children))
+            result = {i for i in result if predicate(self[i])}
+        else:
+            result = set()
+            for child in q.children:
+                child_positions = self.positions(child)
+                if child_positions is None:
+                    return None
+                result |= child_positions
+
+        if q.negated:
+            return set(range(len(self))) - result
+        return result
+
+    def _leaf_positions(self, key, value):
+        if isinstance(value, F):
+            return None
+        path, lookup = split_lookup(key)
+
+        if lookup in ('exact', 'in', 'isnull') or (lookup == 'iexact' and not isinstance(value, str)):
+            index = self.hash_index(path)
+            if index is None:
+                return None
+            if lookup == 'isnull':
+                nulls = index.get(None, set())
+                return set(nulls) if value else set(range(len(self))) - nulls
+            sample = self._sample(index)
+            result = set()
+            for x in value if lookup == 'in' else [value]:
+                try:
+                    result |= index.get(_coerce(x, sample), set())
+                except TypeError:
+                    return None
+            return result
+
+        if lookup in ('gt', 'gte', 'lt', 'lte'):
+            index = self.sorted_index(path)
+            if index is None or value is None:
+                return None
+            keys, positions = index
+            if not keys:
+                return set()
+            value = _coerce(value, keys[0])
+            try:
+                if lookup == 'gt':
+                    return set(positions[bisect_right(keys, value):])
+                if lookup == 'gte':
+                    return set(positions[bisect_left(keys, value):])
+                if lookup == 'lt':
+                    return set(positions[: bisect_left(keys, value)])
+                return set(positions[: bisect_right(keys, value)])
+            except TypeError:
+                return None
+
+        return None
+
+
+def filter_rows(rows, q):
+    """
+    Filter a list of rows with a `Q` object, in the original order. For
+    `IndexedRows` the indexes are used where possible.
+    """
+    if isinstance(rows, IndexedRows):
+        positions = rows.positions(q)
+        if positions is not None:
+            return [rows[i] for i in sorted(positions)]
+
+    predicate = q_to_predicate(q)
+    return [row for row in rows if predicate(row)]
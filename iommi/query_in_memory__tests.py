@@ -0,0 +1,130 @@
+from datetime import date
+
+import pytest
+from django.db.models import (
+    F,
+    Q,
+)
+
+from iommi import (
+    Column,
+    Table,
+)
+from iommi.query import (
+    Filter,
+    Query,
+)
+from iommi.query_in_memory import (
+    filter_rows,
+    IndexedRows,
+    q_to_predicate,
+    split_lookup,
+)
+from iommi.struct import Struct
+from tests.helpers import req
+
+
+def rows():
+    return [
+        Struct(name='Foo', n=1, d=date(2020, 1, 1), other=Struct(name='a'), flag=True),
+        Struct(name='bar', n=2, d=date(2021, 1, 1), other=Struct(name='b'), flag=False),
+        Struct(name='Baz', n=3, d=None, other=Struct(name='a'), flag=True),
+        Struct(name='qux', n=None, d=date(2022, 1, 1), other=None, flag=False),
+    ]
+
+
+def names(rows):
+    return [x.name for x in rows]
+
+
+def test_split_lookup():
+    assert split_lookup('foo') == ('foo', 'exact')
+    assert split_lookup('foo__gte') == ('foo', 'gte')
+    assert split_lookup('foo__bar') == ('foo__bar', 'exact')
+    assert split_lookup('foo__bar__icontains') == ('foo__bar', 'icontains')
+    assert split_lookup('gte') == ('gte', 'exact')
+
+
+@pytest.mark.parametrize(
+    'q, expected',
+    [
+        (Q(), ['Foo', 'bar', 'Baz', 'qux']),
+        (Q(name='Foo'), ['Foo']),
+        (Q(name__exact='foo'), []),
+        (Q(name__iexact='foo'), ['Foo']),
+        (Q(name__contains='a'), ['bar', 'Baz']),
+        (Q(name__icontains='B'), ['bar', 'Baz']),
+        (Q(n__gt=1), ['bar', 'Baz']),
+        (Q(n__gte='2'), ['bar', 'Baz']),
+        (Q(n__lt=3), ['Foo', 'bar']),
+        (Q(n__lte=3), ['Foo', 'bar', 'Baz']),
+        (Q(n__iexact='2'), ['bar']),
+        (Q(n=None), ['qux']),
+        (Q(n__isnull=False), ['Foo', 'bar', 'Baz']),
+        (Q(n__in=[1, '3']), ['Foo', 'Baz']),
+        (Q(d__gte=date(2021, 1, 1)), ['bar', 'qux']),
+        (Q(other__name='a'), ['Foo', 'Baz']),
+        (Q(flag='1'), ['Foo', 'Baz']),
+        (Q(n__gt=1) & Q(name__icontains='z'), ['Baz']),
+        (Q(n=1) | Q(name='qux'), ['Foo', 'qux']),
+        (~Q(n__gt=1), ['Foo', 'qux']),
+        (~(Q(n=1) | Q(name='qux')), ['bar', 'Baz']),
+        (Q(n__lt=F('n')), []),
+        (Q(n__lte=F('n')), ['Foo', 'bar', 'Baz']),
+    ],
+)
+def test_filter_rows(q, expected):
+    assert names(filter_rows(rows(), q)) == expected
+    assert names(filter_rows(IndexedRows(rows()), q)) == expected
+    assert names([x for x in rows() if q_to_predicate(q)(x)]) == expected
+
+
+def test_indexed_rows_uses_indexes():
+    indexed = IndexedRows(rows())
+    assert indexed.positions(Q(n=2)) == {1}
+    assert indexed.positions(Q(n__gte=2)) == {1, 2}
+    assert indexed.positions(Q(name__icontains='a')) is None
+    assert indexed.positions(Q(n__gte=2) & Q(name__icontains='z')) == {2}
+    assert indexed.positions(Q(n__gte=2) | Q(name__icontains='z')) is None
+    assert set(indexed._hash_indexes) == {'n'}
+    assert set(indexed._sorted_indexes) == {'n'}
+
+    # Indexes are reused
+    index = indexed.hash_index('n')
+    indexed.positions(Q(n=3))
+    assert indexed.hash_index('n') is index
+    assert index[3] == {2}
+
+
+def test_indexed_rows_unsortable():
+    indexed = IndexedRows([Struct(x=1), Struct(x='a'), Struct(x=[])])
+    assert indexed.sorted_index('x') is None
+    assert indexed.hash_index('x') is None
+    assert filter_rows(indexed, Q(x=1)) == [Struct(x=1)]
+    assert filter_rows(indexed, Q(x__gt=0)) == [Struct(x=1)]
+
+
+def test_query_on_list_rows():
+    class MyQuery(Query):
+        name = Filter(freetext=True)
+        n = Filter.integer()
+
+    query = MyQuery().bind(request=req('get', **{'-query': 'n>1 and name:z'}))
+    assert names(query.filter(query=query, rows=rows())) == ['Baz']
+
+    query = MyQuery().bind(request=req('get', **{'-query': '"ba"'}))
+    assert names(query.filter(query=query, rows=IndexedRows(rows()))) == ['bar', 'Baz']
+
+
+def test_table_with_list_rows_and_query():
+    table = Table(
+        columns__name=Column(filter__include=True),
+        columns__n=Column.number(filter__include=True),
+        rows=IndexedRows(rows()),
+    )
+
+    t = table.bind(request=req('get', n='2'))
+    assert names(t.sorted_and_filtered_rows) == ['bar']
+
+    t = table.bind(request=req('get', **{'-query/query': 'n<3 or name=qux'}))
+    assert names(t.sorted_and_filtered_rows) == ['Foo', 'bar', 'qux']
@@ -13,6 +13,7 @@
 from iommi.declarative import declarative
 from iommi.declarative.dispatch import dispatch
 from iommi.declarative.namespace import (
+    copy_namespaces,
     getattr_path,
     Namespace,
 )
@@ -65,8 +66,53 @@ def flatten_items(namespace, _prefix=''):
             yield path, value
 
 
+def _apply_refinement(result, prio, params, flattened_params):
+    # Apply one layer of the stack on top of result. Only the top level of result
+    # is mutated, setitem_path creates new namespaces for the nested levels.
+    missing = object()
+
+    for path, value in flattened_params:
+        found = False
+        for prefix in prefixes(path):
+            existing = getattr_path(result, prefix, missing)
+            if existing is missing:
+                break
+            new_updates = getattr_path(params, prefix)
+
+            if isinstance(existing, RefinableObject):
+                if isinstance(new_updates, dict):
+                    existing = existing.refine(prio, **new_updates)
+                else:
+                    existing = new_updates
+                result.setitem_path(prefix, existing)
+                found = True
+
+            if isinstance(new_updates, RefinableObject):
+                result.setitem_path(prefix, new_updates)
+                found = True
+
+        if not found:
+            result.setitem_path(path, value)
+
+
+def _top_level_key(path):
+    return path.partition('__')[0]
+
+
 class RefinableNamespace(Namespace):
+    """
+    The namespace of a `RefinableObject`. It keeps the stack of refinements it
+    was created from, sorted on priority, and the config resolved from that
+    stack.
+
+    Refining is incremental: a refinement with the highest priority so far is
+    applied on top of the resolved config of the parent. A refinement with a
+    lower priority only re-resolves the top level keys it touches, since the
+    top level keys are resolved independently of each other.
+    """
+
     __iommi_refined_stack: List[Tuple[Prio, Namespace, List[Tuple[str, Any]]]]
+    __iommi_resolved: Namespace
 
     def as_stack(self):
         return [(prio.name, dict(flattened_params)) for prio, _, flattened_params in self._get_parent_stack()]
@@ -79,43 +125,58 @@ def _get_parent_stack(self):
                 (Prio.base, self, list(flatten_items(self))),
             ]
 
+    def _get_resolved(self):
+        # The resolved config is kept separate from self, which is a copy of it, so
+        # changes made to the config after refinement don't leak into refinements of it
+        try:
+            return object.__getattribute__(self, '__iommi_resolved')
+        except AttributeError:
+            return None
+
     def _refine(self, prio: Prio, **kwargs):
         params = Namespace(**kwargs)
+        layer = (prio, params, list(flatten_items(params)))
 
-        stack = self._get_parent_stack() + [
-            (prio, params, list(flatten_items(params))),
-        ]
+        stack = self._get_parent_stack() + [layer]
         stack.sort(key=lambda x: x[0].value)
 
-        result = RefinableNamespace()
+        resolved = self._get_resolved()
+        if resolved is None:
+            resolved = Namespace()
+            for entry in stack:
+                _apply_refinement(resolved, *entry)
+        elif stack[-1] is layer:
+            parent_resolved = resolved
+            resolved = Namespace()
+            dict.update(resolved, parent_resolved)
+            _apply_refinement(resolved, *layer)
+        else:
+            touched = {_top_level_key(path) for path, _ in layer[2]}
+            partial = Namespace()
+            for prio_, params_, flattened_params in stack:
+                _apply_refinement(
+                    partial,
+                    prio_,
+                    params_,
+                    [(path, value) for path, value in flattened_params if _top_level_key(path) in touched],
+                )
+
+            # Keep the order of keys the same as if the whole stack was applied
+            order = dict.fromkeys(
+                _top_level_key(path) for _, _, flattened_params in stack for path, _ in flattened_params
+            )
+            new_resolved = Namespace()
+            for key in order:
+                source = partial if key in touched else resolved
+                if key in source:
+                    dict.__setitem__(new_resolved, key, dict.__getitem__(source, key))
+            resolved = new_resolved
+
+        # The namespace handed out is a copy of the structure of the resolved config, so
+        # changes made to the config of one refinement don't show up in its siblings
+        result = copy_namespaces(resolved, RefinableNamespace())
         object.__setattr__(result, '__iommi_refined_stack', stack)
-
-        missing = object()
-
-        for prio, params, flattened_params in stack:
-            for path, value in flattened_params:
-                found = False
-                for prefix in prefixes(path):
-                    existing = getattr_path(result, prefix, missing)
-                    if existing is missing:
-                        break
-                    new_updates = getattr_path(params, prefix)
-
-                    if isinstance(existing, RefinableObject):
-                        if isinstance(new_updates, dict):
-                            existing = existing.refine(prio, **new_updates)
-                        else:
-                            existing = new_updates
-                        result.setitem_path(prefix, existing)
-                        found = True
-
-                    if isinstance(new_updates, RefinableObject):
-                        result.setitem_path(prefix, new_updates)
-                        found = True
-
-                if not found:
-                    result.setitem_path(path, value)
-
+        object.__setattr__(result, '__iommi_resolved', resolved)
         return result
 
 
@@ -3,13 +3,16 @@
 import pytest
 
 from iommi import (
+    Field,
     Fragment,
     Header,
+    Table,
 )
 from iommi.declarative.dispatch import dispatch
 from iommi.declarative.namespace import Namespace
 from iommi.declarative.with_meta import with_meta
 from iommi.refinable import (
+    _apply_refinement,
     prefixes,
     Prio,
     refinable,
@@ -18,6 +21,7 @@
     RefinableNamespace,
     RefinableObject,
 )
+from tests.models import TFoo
 
 
 def test_i_stil_med2():
@@ -271,6 +275,64 @@ def test_refined_as_stack():
     ]
 
 
+def test_refine_incremental_same_as_replaying_the_stack():
+    def replayed(namespace):
+        result = RefinableNamespace()
+        for entry in namespace._get_parent_stack():
+            _apply_refinement(result, *entry)
+        return result
+
+    namespace = RefinableNamespace(a__b=1, c=lambda: None)
+    for prio, kwargs in [
+        (Prio.refine, dict(a__c=2)),
+        (Prio.shortcut, dict(a__b=3, a__d=4, e__f=5)),
+        (Prio.refine_defaults, dict(c__x=6, g=7)),
+        (Prio.refine, dict(a=Fragment(), h__i=8)),
+        (Prio.style, dict(a__children__foo='foo', e=9)),
+        (Prio.member, dict(a__attrs__class__bar=True, e__f=10)),
+        (Prio.constructor, dict(g=11, c__y=12)),
+    ]:
+        namespace = namespace._refine(prio, **kwargs)
+        expected = replayed(namespace)
+        assert list(namespace.keys()) == list(expected.keys())
+        assert repr(namespace) == repr(expected)
+
+    assert namespace.as_stack()[0] == ('refine_defaults', {'c__x': 6, 'g': 7})
+    assert namespace.e == Namespace(f=10)
+
+
+def test_refine_does_not_share_config():
+    base = RefinableNamespace(a__b__c=1, f__g=2)
+    first = base._refine(Prio.refine, d=2)
+    first.a.b.c = 'mutated'
+    first.a.x = 'mutated'
+    first.f.h = 'mutated'
+
+    second = first._refine(Prio.refine, a__b__y=3)
+    assert second.a == Namespace(b__c=1, b__y=3)
+    assert second.a is not first.a
+    assert second.f == Namespace(g=2)
+    assert second.f is not first.f
+
+    third = second._refine(Prio.style, a__z=4)
+    assert third.a == Namespace(b__c=1, b__y=3, z=4)
+    assert third.a is not second.a
+    assert third.f is not second.f
+
+
+@pytest.mark.django_db
+def test_refine_done_does_not_leak_config_to_siblings():
+    base = Table(auto__model=TFoo, extra__a=1).refine(title='t')
+    first = base.refine(title='u').refine_done()
+    first.extra['leak'] = 1
+    assert base.refine(title='v').refine_done().extra == dict(a=1)
+
+    field = Field(extra__a=1)
+    first = field.refine(display_name='u').refine_done()
+    first.extra['leak'] = 1
+    assert field.refine(display_name='v').refine_done().extra == dict(a=1)
+
+
 def test_refine_done_not_mutating():
     o = RefinableObject()
     result = o.refine_done()
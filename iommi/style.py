@@ -11,12 +11,15 @@
 from django.conf import settings
 
 from iommi.base import (
+    iommi_debug_on,
     items,
     keys,
 )
 from iommi.declarative.dispatch import dispatch
 from iommi.declarative.namespace import (
     EMPTY,
+    flatten,
+    FrozenNamespace,
     Namespace,
 )
 from iommi.refinable import RefinableObject
@@ -61,6 +64,7 @@ def __init__(
         self.name = None
         self.internal = internal
         self.bases = bases
+        self._resolved_refinements = {}
 
         self.base_template = base_template
         if not self.base_template:
@@ -110,7 +114,6 @@ def __init__(
         for name, sub_style in items(self.sub_styles):
             sub_style.name = name
 
-        from iommi.debug import iommi_debug_on
         if iommi_debug_on():
             import inspect
             self._instantiated_at_frame = inspect.currentframe().f_back
@@ -140,6 +143,31 @@ def resolve(self, obj, is_root=False):
 
         return result
 
+    def resolve_refinements(self, obj, is_root=False):
+        """
+        The result of `resolve` as a tuple of frozen namespaces to refine the
+        object with, merged into one namespace where that gives the same result.
+        This is cached on the type and shortcut stack of the object.
+        """
+        cache_key = (type(obj), tuple(getattr(obj, 'iommi_shortcut_stack', ())), is_root)
+        try:
+            return self._resolved_refinements[cache_key]
+        except KeyError:
+            pass
+
+        refinements = self.resolve(obj, is_root=is_root)
+        values = [v for refinement in refinements for v in flatten(Namespace(refinement)).values()]
+        if any(isinstance(v, RefinableObject) for v in values):
+            # Merging the namespaces would overwrite refinable objects instead of refining them
+            result = tuple(_frozen(Namespace(refinement)) for refinement in refinements)
+        elif refinements:
+            result = (_frozen(Namespace(*refinements)),)
+        else:
+            result = ()
+
+        self._resolved_refinements[cache_key] = result
+        return result
+
     def __repr__(self):
         return f'<Style: {self.name}>'
 
@@ -147,12 +175,26 @@ def __repr__(self):
 _styles = {}
 
 
+def _frozen(namespace):
+    # Frozen all the way down, since the cached namespaces are shared by all
+    # objects the style is applied to
+    if not namespace:
+        return EMPTY
+    result = FrozenNamespace()
+    for key, value in dict.items(namespace):
+        if isinstance(value, Namespace) and not isinstance(value, FrozenNamespace):
+            value = _frozen(value)
+        dict.__setitem__(result, key, value)
+    return result
+
+
 def register_style(name, style, allow_overwrite=False):
     if not allow_overwrite:
         assert name not in _styles, f'{name} is already registered'
     assert style.name is None
     style.name = name
     _styles[name] = style
+    style._resolved_refinements.clear()
 
     @contextmanager
     def _unregister():
@@ -169,6 +211,7 @@ def unregister_style(name):
     style = _styles[name]
     style.name = None
     del _styles[name]
+    style._resolved_refinements.clear()
 
 
 def get_global_style(name):
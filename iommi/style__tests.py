@@ -144,6 +144,33 @@ def test_resolve_style_sub_style():
         assert resolve_style('sub_style', enclosing_style=my_style) is sub_style
 
 
+def test_resolve_refinements_is_cached():
+    style = Style(
+        Field=dict(
+            attrs__class__a=True,
+            shortcuts__integer__attrs__class__b=True,
+        ),
+        root__assets__my_asset=Asset(tag='style'),
+    )
+    with register_style('my_style', style):
+        field = Field.integer()
+        refinements = style.resolve_refinements(field)
+        assert refinements == (Namespace(attrs__class__a=True, attrs__class__b=True),)
+        assert style.resolve_refinements(Field.integer()) is refinements
+        assert style.resolve_refinements(Field()) == (Namespace(attrs__class__a=True),)
+
+        with pytest.raises(TypeError):
+            refinements[0]['tag'] = 'span'
+        with pytest.raises(TypeError):
+            refinements[0].attrs['class']['c'] = True
+        assert list(style._resolved_refinements.values()) == [refinements, style.resolve_refinements(Field())]
+
+        # Refinable objects are refined by the next namespace, so they are not merged
+        assert len(style.resolve_refinements(field, is_root=True)) == 3
+
+    assert style.resolve_refinements(field) is not refinements
+
+
 def test_style_menu():
     class MyMenu(Menu):
         item = MenuItem()
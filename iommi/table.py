@@ -1,5 +1,12 @@
 import csv
+import json
 import warnings
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+)
+from collections import OrderedDict
+from copy import copy
 from datetime import (
     date,
     datetime,
@@ -10,8 +17,13 @@
     Enum,
 )
 from functools import total_ordering
-from io import StringIO
-from itertools import groupby
+from hashlib import sha1
+from itertools import (
+    groupby,
+    islice,
+)
+from threading import Lock
+from time import time as current_time
 from typing import (
     Any,
     Callable,
@@ -22,18 +34,29 @@
     Union,
 )
 from urllib.parse import quote_plus
+from uuid import uuid4
 
+from django.core.cache import caches
+from django.core.exceptions import (
+    EmptyResultSet,
+    FieldDoesNotExist,
+    ValidationError,
+)
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
 from django.db.models import (
     AutoField,
     BooleanField,
     ManyToManyField,
     Model,
+    Q,
     QuerySet,
 )
-from django.http import (
-    FileResponse,
+from django.utils import dateformat
+from django.utils.formats import (
+    date_format,
+    get_format,
 )
-from django.utils.formats import date_format
 from django.utils.html import (
     conditional_escape,
 )
@@ -42,10 +65,7 @@
     gettext_lazy,
 )
 from math import ceil
-from iommi.struct import (
-    merged,
-    Struct,
-)
+from iommi.struct import Struct
 
 from iommi._web_compat import (
     format_html,
@@ -54,6 +74,7 @@
     mark_safe,
     render_template,
     smart_str,
+    StreamingHttpResponse,
     Template,
 )
 from iommi.action import (
@@ -63,6 +84,8 @@
 )
 from iommi.attrs import (
     Attrs,
+    attrs_are_static,
+    copy_attrs,
     evaluate_attrs,
     render_attrs,
 )
@@ -97,6 +120,9 @@
     evaluate,
     evaluate_member,
     evaluate_strict,
+    is_callable,
+    ParameterScope,
+    signature_from_kwargs,
 )
 from iommi.form import (
     Field,
@@ -112,6 +138,8 @@
 from iommi.from_model import (
     AutoConfig,
     create_members_from_model,
+    get_field,
+    get_field_path,
     get_search_fields,
     member_from_model,
     NoRegisteredSearchFieldException,
@@ -141,6 +169,7 @@
 )
 from iommi.shortcut import with_defaults
 from iommi.sort_after import LAST
+from iommi.style import get_style_object
 from iommi.traversable import (
     Traversable,
 )
@@ -276,24 +305,73 @@ def time_formatter(value, **_):
     time: time_formatter,
 }
 
-_cell_formatters_types = tuple(_cell_formatters.keys())
+# The formatter for a type, as found by the first match in _cell_formatters
+_cell_formatter_by_type = {}
 
 
 def register_cell_formatter(type_or_class, formatter):
     """
     Register a default formatter for a type. A formatter is a function that takes four keyword arguments: table, column, row, value
     """
-    global _cell_formatters, _cell_formatters_types
     _cell_formatters[type_or_class] = formatter
-    _cell_formatters_types = tuple(_cell_formatters.keys())
+    _cell_formatter_by_type.clear()
+
+
+def _find_cell_formatter(value):
+    for type_, formatter in _cell_formatters.items():
+        if isinstance(value, type_):
+            return formatter
+    return None
+
+
+def _locale_bound_cell_formatters():
+    """
+    The default formatters that depend on the active language, with the
+    translations and formats resolved. `default_cell_formatter` uses these for
+    all the cells of a bound table, instead of resolving them for every cell.
+    """
+    yes = gettext('Yes')
+    no = gettext('No')
+
+    def bound_yes_no_formatter(value, **_):
+        if value is None:
+            return ''
+        if value == 1:  # boolean True is equal to 1
+            return yes
+        if value == 0:  # boolean False is equal to 0
+            return no
+        assert False, f"Unable to convert {value} to Yes/No"
+
+    def bound_date_format(format):
+        format = get_format(format)
+        return lambda value, **_: dateformat.format(value, format)
+
+    return {
+        yes_no_formatter: bound_yes_no_formatter,
+        datetime_formatter: bound_date_format('DATETIME_FORMAT'),
+        date_formatter: bound_date_format('DATE_FORMAT'),
+        time_formatter: bound_date_format('TIME_FORMAT'),
+    }
 
 
 def default_cell_formatter(table: 'Table', column: 'Column', row, value, **_):
-    if isinstance(value, _cell_formatters_types):
-        for type_, formatter in _cell_formatters.items():
-            if isinstance(value, type_):
-                value = formatter(table=table, column=column, row=row, value=value)
-                break
+    type_ = type(value)
+    try:
+        formatter = _cell_formatter_by_type[type_]
+    except KeyError:
+        formatter = _find_cell_formatter(value)
+        # Proxy objects can pass as instances of another class, so they are not cached on the type
+        if value.__class__ is type_:
+            _cell_formatter_by_type[type_] = formatter
+
+    if formatter is not None:
+        if table is not None:
+            bound_formatters = getattr(table, '_locale_bound_cell_formatters', None)
+            if bound_formatters is None:
+                bound_formatters = _locale_bound_cell_formatters()
+                table._locale_bound_cell_formatters = bound_formatters
+            formatter = bound_formatters.get(formatter, formatter)
+        value = formatter(table=table, column=column, row=row, value=value)
 
     if value is None:
         return ''
@@ -301,19 +379,73 @@ def default_cell_formatter(table: 'Table', column: 'Column', row, value, **_):
     return conditional_escape(value)
 
 
+def default_batch_key(row, **_):
+    pk = getattr(row, 'pk', None)
+    return id(row) if pk is None else pk
+
+
 def default_cell__value(column, row, **kwargs):
+    if column.batch_loader is not None:
+        return column.batch_values.get(column.batch_key(row=row))
     if column.attr is None:
         return None
     else:
         return getattr_path(row, evaluate_strict(column.attr, row=row, column=column, **kwargs))
 
 
+def is_deferred_path(deferred_loading, path):
+    """
+    Check if a relation along `path` is not loaded, given the
+    `query.deferred_loading` of a queryset.
+    """
+    names, defer = deferred_loading
+    if not names:
+        return False
+    parts = path.split('__')
+    for i in range(len(parts)):
+        prefix = '__'.join(parts[: i + 1])
+        if defer:
+            if prefix in names:
+                return True
+        elif prefix not in names and not any(x.startswith(prefix + '__') for x in names):
+            return True
+    return False
+
+
 class DataRetrievalMethods(Enum):
     attribute_access = auto()
     prefetch = auto()
     select = auto()
 
 
+def data_retrieval_plan(model, attr):
+    """
+    Walk the attribute path `attr` through the fields of `model`. Returns
+    `(select, prefetch, field)`: the path to `select_related`, the path to
+    `prefetch_related` and the path to load with `.only()`. Any of them can be
+    `None`. Raises `FieldDoesNotExist` if `attr` isn't a path of model fields.
+    """
+    parts = attr.split('__')
+    select = []
+    current_model = model
+    for i, part in enumerate(parts):
+        field = current_model._meta.pk if part == 'pk' else get_field(current_model, part)
+        is_last = i == len(parts) - 1
+        if not field.is_relation:
+            if not is_last:
+                raise FieldDoesNotExist(f'{attr} is not a path of model fields')
+            return '__'.join(select) or None, None, attr
+
+        if field.many_to_one and field.concrete or field.one_to_one and field.concrete:
+            select.append(part)
+            current_model = field.related_model
+            if is_last:
+                return '__'.join(select), None, attr
+        else:
+            # Reverse and many to many relations, and generic foreign keys
+            return '__'.join(select) or None, '__'.join(parts[: i + 1]), '__'.join(select) or None
+
+
 def default_icon__cell__format(column, value, **_):
     if not value:
         return ''
@@ -363,6 +495,8 @@ class Column(Part):
     header: Namespace = EvaluatedRefinable()
     data_retrieval_method = EvaluatedRefinable()
     render_column: bool = EvaluatedRefinable()
+    batch_loader: Callable = Refinable()
+    batch_key: Callable = Refinable()
 
     class Meta:
         filter = EMPTY
@@ -390,6 +524,8 @@ class Meta:
         header__template='iommi/table/header.html',
         header__url=None,
         render_column=True,
+        batch_loader=None,
+        batch_key=default_batch_key,
         row_group__include=False,
         row_group__template='iommi/table/row_group.html',
         row_group__tag='th',
@@ -418,6 +554,8 @@ def __init__(self, **kwargs):
         :param cell__url: callable that receives kw arguments: `table`, `column`, `row` and `value`.
         :param cell__url_title: callable that receives kw arguments: `table`, `column`, `row` and `value`.
         :param render_column: If set to `False` the column won't be rendered in the table, but still be available in `table.columns`. This can be useful if you want some other feature from a column like filtering.
+        :param batch_loader: callable that receives kw arguments: `table`, `column` and `rows`, where `rows` is the list of rows of the page being rendered, and returns a dict from the key of the row to value. It's called once per page, and the cells of the column get their value from the dict. The dict is available as `column.batch_values`.
+        :param batch_key: callable that receives the kw argument `row` and returns the key of the row in the dict from `batch_loader`. Default: the `pk` of the row, or `id(row)` for rows without a `pk`.
         """
 
         model_field = kwargs.get('model_field')
@@ -477,6 +615,7 @@ def on_bind(self) -> None:
         )
         self.declared_column = self._declared
         self.cell = Namespace(flatten(self.cell))
+        self.batch_values = {}
 
         # Not strict evaluate on purpose
         self.model = evaluate(self.model, **self.iommi_evaluate_parameters())
@@ -1046,24 +1185,33 @@ def __html__(self):
         if self.template:
             return render_template(self.iommi_parent().get_request(), self.template, self.iommi_evaluate_parameters())
 
-        return (
-            Fragment(
-                tag=self.tag,
-                attrs=self.attrs,
-                children__text=mark_safe('\n'.join(bound_cell.__html__() for bound_cell in self)),
+        children = mark_safe('\n'.join(bound_cell.__html__() for bound_cell in self))
+
+        if not self.get_table().compiled_row_fragment_is_plain(self):
+            return (
+                Fragment(
+                    tag=self.tag,
+                    attrs=self.attrs,
+                    children__text=children,
+                )
+                .bind(parent=self)
+                .__html__()
             )
-            .bind(parent=self)
-            .__html__()
-        )
+
+        if self.tag:
+            return format_html('<{}{}>{}</{}>', self.tag, self.attrs, children, self.tag)
+        else:
+            return children
 
     def __str__(self):
         return self.__html__()
 
     def __iter__(self):
-        for column in values(self.get_table().columns):
+        table = self.get_table()
+        for column in values(table.columns):
             if not column.render_column:
                 continue
-            yield self.cell_class(cells=self, column=column).refine_done(parent=self)
+            yield table.get_compiled_cell(self, column)(self)
 
     def __getitem__(self, name):
         column = self.iommi_parent().columns[name]
@@ -1095,6 +1243,11 @@ class CellConfig(RefinableObject, Tag):
 
 
 class Cell(CellConfig):
+    _attrs = None
+    # The static attrs of a compiled column, shared by its cells until they are accessed, see CompiledCell
+    _shared_attrs = None
+    _compiled_tags = None
+
     @dispatch
     def __init__(self, cells: Cells, column):
         kwargs = setdefaults_path(
@@ -1115,20 +1268,24 @@ def __init__(self, cells: Cells, column):
         self.row = cells.row
 
     def on_refine_done(self):
-        self._evaluate_parameters = merged(
-            self.column.iommi_evaluate_parameters(),
-            cells=self.cells,
-            column=self.column,
-            row=self.row,
-            bound_cell=self,
-        )
+        evaluate_parameters = ParameterScope.from_layer(
+            self.column._evaluate_parameters,
+            dict(
+                cells=self.cells,
+                column=self.column,
+                row=self.row,
+                bound_cell=self,
+            ),
+        ).flat()
+        self._evaluate_parameters = evaluate_parameters
 
-        self.value = evaluate_strict(self.value, **self._evaluate_parameters)
-        self._evaluate_parameters['value'] = self.value
-        self.url = evaluate_strict(self.url, **self._evaluate_parameters)
-        self.attrs = evaluate_attrs(self, **self._evaluate_parameters)
-        self.url_title = evaluate_strict(self.url_title, **self._evaluate_parameters)
-        self.tag = evaluate_strict(self.tag, **self._evaluate_parameters)
+        self.value = evaluate_strict(self.value, __signature=evaluate_parameters.signature, **evaluate_parameters)
+        evaluate_parameters['value'] = self.value
+        signature = evaluate_parameters.signature
+        self.url = evaluate_strict(self.url, __signature=signature, **evaluate_parameters)
+        self.attrs = evaluate_attrs(self, **evaluate_parameters)
+        self.url_title = evaluate_strict(self.url_title, __signature=signature, **evaluate_parameters)
+        self.tag = evaluate_strict(self.tag, __signature=signature, **evaluate_parameters)
 
     @property
     def iommi_dunder_path(self):
@@ -1137,14 +1294,33 @@ def iommi_dunder_path(self):
     def iommi_evaluate_parameters(self):
         return self._evaluate_parameters
 
+    @property
+    def attrs(self):
+        attrs = self._attrs
+        if attrs is self._shared_attrs and isinstance(attrs, Attrs):
+            # Copied on access, as the attrs, or the class and style dicts in them, might be changed
+            attrs = self._attrs = copy_attrs(attrs)
+        return attrs
+
+    @attrs.setter
+    def attrs(self, attrs):
+        self._attrs = attrs
+
     def __html__(self):
         cell__template = self.column.cell.template
         if cell__template:
             context = self._evaluate_parameters
             return render_template(self.table.get_request(), cell__template, context)
 
+        compiled_tags = self._compiled_tags
+        if compiled_tags is not None:
+            open_tag, close_tag, tag = compiled_tags
+            # The tags were rendered for the shared attrs, and are only valid while this cell hasn't touched them
+            if self._attrs is self._shared_attrs and self.tag == tag:
+                return format_html('{}{}{}', open_tag, self.render_cell_contents(), close_tag)
+
         if self.tag:
-            return format_html('<{}{}>{}</{}>', self.tag, self.attrs, self.render_cell_contents(), self.tag)
+            return format_html('<{}{}>{}</{}>', self.tag, self._attrs, self.render_cell_contents(), self.tag)
         else:
             return format_html('{}', self.render_cell_contents())
 
@@ -1178,6 +1354,118 @@ def get_request(self):
         return self.cells.get_request()
 
 
+def evaluate_compiled(func_or_value, signature, evaluate_parameters):
+    return evaluate(func_or_value, __signature=signature, __strict=True, **evaluate_parameters)
+
+
+class CompiledCell:
+    """
+    Internal class used in row rendering. This is the "compiled" form of the
+    cell config of a column in a bound table: the config is merged and
+    classified into static and dynamic parts once, so that creating the cell
+    for a row only evaluates the callables.
+
+    The first cell is created the normal way, and is used as the prototype
+    for the cells of the following rows.
+    """
+
+    def __init__(self, cells, column):
+        cell = cells.cell_class(cells=cells, column=column).refine_done(parent=cells)
+        self.first_cell = cell
+        self.column = column
+        self.cell_class = type(cell)
+        self.is_compiled = (
+            self.cell_class.__init__ is Cell.__init__ and self.cell_class.on_refine_done is Cell.on_refine_done
+        )
+        if not self.is_compiled:
+            return
+
+        config = cell.iommi_namespace
+        self.value_config = config.get('value')
+        self.dynamic = [(k, config.get(k)) for k in ('url', 'url_title', 'tag') if is_callable(config.get(k))]
+        self.attrs = config.get('attrs')
+        self.static_attrs = attrs_are_static(self.attrs)
+
+        self.prototype = dict(vars(cell))
+        self.evaluate_parameters = column.iommi_evaluate_parameters()
+        signature_parameters = dict.fromkeys([*self.evaluate_parameters, 'cells', 'column', 'row', 'bound_cell'])
+        self.signature = signature_from_kwargs(signature_parameters)
+        self.signature_with_value = signature_from_kwargs({**signature_parameters, 'value': None})
+
+        if self.static_attrs:
+            # The cells share one copy of the static attrs, and a cell copies them only when its attrs are accessed
+            shared_attrs = copy_attrs(cell._attrs) if isinstance(cell._attrs, Attrs) else cell._attrs
+            self.prototype['_attrs'] = shared_attrs
+            self.prototype['_shared_attrs'] = shared_attrs
+
+            if not any(k == 'tag' for k, _ in self.dynamic) and cell.tag:
+                self.prototype['_compiled_tags'] = (
+                    format_html('<{}{}>', cell.tag, shared_attrs),
+                    format_html('</{}>', cell.tag),
+                    cell.tag,
+                )
+
+    def __call__(self, cells):
+        first_cell = self._pop_first_cell(cells)
+        if first_cell is not None:
+            return first_cell
+
+        if not self.is_compiled or cells.cell_class is not self.cell_class:
+            return cells.cell_class(cells=cells, column=self.column).refine_done(parent=cells)
+
+        cell, evaluate_parameters = self._create_cell(cells)
+
+        for k, v in self.dynamic:
+            setattr(cell, k, evaluate_compiled(v, self.signature_with_value, evaluate_parameters))
+
+        if not self.static_attrs:
+            cell.attrs = self.attrs
+            cell.attrs = evaluate_attrs(cell, **evaluate_parameters)
+
+        return cell
+
+    def value(self, cells):
+        """Evaluate only the value of the cell for the row, without the rest of the cell config."""
+        first_cell = self._pop_first_cell(cells)
+        if first_cell is not None:
+            return first_cell.value
+
+        if not self.is_compiled or cells.cell_class is not self.cell_class:
+            return self(cells).value
+
+        cell, _ = self._create_cell(cells)
+        return cell.value
+
+    def _pop_first_cell(self, cells):
+        first_cell = self.first_cell
+        if first_cell is not None:
+            self.first_cell = None
+            if first_cell.cells is cells:
+                return first_cell
+        return None
+
+    def _create_cell(self, cells):
+        cell = object.__new__(self.cell_class)
+        cell.__dict__.update(self.prototype)
+        row = cells.row
+        cell._parent = cells
+        cell.cells = cells
+        cell.row = row
+
+        evaluate_parameters = {
+            **self.evaluate_parameters,
+            'cells': cells,
+            'column': self.column,
+            'row': row,
+            'bound_cell': cell,
+        }
+        cell._evaluate_parameters = evaluate_parameters
+
+        cell.value = evaluate_compiled(self.value_config, self.signature, evaluate_parameters)
+        evaluate_parameters['value'] = cell.value
+        return cell, evaluate_parameters
+
+
 class TemplateConfig(RefinableObject):
     template: str = Refinable()
 
@@ -1365,6 +1653,196 @@ def paginator__count(rows, **_):
         return None
 
 
+class ApproximateCount(int):
+    """A row count that is an estimate, see `cached_count`."""
+
+    is_approximate = True
+
+
+def postgresql_estimated_count(rows):
+    """
+    Estimate hook for `cached_count` that reads the row estimate of the
+    PostgreSQL planner. Returns `None`, so that the rows are counted, for
+    other databases and for tables that haven't been analyzed.
+    """
+    connection = connections[rows.db]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [rows.model._meta.db_table])
+        row = cursor.fetchone()
+    if row is None or row[0] <= 0:
+        # -1 (or 0 before PostgreSQL 14) means there is no estimate
+        return None
+    return int(row[0])
+
+
+def cached_count(*, timeout=60, max_entries=1000, cache_alias='default', estimate=None):
+    """
+    Create a count provider for `Paginator.count` that caches the counts of
+    querysets in the Django cache framework for `timeout` seconds. The cache
+    key is built from the database alias and the compiled SQL of the rows, so
+    each filtering of the table gets its own count. The most recently used
+    `max_entries` counts are also kept in process to save the round trip to
+    the cache.
+
+    `estimate` is called with the rows for tables that aren't filtered. If it
+    returns a number that is shown as the count (marked as approximate) instead
+    of counting the rows, see `postgresql_estimated_count`. The paginator
+    doesn't trust the estimate for paging: it fetches one row more than the
+    page to find out if there is a next page.
+
+    .. code-block:: python
+
+        Table(
+            auto__model=AuditLog,
+            parts__page__count=cached_count(timeout=300, estimate=postgresql_estimated_count),
+        )
+    """
+    recent = OrderedDict()
+    lock = Lock()
+
+    def count(rows, **_):
+        if not isinstance(rows, QuerySet):
+            return paginator__count(rows)
+
+        if estimate is not None and not rows.query.has_filters():
+            result = estimate(rows)
+            if result is not None:
+                return ApproximateCount(result)
+
+        rows = rows.order_by()
+        try:
+            sql, params = rows.query.get_compiler(using=rows.db).as_sql()
+        except EmptyResultSet:
+            return 0
+        key = 'iommi-count-' + sha1(repr((rows.db, sql, params)).encode()).hexdigest()
+
+        now = current_time()
+        with lock:
+            cached = recent.get(key)
+            if cached is not None and cached[0] > now:
+                recent.move_to_end(key)
+                return cached[1]
+
+        cache = caches[cache_alias]
+        cached = cache.get(key)
+        if cached is None or cached[0] <= now:
+            cached = (now + timeout, rows.count())
+            cache.set(key, cached, timeout)
+
+        with lock:
+            recent[key] = cached
+            recent.move_to_end(key)
+            while len(recent) > max_entries:
+                recent.popitem(last=False)
+
+        return cached[1]
+
+    return count
+
+
+class PaginationMethods(Enum):
+    offset = auto()
+    keyset = auto()
+    count_free = auto()
+
+
+def keyset_ordering(rows):
+    """
+    The ordering of `rows` as a list of `(path, descending)` tuples that ends
+    with a unique key, or `None` if `rows` can't be paginated by keyset.
+
+    Only querysets ordered by concrete, non-nullable model fields qualify.
+    The primary key is appended as a tie-breaker if it isn't already part
+    of the ordering.
+    """
+    if not isinstance(rows, QuerySet):
+        return None
+    query = rows.query
+    if query.is_sliced or query.extra_order_by:
+        return None
+
+    if query.order_by:
+        ordering = query.order_by
+    elif query.default_ordering:
+        ordering = rows.model._meta.ordering
+    else:
+        ordering = []
+
+    result = []
+    for x in ordering:
+        if not isinstance(x, str) or x == '?':
+            return None
+        descending = x.startswith('-')
+        path = x[1:] if descending else x
+        if path == 'pk':
+            return result + [(path, descending)]
+        names = path.split('__')
+        try:
+            fields = [get_field_path(rows.model, '__'.join(names[: i + 1])) for i in range(len(names))]
+        except (FieldDoesNotExist, AttributeError):
+            return None
+        # A nullable or multi-valued relation on the way drops or repeats rows in the join
+        if any(hop is None or hop.null or hop.many_to_many or hop.one_to_many for hop in fields[:-1]):
+            return None
+        field = fields[-1]
+        if field is None or not field.concrete or field.null or field.is_relation:
+            return None
+        result.append((path, descending))
+        if field.primary_key:
+            return result
+
+    return result + [('pk', result[0][1] if result else False)]
+
+
+def keyset_order_by(ordering, forward):
+    return [('-' if descending == forward else '') + path for path, descending in ordering]
+
+
+def keyset_filter(ordering, values, forward):
+    """
+    The equivalent of `WHERE (a, b, pk) > (x, y, z)` for the given ordering,
+    with each comparison flipped for descending fields and when going backward.
+    """
+    result = Q()
+    equal = Q()
+    for i, ((path, descending), value) in enumerate(zip(ordering, values)):
+        lookup = 'lt' if descending == forward else 'gt'
+        step = equal & Q(**{f'{path}__{lookup}': value})
+        result = step if i == 0 else result | step
+        equal &= Q(**{path: value})
+    return result
+
+
+class KeysetCursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder cuts datetimes and times down to milliseconds, but
+    the cursor has to compare equal to the value in the row.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime, time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_keyset_cursor(direction, values):
+    data = json.dumps([direction, values], cls=KeysetCursorEncoder)
+    return urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_keyset_cursor(cursor, length):
+    """Returns `(direction, values)`, or `None` if the cursor is invalid."""
+    try:
+        direction, values = json.loads(urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        return None
+    if direction not in ('next', 'previous') or not isinstance(values, list) or len(values) != length:
+        return None
+    return direction, values
+
+
 @with_meta
 class Paginator(Traversable):
     attrs: Attrs = SpecialEvaluatedRefinable()
@@ -1380,6 +1858,8 @@ class Paginator(Traversable):
     count: int = SpecialEvaluatedRefinable()
     slice = Refinable()
     show_always = Refinable()
+    method: PaginationMethods = Refinable()
+    lazy_count: bool = Refinable()
 
     class Meta:
         attrs__class = EMPTY
@@ -1402,14 +1882,23 @@ class Meta:
             max(1, (paginator.count - (paginator.min_page_size - 1))) / paginator.page_size
         ),
         slice=lambda top, bottom, rows, **_: rows[bottom:top],
+        method=PaginationMethods.offset,
+        lazy_count=False,
     )
     def __init__(self, **kwargs):
+        """
+        :param method: `PaginationMethods.offset` (the default) slices the rows by page number. `PaginationMethods.keyset` seeks past the last row of the previous page using the sort order plus the primary key, which stays fast on deep pages of big tables. Keyset pagination only shows previous/next links, and falls back to offset pagination if the rows are not a queryset ordered by concrete non-nullable fields (e.g. when sorting on a callable). `PaginationMethods.count_free` slices by page number like offset, but fetches one extra row to know if there is a next page instead of counting the rows.
+        :param lazy_count: for the pagination methods that don't count the rows, fetch the count from the `count` endpoint of the table after the page has loaded and show it in the paginator.
+        """
         super(Paginator, self).__init__(**kwargs)
 
     def on_refine_done(self):
         self.context = None
         self.page_size = None
         self.rows = None
+        self.keyset_ordering = None
+        self._count = None
+        self.count_is_approximate = False
         super(Paginator, self).on_refine_done()
 
     def on_bind(self) -> None:
@@ -1436,11 +1925,24 @@ def on_bind(self) -> None:
             **self.iommi_evaluate_parameters(),
         )
 
+        self._count = self.count
+        if self.page_size is not None and self.method == PaginationMethods.keyset:
+            self.keyset_ordering = keyset_ordering(rows)
+            if self.keyset_ordering is not None:
+                self._bind_keyset(request=request, table=table, rows=rows)
+                return
+
+        if self.page_size is not None and rows is not None and self.method == PaginationMethods.count_free:
+            self._bind_count_free(request=request, table=table, evaluate_parameters=evaluate_parameters)
+            return
+
+        number_of_pages = self.number_of_pages
         if self.page_size is None:
             self.number_of_pages = 1
             self.count = None
         else:
             self.count = evaluate_strict(self.count, **evaluate_parameters) if rows is not None else 0
+            self.count_is_approximate = getattr(self.count, 'is_approximate', False)
             if self.count is None:
                 self.number_of_pages = 1
             else:
@@ -1450,23 +1952,26 @@ def on_bind(self) -> None:
         page = evaluate_strict(self.page, **evaluate_parameters) if page is None else int(page)
         self.page = page
 
-        if self.page > self.number_of_pages:
-            self.page = self.number_of_pages
-        elif self.page < 1:
-            self.page = 1
+        if self.count_is_approximate:
+            self._paginate_approximate(evaluate_parameters=evaluate_parameters, number_of_pages=number_of_pages)
+        else:
+            if self.page > self.number_of_pages:
+                self.page = self.number_of_pages
+            elif self.page < 1:
+                self.page = 1
+
+            if self.number_of_pages != 1:
+                bottom = (self.page - 1) * self.page_size
+                top = bottom + self.page_size
+                if top + self.min_page_size - 1 >= self.count:
+                    top = self.count
+                paginated_rows = self.slice(**evaluate_parameters, bottom=bottom, top=top)
+                self.rows = paginated_rows
+            else:
+                self.rows = evaluate_parameters['rows']
 
         self.context = self.iommi_evaluate_parameters().copy()
 
-        if self.number_of_pages != 1:
-            bottom = (self.page - 1) * self.page_size
-            top = bottom + self.page_size
-            if top + self.min_page_size - 1 >= self.count:
-                top = self.count
-            paginated_rows = self.slice(**evaluate_parameters, bottom=bottom, top=top)
-            self.rows = paginated_rows
-        else:
-            self.rows = evaluate_parameters['rows']
-
         foo = self.page
         if foo <= self.adjacent_pages:
             foo = self.adjacent_pages + 1
@@ -1483,9 +1988,11 @@ def on_bind(self) -> None:
         if self.iommi_path in get:
             del get[self.iommi_path]
 
+        extra = get and (get.urlencode() + "&") or ""
         self.context.update(
             dict(
-                extra=get and (get.urlencode() + "&") or "",
+                extra=extra,
+                first_url=f'?{extra}{self.iommi_path}=1',
                 page_numbers=page_numbers,
                 show_first=1 not in page_numbers,
                 show_last=self.number_of_pages not in page_numbers,
@@ -1504,15 +2011,168 @@ def on_bind(self) -> None:
                 'page': self.page,
                 'pages': self.number_of_pages,
                 'hits': self.count,
+                'approximate': self.count_is_approximate,
+                'paginator': self,
+            }
+        )
+
+    def _paginate_approximate(self, *, evaluate_parameters, number_of_pages):
+        # The estimated count is only shown. Where the rows end is found by fetching one row more than the page.
+        def fetch(page):
+            bottom = (page - 1) * self.page_size
+            return list(self.slice(**evaluate_parameters, bottom=bottom, top=bottom + self.page_size + 1))
+
+        page = max(self.page, 1)
+        page_rows = fetch(page)
+        if not page_rows and page > 1:
+            # Past the end of the rows, so count them to find the last page
+            self.count = paginator__count(evaluate_parameters['rows'])
+            self.count_is_approximate = False
+            self.number_of_pages = evaluate_strict(number_of_pages, **evaluate_parameters)
+            page = self.number_of_pages
+            page_rows = fetch(page)
+
+        has_next = len(page_rows) > self.page_size
+        self.rows = page_rows[: self.page_size]
+        self.page = page
+        if has_next:
+            self.number_of_pages = max(self.number_of_pages, page + 1)
+        else:
+            # This is the last page, so the count is known
+            self.count = (page - 1) * self.page_size + len(self.rows)
+            self.count_is_approximate = False
+            self.number_of_pages = page
+
+    def _bind_keyset(self, *, request, table, rows):
+        ordering = self.keyset_ordering
+        cursor = request.GET.get(self.iommi_path) if request else None
+        cursor = decode_keyset_cursor(cursor, len(ordering)) if cursor else None
+
+        forward = cursor is None or cursor[0] == 'next'
+        page_rows = rows.order_by(*keyset_order_by(ordering, forward))
+        if cursor is not None:
+            try:
+                page_rows = page_rows.filter(keyset_filter(ordering, cursor[1], forward))
+            except (ValueError, TypeError, ValidationError):
+                cursor = None
+                forward = True
+                page_rows = rows.order_by(*keyset_order_by(ordering, forward))
+
+        page_rows = list(page_rows[: self.page_size + 1])
+        has_more = len(page_rows) > self.page_size
+        page_rows = page_rows[: self.page_size]
+        if forward:
+            has_next = has_more
+            has_previous = cursor is not None
+        else:
+            page_rows.reverse()
+            has_next = True
+            has_previous = has_more
+
+        def cursor_of(direction, row):
+            return encode_keyset_cursor(direction, [getattr_path(row, path) for path, _ in ordering])
+
+        self.rows = page_rows
+        self.count = None
+        self.number_of_pages = None
+        self.page = None
+
+        self._update_uncounted_context(
+            request=request,
+            table=table,
+            show_first=cursor is not None,
+            has_next=has_next and bool(page_rows),
+            has_previous=has_previous and bool(page_rows),
+            next=cursor_of('next', page_rows[-1]) if has_next and page_rows else None,
+            previous=cursor_of('previous', page_rows[0]) if has_previous and page_rows else None,
+        )
+
+    def _bind_count_free(self, *, request, table, evaluate_parameters):
+        page = request.GET.get(self.iommi_path) if request else None
+        page = evaluate_strict(self.page, **evaluate_parameters) if page is None else int(page)
+        page = max(page, 1)
+
+        def fetch(page):
+            bottom = (page - 1) * self.page_size
+            return list(self.slice(**evaluate_parameters, bottom=bottom, top=bottom + self.page_size + 1))
+
+        page_rows = fetch(page)
+        if not page_rows and page > 1:
+            # Past the end, and we don't know where the end is
+            page = 1
+            page_rows = fetch(page)
+
+        has_next = len(page_rows) > self.page_size
+        self.rows = page_rows[: self.page_size]
+        self.count = None
+        self.number_of_pages = None
+        self.page = page
+
+        self._update_uncounted_context(
+            request=request,
+            table=table,
+            show_first=page > 2,
+            has_next=has_next,
+            has_previous=page > 1,
+            next=page + 1 if has_next else None,
+            previous=page - 1 if page > 1 else None,
+            page=page,
+        )
+
+    def _update_uncounted_context(self, *, request, table, page=None, **kwargs):
+        get = params_of_request(request)
+        if self.iommi_path in get:
+            del get[self.iommi_path]
+        extra = get and (get.urlencode() + "&") or ""
+
+        self.context = self.iommi_evaluate_parameters().copy()
+        self.context.update(
+            {
+                'extra': extra,
+                'page_numbers': [],
+                'show_last': False,
+                'page_size': table.page_size,
+                'page': page,
+                'pages': None,
+                'hits': None,
+                'approximate': False,
+                'count_url': f'?{extra}{DISPATCH_PREFIX}{table.endpoints.count.iommi_path}' if self.lazy_count else None,
+                # The first page of keyset pagination is the one without a cursor
+                'first_url': f'?{extra}{self.iommi_path}=1' if self.keyset_ordering is None else f'?{extra}'.rstrip('&'),
                 'paginator': self,
+                **kwargs,
             }
         )
 
+    def total_count(self):
+        """
+        The number of rows. This is evaluated on demand for the pagination
+        methods that don't count the rows when bound.
+        """
+        assert self._is_bound, NOT_BOUND_MESSAGE
+        if self.count is not None:
+            return self.count
+        table = self.iommi_evaluate_parameters()['table']
+        rows = table.sorted_and_filtered_rows
+        if rows is None:
+            return 0
+        return evaluate_strict(self._count, page_size=self.page_size, rows=rows, **self.iommi_evaluate_parameters())
+
+    def is_empty(self):
+        assert self._is_bound, NOT_BOUND_MESSAGE
+        if self.count is not None and not self.count_is_approximate:
+            return not self.count
+        if isinstance(self.rows, QuerySet) and self.rows._result_cache is None:
+            return not self.rows.exists()
+        return not self.rows
+
     def own_evaluate_parameters(self):
         return dict(paginator=self)
 
     def is_paginated(self):
         assert self._is_bound, NOT_BOUND_MESSAGE
+        if self.number_of_pages is None:
+            return self.context['has_next'] or self.context['has_previous']
         return self.number_of_pages > 1
 
     def __html__(self):
@@ -1521,7 +2181,7 @@ def __html__(self):
             if self.page_size is None:
                 return ''
 
-            if self.number_of_pages <= 1:
+            if not self.is_paginated():
                 return ''
 
         return render_template(
@@ -1538,6 +2198,21 @@ class TableAutoConfig(AutoConfig):
     rows = Refinable()
 
 
+def endpoint__count(table, **_):
+    count = table.paginator.total_count()
+    return {
+        'count': count,
+        'approximate': getattr(count, 'is_approximate', False),
+    }
+
+
+class _Echo:
+    """File-like object for `csv.writer` that just returns the written line"""
+
+    def write(self, value):
+        return value
+
+
 def endpoint__csv(table, **_):
     columns = [c for c in values(table.columns) if c.extra_evaluated.get('report_name')]
     csv_safe_column_indexes = {i for i, c in enumerate(values(table.columns)) if 'csv_whitelist' in c.extra}
@@ -1569,26 +2244,33 @@ def safe_csv_value(value):
             return value
 
     def cell_value(cells, bound_column):
-        value = Cell(cells, bound_column).refine_done(parent=cells).value
+        value = table.get_compiled_cell(cells, bound_column).value(cells)
         return bound_column.extra_evaluated.get('report_value', value)
 
     def rows():
-        for cells in table.cells_for_rows(paginate=False):
+        for cells in table.cells_for_rows(paginate=False, iterator_chunk_size=table.stream_chunk_size):
             if isinstance(cells, Cells):
                 yield [cell_value(cells, bound_column) for bound_column in columns]
 
-    def write_csv_row(writer, row):
+    def csv_row(row):
         row_strings = [smart_text2(value) for value in row]
         safe_row = [v if i in csv_safe_column_indexes else safe_csv_value(v) for i, v in enumerate(row_strings)]
-        writer.writerow(safe_row)
+        return writer.writerow(safe_row)
 
-    f = StringIO()
-    writer = csv.writer(f)
-    writer.writerow(header)
-    for row in rows():
-        write_csv_row(writer, row)
+    def lines():
+        yield writer.writerow(header)
+        chunk = []
+        for row in rows():
+            chunk.append(csv_row(row))
+            if len(chunk) >= table.stream_chunk_size:
+                yield ''.join(chunk)
+                chunk = []
+        if chunk:
+            yield ''.join(chunk)
 
-    response = FileResponse(f.getvalue(), 'text/csv')
+    writer = csv.writer(_Echo())
+
+    response = StreamingHttpResponse(lines(), content_type='text/csv')
 
     # RFC 2183, RFC 2184
     response['Content-Disposition'] = smart_str(
@@ -1603,8 +2285,28 @@ def __init__(self, table):
         self.table = table
 
     def __html__(self):
+        streamed_bodies = getattr(self.table.iommi_root(), '_iommi_streamed_bodies', None)
+        if streamed_bodies is not None:
+            # Rendering for iommi.part.stream_root: the rows are produced by stream() later
+            marker = f'<!--iommi-stream-{uuid4().hex}-->'
+            streamed_bodies[marker] = self
+            return mark_safe(marker)
+
         return mark_safe('\n'.join([cells.__html__() for cells in self.table.cells_for_rows()]))
 
+    def stream(self):
+        chunk_size = self.table.stream_chunk_size
+        separator = ''
+        chunk = []
+        for cells in self.table.cells_for_rows(iterator_chunk_size=chunk_size):
+            chunk.append(cells.__html__())
+            if len(chunk) >= chunk_size:
+                yield separator + '\n'.join(chunk)
+                separator = '\n'
+                chunk = []
+        if chunk:
+            yield separator + '\n'.join(chunk)
+
 
 @declarative(Column, '_columns_dict', add_init_kwargs=False)
 @with_meta
@@ -1654,6 +2356,9 @@ class Meta:
     superheader: Namespace = Refinable()
     paginator: Paginator = Refinable()
     page_size: int = EvaluatedRefinable()
+    stream_chunk_size: int = Refinable()
+    auto_data_retrieval: bool = Refinable()
+    only_needed_fields = Refinable()
     actions_template: Union[str, Template] = EvaluatedRefinable()
     actions_below: bool = EvaluatedRefinable()
     tbody: Fragment = EvaluatedRefinable()
@@ -1690,6 +2395,7 @@ class Meta:
             'html': table.__html__(template='iommi/table/table_container.html')
         }
         endpoints__csv__func = endpoint__csv
+        endpoints__count__func = endpoint__count
 
         attrs = Namespace(
             {
@@ -1757,6 +2463,9 @@ def post_bulk_edit(table, queryset, updates, **_):
         bulk__title=gettext_lazy('Bulk change'),
         bulk_container__call_target=Fragment,
         page_size=DEFAULT_PAGE_SIZE,
+        stream_chunk_size=1000,
+        auto_data_retrieval=True,
+        only_needed_fields=False,
         superheader__attrs__class__superheader=True,
         superheader__template='iommi/table/header.html',
         tag='table',
@@ -1780,6 +2489,9 @@ def __init__(
         :param bulk_filter: filters to apply to the `QuerySet` before performing the bulk operation
         :param bulk_exclude: exclude filters to apply to the `QuerySet` before performing the bulk operation
         :param sortable: set this to `False` to turn off sorting for all columns
+        :param stream_chunk_size: the number of rows per chunk when the table is rendered with `render_to_streaming_response`. This is also the chunk size used for `QuerySet.iterator()`.
+        :param auto_data_retrieval: use `select_related` for the foreign keys and `prefetch_related` for the reverse and many to many relations in the `attr` paths of the columns. Default: `True`
+        :param only_needed_fields: set to `True` to only load the fields of the model that the columns use, via `QuerySet.only()`. If callbacks like `cell__url` use other fields, pass a list of those field paths instead of `True`. This is skipped if a column has an `attr` that isn't a model field path or a custom `cell__value`.
         """
         super(Table, self).__init__(**kwargs)
 
@@ -1833,6 +2545,12 @@ def on_refine_done(self):
         self.sorted_and_filtered_rows = None
         self.visible_rows = None
 
+        # The compiled row view model is created lazily per bound table
+        self._cells_template = None
+        self._compiled_cells = None
+        self._compiled_row_fragment_is_plain = None
+        self._prepared_rows = None
+
         refine_done_members(
             self,
             name='actions',
@@ -1874,7 +2592,11 @@ def add_hidden_all_pks_field(declared_bulk_fields):
             )
 
         form_class = self.get_meta().form_class
-        if self.model:
+        # Without a model the rows are filtered in memory, so only add a query if it's asked for
+        if self.model or any(
+            getattr(column, 'include', None) is not False and getattr(column.filter, 'include', None)
+            for column in values(self.iommi_namespace.columns)
+        ):
             # Query
             filters = Struct()
 
@@ -1922,6 +2644,7 @@ def add_hidden_all_pks_field(declared_bulk_fields):
             declared_filters = self.query.iommi_namespace.filters
             self.query = self.query.refine(Prio.table_defaults, filters=declared_filters)
 
+        if self.model:
             # Bulk
             field_class = self.get_meta().form_class.get_meta().member_class
 
@@ -2090,10 +2813,13 @@ def on_bind(self) -> None:
                 for x in values(self.columns)
                 if x.data_retrieval_method == DataRetrievalMethods.prefetch and x.attr
             ]
+            deferred_loading = self.sorted_and_filtered_rows.query.deferred_loading
             select = [
                 x.attr
                 for x in values(self.columns)
-                if x.data_retrieval_method == DataRetrievalMethods.select and x.attr
+                if x.data_retrieval_method == DataRetrievalMethods.select
+                and x.attr
+                and not is_deferred_path(deferred_loading, x.attr)
             ]
             if prefetch:
                 self.sorted_and_filtered_rows = self.sorted_and_filtered_rows.prefetch_related(*prefetch)
@@ -2102,8 +2828,72 @@ def on_bind(self) -> None:
                 self.sorted_and_filtered_rows = self.sorted_and_filtered_rows.select_related(*select)
                 self.rows = self.sorted_and_filtered_rows
 
+            self._plan_data_retrieval()
+
         self.bulk_container = self.bulk_container.bind(parent=self)
 
+    def _plan_data_retrieval(self):
+        rows = self.sorted_and_filtered_rows
+        if not self.auto_data_retrieval and not self.only_needed_fields:
+            return
+        if rows._fields is not None or rows.query.combinator:
+            # .values() and .union() querysets
+            return
+
+        select = set()
+        prefetch = set()
+        fields = set() if self.only_needed_fields is True else set(self.only_needed_fields or [])
+        can_use_only = bool(self.only_needed_fields) and not rows.query.deferred_loading[0]
+
+        # All included columns, not just the rendered ones, since the CSV export uses them too
+        for column in values(self.columns):
+            if column.cell.value is not default_cell__value:
+                can_use_only = False
+            elif column.batch_loader is not None:
+                # The value comes from the batch loader, not from the row
+                continue
+            if not isinstance(column.attr, str):
+                continue
+
+            try:
+                select_path, prefetch_path, field_path = data_retrieval_plan(rows.model, column.attr)
+            except FieldDoesNotExist:
+                can_use_only = False
+                continue
+
+            if column.data_retrieval_method == DataRetrievalMethods.attribute_access:
+                if select_path:
+                    select.add(select_path)
+                if prefetch_path:
+                    prefetch.add(prefetch_path)
+            if field_path:
+                fields.add(field_path)
+
+            if column.sortable and isinstance(column.sort_key, str):
+                try:
+                    sort_select_path, _, sort_field_path = data_retrieval_plan(rows.model, column.sort_key)
+                except FieldDoesNotExist:
+                    continue
+                if sort_select_path is None and sort_field_path:
+                    fields.add(sort_field_path)
+
+        if self.auto_data_retrieval:
+            # The rows can already be restricted with .only() or .defer(), and Django
+            # doesn't allow select_related through a deferred relation
+            select = {x for x in select if not is_deferred_path(rows.query.deferred_loading, x)}
+            if select:
+                rows = rows.select_related(*sorted(select))
+            if prefetch:
+                rows = rows.prefetch_related(*sorted(prefetch))
+
+        if can_use_only:
+            # A relation that is used as a whole must not be restricted by other columns using some of its fields
+            fields = {x for x in fields if not any(x.startswith(y + '__') for y in fields)}
+            rows = rows.only(*sorted(fields))
+
+        self.sorted_and_filtered_rows = rows
+        self.rows = rows
+
     def get_visible_rows(self):
         self.visible_rows = self.parts.page.rows
         return self.visible_rows
@@ -2158,38 +2948,53 @@ def render_actions(self):
         )
 
     def _prepare_auto_rowspan(self):
-        auto_rowspan_columns = [column for column in values(self.columns) if column.auto_rowspan]
-        if auto_rowspan_columns:
-            self.visible_rows = list(self.get_visible_rows())
-            no_value_set = object()
-            for column in auto_rowspan_columns:
-                if column.cell.attrs.get('rowspan', no_value_set) is not no_value_set:
-                    continue
+        no_value_set = object()
+        auto_rowspan_columns = [
+            column
+            for column in values(self.columns)
+            if column.auto_rowspan and column.cell.attrs.get('rowspan', no_value_set) is no_value_set
+        ]
+        if not auto_rowspan_columns:
+            return
 
-                rowspan_by_row = (
-                    {}
-                )  # cells for rows in this dict are displayed, if they're not in here, they get style="display: none"
-                prev_value = no_value_set
-                prev_row = no_value_set
-                for cells in self.cells_for_rows():
-                    value = Cell(cells, column).refine_done(parent=self).value
-                    if prev_value != value:
-                        rowspan_by_row[id(cells.row)] = 1
-                        prev_value = value
-                        prev_row = cells.row
-                    else:
-                        rowspan_by_row[id(prev_row)] += 1
-
-                def rowspan(row, **_):
-                    return rowspan_by_row[id(row)] if id(row) in rowspan_by_row else None
-
-                def auto_rowspan_style(row, **_):
-                    return 'none' if id(row) not in rowspan_by_row else ''
-
-                column.cell.attrs['rowspan'] = rowspan
-                if 'style' not in column.cell.attrs:
-                    column.cell.attrs['style'] = {}
-                column.cell.attrs['style']['display'] = auto_rowspan_style
+        # cells for rows in these dicts are displayed, if they're not in here, they get style="display: none"
+        rowspan_by_row_by_column = {column._name: {} for column in auto_rowspan_columns}
+        prev_by_column = {column._name: (no_value_set, None) for column in auto_rowspan_columns}
+        for _, cells in self._prepare_rows():
+            for column in auto_rowspan_columns:
+                rowspan_by_row = rowspan_by_row_by_column[column._name]
+                value = self.get_compiled_cell(cells, column).value(cells)
+                prev_value, prev_row = prev_by_column[column._name]
+                if prev_value != value:
+                    rowspan_by_row[id(cells.row)] = 1
+                    prev_by_column[column._name] = (value, cells.row)
+                else:
+                    rowspan_by_row[id(prev_row)] += 1
+
+        for column in auto_rowspan_columns:
+            rowspan_by_row = rowspan_by_row_by_column[column._name]
+
+            def rowspan(row, rowspan_by_row=rowspan_by_row, **_):
+                return rowspan_by_row[id(row)] if id(row) in rowspan_by_row else None
+
+            def auto_rowspan_style(row, rowspan_by_row=rowspan_by_row, **_):
+                return 'none' if id(row) not in rowspan_by_row else ''
+
+            column.cell.attrs['rowspan'] = rowspan
+            if 'style' not in column.cell.attrs:
+                column.cell.attrs['style'] = {}
+            column.cell.attrs['style']['display'] = auto_rowspan_style
+
+        # The cell config has changed, so the compiled cells are stale
+        self._compiled_cells = None
+
+    def _prepare_rows(self):
+        """Preprocess the visible rows and create their `Cells` once, to be shared by
+        everything that needs to look at the rows before they are rendered."""
+        if self._prepared_rows is None:
+            self.visible_rows = list(self.get_visible_rows())
+            self._prepared_rows = list(self._iter_prepared_rows(self.visible_rows))
+        return self._prepared_rows
 
     def _prepare_sorting(self):
         """Sort all the rows.
@@ -2286,32 +3091,104 @@ def _bind_headers(self):
     def own_evaluate_parameters(self):
         return dict(table=self)
 
-    def cells_for_rows(self, paginate=True):
-        """Yield a Cells instance for each visible row on the screen."""
+    def cells_for_rows(self, paginate=True, iterator_chunk_size=None):
+        """Yield a Cells instance for each visible row on the screen.
+
+        If `iterator_chunk_size` is given, a `QuerySet` that hasn't been evaluated
+        yet is iterated with `QuerySet.iterator()` so the rows are not cached."""
         assert self._is_bound, NOT_BOUND_MESSAGE
         if paginate:
             rows = self.get_visible_rows()
         else:
             rows = self.sorted_and_filtered_rows
+
+        if paginate and self._prepared_rows is not None:
+            prepared_rows = self._prepared_rows
+        else:
+            if iterator_chunk_size is not None and isinstance(rows, QuerySet) and rows._result_cache is None:
+                rows = rows.iterator(chunk_size=iterator_chunk_size)
+            prepared_rows = self._iter_prepared_rows(rows, batch_size=iterator_chunk_size)
+
+        for row_groups, cells in prepared_rows:
+            for column, value in row_groups:
+                # noinspection PyCallingNonCallable
+                yield self.row_group_class(**column.row_group, value=value).bind(parent=self).__html__()
+            yield cells
+
+    def _iter_prepared_rows(self, rows, batch_size=None):
+        # Yields the row group columns that change value before each row, and the Cells of the row
         preprocessed_rows = self.invoke_callback(self.preprocess_rows, rows=rows)
+        preprocessed_rows = (self._preprocess_row(row) for row in preprocessed_rows)
 
-        row_groups = [c for c in values(self.columns) if c.row_group.include]
-        row_group_values = {c._name: None for c in row_groups}
+        batch_columns = [c for c in values(self.columns) if c.batch_loader is not None]
+        if batch_columns:
+            preprocessed_rows = self._load_batches(preprocessed_rows, batch_columns, batch_size)
 
-        for i, row in enumerate(preprocessed_rows):
-            row = self.invoke_callback(self.preprocess_row, row=row)
-            assert row is not None, 'preprocess_row must return the row'
+        row_group_columns = [c for c in values(self.columns) if c.row_group.include]
+        row_group_values = {c._name: None for c in row_group_columns}
 
-            for column in row_groups:
+        for i, row in enumerate(preprocessed_rows):
+            row_groups = []
+            for column in row_group_columns:
                 v = getattr_path(row, column.attr)
-                old_value = row_group_values[column._name]
-                if old_value != v:
-                    # noinspection PyCallingNonCallable
-                    yield self.row_group_class(**column.row_group, value=v).bind(parent=self).__html__()
+                if row_group_values[column._name] != v:
+                    row_groups.append((column, v))
                 row_group_values[column._name] = v
 
+            yield row_groups, self.cells_for_row(row=row, row_index=i)
+
+    def _preprocess_row(self, row):
+        row = self.invoke_callback(self.preprocess_row, row=row)
+        assert row is not None, 'preprocess_row must return the row'
+        return row
+
+    def _load_batches(self, rows, columns, batch_size):
+        # Run the batch loaders once per batch of rows: the whole page, or each chunk when streaming
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            for column in columns:
+                column.batch_values = column.invoke_callback(column.batch_loader, rows=batch)
+            yield from batch
+            if batch_size is None:
+                return
+
+    def cells_for_row(self, row, row_index):
+        """Create a bound Cells instance for a row.
+
+        The row config is refined once per bound table into a template that is then bound once per row."""
+        if self.cells_class.__init__ is not Cells.__init__:
+            # noinspection PyCallingNonCallable
+            return self.cells_class(row=row, row_index=row_index, **self.row.as_dict()).bind(parent=self)
+
+        if self._cells_template is None:
             # noinspection PyCallingNonCallable
-            yield self.cells_class(row=row, row_index=i, **self.row.as_dict()).bind(parent=self)
+            self._cells_template = self.cells_class(row=None, row_index=None, **self.row.as_dict()).refine_done(
+                parent=self
+            )
+
+        cells = copy(self._cells_template)
+        cells.row = row
+        cells.row_index = row_index
+        return cells.bind(parent=self)
+
+    def get_compiled_cell(self, cells, column):
+        """Get the compiled cell config of a column. `cells` is used to create the first cell if needed."""
+        if self._compiled_cells is None:
+            self._compiled_cells = {}
+        compiled_cell = self._compiled_cells.get(column._name)
+        if compiled_cell is None or compiled_cell.column is not column:
+            compiled_cell = CompiledCell(cells, column)
+            self._compiled_cells[column._name] = compiled_cell
+        return compiled_cell
+
+    def compiled_row_fragment_is_plain(self, cells):
+        """Rows can be rendered without a `Fragment` if the style doesn't configure `Fragment`."""
+        if self._compiled_row_fragment_is_plain is None:
+            self._compiled_row_fragment_is_plain = not get_style_object(cells).resolve(Fragment())
+        return self._compiled_row_fragment_is_plain
 
     @classmethod
     @dispatch()
@@ -2386,6 +3263,7 @@ def __html__(self, *, template=None, render=None):
 
         if self.query and self.query.form and not self.query.form.is_valid():
             self.visible_rows = []
+            self._prepared_rows = None
             self.paginator.count = 0
 
         return render(request=request, template=template or self.template, context=context)
@@ -1,18 +1,23 @@
 import json
 from collections import defaultdict
+from unittest import mock
 from datetime import (
     date,
     datetime,
     time,
+    timedelta,
 )
 
 import pytest
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import (
     F,
     QuerySet,
 )
 from django.http import HttpResponse
 from django.test import override_settings
+from django.utils.translation import gettext
 
 from docs.models import (
     Album,
@@ -29,6 +34,7 @@
     mark_safe,
     Template,
 )
+from iommi.attrs import Attrs
 from iommi.base import (
     items,
     keys,
@@ -64,10 +70,20 @@
     SQL_DEBUG_LEVEL_ALL,
 )
 from iommi.table import (
+    _cell_formatter_by_type,
     bulk_delete__post_handler,
+    cached_count,
     Column,
+    data_retrieval_plan,
     datetime_formatter,
+    decode_keyset_cursor,
+    default_cell_formatter,
+    encode_keyset_cursor,
+    is_deferred_path,
+    keyset_ordering,
     ordered_by_on_list,
+    PaginationMethods,
+    postgresql_estimated_count,
     register_cell_formatter,
     Struct,
     Table,
@@ -97,6 +113,7 @@
     TBar2,
     TBaz,
     TFoo,
+    TNullableBar,
 )
 
 register_search_fields(model=TFoo, search_fields=['b'], allow_non_unique=True, overwrite=True)
@@ -1768,6 +1785,95 @@ class TestTable(NoSortTable):
     )
 
 
+def test_compiled_cells(NoSortTable):
+    calls = defaultdict(int)
+
+    def value(row, **_):
+        calls['value'] += 1
+        return row.foo
+
+    def url(value, **_):
+        calls['url'] += 1
+        return f'/{value}/'
+
+    class TestTable(NoSortTable):
+        foo = Column(
+            cell__value=value,
+            cell__url=url,
+            cell__url_title='static title',
+            cell__attrs__class__static=True,
+        )
+        bar = Column(
+            cell__attrs__class__dynamic=lambda row, **_: row.bar,
+        )
+
+    rows = [Struct(foo=1, bar=True), Struct(foo=2, bar=False)]
+
+    verify_table_html(
+        table=TestTable(rows=rows),
+        # language=html
+        expected_html="""
+            <table class="table" data-endpoint="/endpoints/tbody" data-iommi-id="">
+                <thead>
+                    <tr>
+                        <th class="first_column subheader"> Foo </th>
+                        <th class="first_column subheader"> Bar </th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td class="static"> <a href="/1/" title="static title"> 1 </a> </td>
+                        <td class="dynamic"> Yes </td>
+                    </tr>
+                    <tr>
+                        <td class="static"> <a href="/2/" title="static title"> 2 </a> </td>
+                        <td> No </td>
+                    </tr>
+                </tbody>
+            </table>
+        """,
+    )
+    assert calls == dict(value=2, url=2)
+
+
+def test_compiled_cells_are_cells(NoSortTable):
+    class TestTable(NoSortTable):
+        foo = Column()
+
+    table = TestTable(rows=[Struct(foo=1), Struct(foo=2)]).bind(request=req('get'))
+    cells_by_row = [list(cells) for cells in table.cells_for_rows()]
+
+    assert [[cell.value for cell in cells] for cells in cells_by_row] == [[1], [2]]
+    first, second = [cells[0] for cells in cells_by_row]
+    assert type(second) is type(first)
+    assert second.cells is not first.cells
+    assert second.row is second.cells.row
+    assert second.iommi_evaluate_parameters()['bound_cell'] is second
+    assert second.iommi_evaluate_parameters()['value'] == 2
+
+
+def test_compiled_cells_have_their_own_attrs(NoSortTable):
+    class TestTable(NoSortTable):
+        foo = Column(cell__attrs__class__static=True, cell__attrs__title='foo')
+
+    table = TestTable(rows=[Struct(foo=1), Struct(foo=2), Struct(foo=3)]).bind(request=req('get'))
+    first, second, third = [list(cells)[0] for cells in table.cells_for_rows()]
+    # Shared until accessed
+    assert second._attrs is third._attrs
+    assert third.__html__() == '<td class="static" title="foo">3</td>'
+    assert len({id(first.attrs), id(second.attrs), id(third.attrs)}) == 3
+    assert second.attrs['class'] is not third.attrs['class']
+
+    second.attrs['class']['changed'] = True
+    second.attrs['title'] = 'bar'
+    assert third.attrs == {'class': {'static': True}, 'style': {}, 'title': 'foo'}
+    assert second.__html__() == '<td class="changed static" title="bar">2</td>'
+    assert third.__html__() == '<td class="static" title="foo">3</td>'
+
+    third.attrs = Attrs(None, title='baz')
+    assert third.__html__() == '<td title="baz">3</td>'
+
+
 def test_auto_rowspan_and_render_twice(NoSortTable):
     class TestTable(NoSortTable):
         foo = Column(auto_rowspan=True)
@@ -1799,6 +1905,47 @@ class TestTable(NoSortTable):
     verify_table_html(table=t, expected_html=expected_html)
 
 
+def test_auto_rowspan_and_row_group_single_pass(NoSortTable):
+    preprocessed = []
+
+    def preprocess_row(row, **_):
+        preprocessed.append(row)
+        return row
+
+    class TestTable(NoSortTable):
+        group = Column(row_group__include=True)
+        foo = Column(auto_rowspan=True)
+        bar = Column(auto_rowspan=True)
+
+    rows = [
+        Struct(group='a', foo=1, bar=1),
+        Struct(group='a', foo=1, bar=2),
+        Struct(group='b', foo=2, bar=2),
+    ]
+
+    t = TestTable(rows=rows, preprocess_row=preprocess_row).bind(request=req('get'))
+    verify_table_html(
+        table=t,
+        find__name='tbody',
+        # language=html
+        expected_html="""
+            <tbody>
+                <tr> <th colspan="99"> a </th> </tr>
+                <tr> <td> a </td> <td rowspan="2"> 1 </td> <td rowspan="1"> 1 </td> </tr>
+                <tr> <td> a </td> <td style="display: none"> 1 </td> <td rowspan="2"> 2 </td> </tr>
+                <tr> <th colspan="99"> b </th> </tr>
+                <tr> <td> b </td> <td rowspan="1"> 2 </td> <td style="display: none"> 2 </td> </tr>
+            </tbody>
+        """,
+    )
+    assert preprocessed == rows
+
+    # The rows prepared for the rowspans are the ones rendered
+    cells = [x for x in t.cells_for_rows() if not isinstance(x, str)]
+    assert cells == [x for _, x in t._prepared_rows]
+    assert preprocessed == rows
+
+
 def test_auto_rowspan_fail_on_override():
     with pytest.raises(AssertionError) as e:
         Table(
@@ -1879,6 +2026,34 @@ def __str__(self):
     )
 
 
+@pytest.fixture
+def restore_cell_formatters():
+    with mock.patch.dict('iommi.table._cell_formatters'):
+        yield
+    _cell_formatter_by_type.clear()
+
+
+def test_default_formatter_dispatch_cache(restore_cell_formatters):
+    class OtherType:
+        def __str__(self):
+            return 'other'
+
+    assert default_cell_formatter(table=None, column=None, row=None, value=OtherType()) == 'other'
+    register_cell_formatter(OtherType, lambda value, **_: 'sentinel')
+    assert default_cell_formatter(table=None, column=None, row=None, value=OtherType()) == 'sentinel'
+
+
+@pytest.mark.django_db
+def test_default_formatters_resolve_translations_once_per_table():
+    with mock.patch('iommi.table.gettext', wraps=gettext) as mock_gettext:
+        table = Table(
+            columns__foo=Column(),
+            rows=[Struct(foo=x) for x in [True, False, True, None]],
+        ).bind(request=req('get'))
+        assert [cells['foo'].render_formatted() for cells in table.cells_for_rows()] == ['Yes', 'No', 'Yes', '']
+        assert mock_gettext.call_count == 2
+
+
 def test_missing_choices():
     with pytest.raises(AssertionError, match='To use Column.choice, you must pass the choices list'):
         Column.choice().refine_done()
@@ -2763,6 +2938,32 @@ def test_csv_pagination():
     )
 
 
+@pytest.mark.django_db
+def test_csv_streaming():
+    for i in range(5):
+        CSVExportTestModel.objects.create(a=i, b='a', c=1.5, danger=f'@{i}')
+    t = Table(
+        auto__model=CSVExportTestModel,
+        columns__a__extra_evaluated__report_name='A',
+        columns__c__extra_evaluated__report_name='C',
+        columns__c__extra_evaluated__report_value='constant',
+        columns__danger__extra_evaluated__report_name='DANGER',
+        extra_evaluated__report_name='foo',
+        stream_chunk_size=2,
+    ).bind(request=req('get', **{'/csv': ''}))
+    response = t.render_to_response()
+    assert response.streaming
+    chunks = [x.decode().replace('\r\n', '\n') for x in response.streaming_content]
+    assert chunks == [
+        'A,C,DANGER\n',
+        '0,constant,\t@0\n1,constant,\t@1\n',
+        '2,constant,\t@2\n3,constant,\t@3\n',
+        '4,constant,\t@4\n',
+    ]
+    # The rows are iterated without filling the QuerySet cache
+    assert t.sorted_and_filtered_rows._result_cache is None
+
+
 @pytest.mark.django_db
 def test_query_from_indexes():
     t = Table(
@@ -2856,6 +3057,492 @@ def test_paginator_clamping():
     assert t.bind(request=req('get', page='11')).paginator.page == 10
 
 
+@pytest.mark.django_db
+def test_keyset_pagination():
+    for i in range(7):
+        TFoo.objects.create(a=i % 3, b=str(i))
+
+    def bind(**params):
+        return Table(
+            auto__model=TFoo,
+            page_size=3,
+            parts__page__method=PaginationMethods.keyset,
+            columns__a__sortable=True,
+        ).bind(request=req('get', **params))
+
+    def page_of(table):
+        return [(x.a, x.b) for x in table.visible_rows]
+
+    t = bind(order='-a')
+    t.get_visible_rows()
+    assert t.paginator.keyset_ordering == [('a', True), ('pk', True)]
+    assert page_of(t) == [(2, '5'), (2, '2'), (1, '4')]
+    assert t.paginator.is_paginated()
+    assert t.paginator.context['has_previous'] is False
+    assert t.paginator.context['hits'] is None
+
+    t = bind(order='-a', page=t.paginator.context['next'])
+    t.get_visible_rows()
+    assert page_of(t) == [(1, '1'), (0, '6'), (0, '3')]
+    assert t.paginator.context['has_previous'] is True
+    assert t.paginator.context['has_next'] is True
+    second_page = t.paginator.context
+
+    t = bind(order='-a', page=second_page['next'])
+    t.get_visible_rows()
+    assert page_of(t) == [(0, '0')]
+    assert t.paginator.context['has_next'] is False
+
+    t = bind(order='-a', page=second_page['previous'])
+    t.get_visible_rows()
+    assert page_of(t) == [(2, '5'), (2, '2'), (1, '4')]
+    assert t.paginator.context['has_previous'] is False
+    assert t.paginator.context['has_next'] is True
+
+    content = t.__html__()
+    assert 'aria-label="Previous Page"' not in content
+    assert 'aria-label="Next Page"' in content
+
+    # Garbage cursors give the first page
+    for page in ['1', 'garbage', 'WyJuZXh0IiwgWyJmb28iLCAxXV0']:
+        t = bind(order='-a', page=page)
+        t.get_visible_rows()
+        assert page_of(t) == [(2, '5'), (2, '2'), (1, '4')], page
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_fallback():
+    for i in range(4):
+        TFoo.objects.create(a=i, b=str(i))
+
+    t = Table(
+        auto__model=TFoo,
+        page_size=2,
+        parts__page__method=PaginationMethods.keyset,
+        columns__a__sortable=True,
+        sorter=lambda rows, descending, **_: sorted(rows, key=lambda row: -row.a, reverse=descending),
+    ).bind(request=req('get', order='a', page='2'))
+    assert [x.a for x in t.get_visible_rows()] == [1, 0]
+    assert t.paginator.keyset_ordering is None
+    assert t.paginator.number_of_pages == 2
+
+    assert keyset_ordering(TFoo.objects.all()) == [('pk', False)]
+    assert keyset_ordering(TFoo.objects.order_by('b', '-a')) == [('b', False), ('a', True), ('pk', False)]
+    assert keyset_ordering(TFoo.objects.order_by('?')) is None
+    assert keyset_ordering(TFoo.objects.order_by(F('a').desc())) is None
+    assert keyset_ordering(TBar.objects.order_by('foo')) is None
+    assert keyset_ordering(TBar.objects.order_by('foo__a')) == [('foo__a', False), ('pk', False)]
+    assert keyset_ordering(TBar2.objects.order_by('bar__foo__a')) == [('bar__foo__a', False), ('pk', False)]
+    assert keyset_ordering(TNullableBar.objects.order_by('foo__a')) is None
+    assert keyset_ordering(TBaz.objects.order_by('foo__a')) is None
+    assert keyset_ordering([1, 2]) is None
+
+
+def test_keyset_cursor_microseconds():
+    value = datetime(2020, 1, 1, 0, 0, 0, 123456)
+    cursor = encode_keyset_cursor('next', [value, time(1, 2, 3, 456789), 5])
+    assert decode_keyset_cursor(cursor, 3) == ('next', ['2020-01-01T00:00:00.123456', '01:02:03.456789', 5])
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_on_microsecond_timestamps():
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+
+    start = timezone.now().replace(microsecond=0)
+    for i in range(5):
+        # All in the same millisecond
+        User.objects.create(username=f'user{i}', date_joined=start + timedelta(microseconds=(5 - i) * 10))
+
+    def bind(**params):
+        return Table(
+            rows=User.objects.order_by('date_joined'),
+            columns__username=Column(),
+            page_size=2,
+            parts__page__method=PaginationMethods.keyset,
+        ).bind(request=req('get', **params))
+
+    usernames = []
+    t = bind()
+    for _ in range(5):
+        usernames += [x.username for x in t.get_visible_rows()]
+        if not t.paginator.context['has_next']:
+            break
+        t = bind(page=t.paginator.context['next'])
+
+    assert usernames == ['user4', 'user3', 'user2', 'user1', 'user0']
+
+    # The first page link drops the cursor instead of relying on an invalid one
+    assert t.paginator.context['first_url'] == '?'
+    assert 'href="?"' in t.__html__()
+
+
+@pytest.mark.django_db
+def test_count_free_pagination(monkeypatch):
+    for i in range(5):
+        TFoo.objects.create(a=i, b=str(i))
+
+    def bind(**params):
+        return Table(
+            auto__model=TFoo,
+            page_size=2,
+            parts__page__method=PaginationMethods.count_free,
+        ).bind(request=req('get', **params))
+
+    t = bind()
+    with monkeypatch.context() as m:
+        m.setattr(QuerySet, 'count', lambda self: pytest.fail('Should not count'))
+        assert [x.a for x in t.get_visible_rows()] == [0, 1]
+    assert t.paginator.count is None
+    assert t.paginator.is_paginated()
+    assert t.paginator.context['has_next'] is True
+    assert t.paginator.context['has_previous'] is False
+    assert t.paginator.context['hits'] is None
+    assert t.paginator.context['count_url'] is None
+
+    t = bind(page='3')
+    assert [x.a for x in t.get_visible_rows()] == [4]
+    assert t.paginator.context['has_next'] is False
+    assert t.paginator.context['previous'] == 2
+    content = t.__html__()
+    assert 'aria-label="Previous Page"' in content
+    assert 'aria-label="Next Page"' not in content
+    assert 'aria-label="Last Page"' not in content
+
+    # Past the end gives the first page
+    t = bind(page='17')
+    assert [x.a for x in t.get_visible_rows()] == [0, 1]
+
+    # Exactly one page
+    t = bind(a='1')
+    assert [x.a for x in t.get_visible_rows()] == [0, 1]
+    t = Table(
+        auto__model=TFoo,
+        rows=TFoo.objects.filter(a__lt=2),
+        page_size=2,
+        parts__page__method=PaginationMethods.count_free,
+    ).bind(request=req('get'))
+    assert t.get_visible_rows() is not None
+    assert not t.paginator.is_paginated()
+    assert t.paginator.total_count() == 2
+
+
+@pytest.mark.django_db
+def test_count_free_pagination_lazy_count():
+    for i in range(5):
+        TFoo.objects.create(a=i, b=str(i))
+
+    table = Table(
+        auto__model=TFoo,
+        page_size=2,
+        columns__a__filter__include=True,
+        parts__page__method=PaginationMethods.count_free,
+        parts__page__lazy_count=True,
+    )
+    t = table.bind(request=req('get', a='3'))
+    assert t.get_visible_rows() is not None
+    assert t.paginator.context['count_url'] == '?a=3&/count'
+
+    t = table.bind(request=req('get', page='2'))
+    content = t.__html__()
+    assert 'data-endpoint="?/count"' in content
+
+    response = table.bind(request=req('get', **{'/count': ''})).render_to_response()
+    assert json.loads(response.content) == {'count': 5, 'approximate': False}
+
+    response = table.bind(request=req('get', a='3', **{'/count': ''})).render_to_response()
+    assert json.loads(response.content) == {'count': 1, 'approximate': False}
+
+
+@pytest.mark.django_db
+def test_empty_message_without_count():
+    table = Table(
+        auto__model=TFoo,
+        page_size=2,
+        empty_message='Nothing here',
+        parts__page__method=PaginationMethods.count_free,
+    )
+    assert 'Nothing here' in table.bind(request=req('get')).__html__()
+
+    TFoo.objects.create(a=1, b='1')
+    assert 'Nothing here' not in table.bind(request=req('get')).__html__()
+    assert 'Nothing here' not in table.refine(page_size=None).bind(request=req('get')).__html__()
+
+
+@pytest.mark.django_db
+def test_cached_count(monkeypatch):
+    cache.clear()
+    for i in range(5):
+        TFoo.objects.create(a=i, b=str(i))
+
+    count = cached_count(timeout=10, max_entries=2)
+    assert count(rows=TFoo.objects.all()) == 5
+    assert count(rows=TFoo.objects.filter(a__lt=2)) == 2
+    assert count(rows=[1, 2, 3]) == 3
+    assert count(rows=TFoo.objects.filter(pk__in=[])) == 0
+    assert count(rows=TFoo.objects.filter(a__lt=3)) == 3
+
+    TFoo.objects.create(a=5, b='5')
+    with monkeypatch.context() as m:
+        m.setattr(QuerySet, 'count', lambda self: pytest.fail('Should be cached'))
+        assert count(rows=TFoo.objects.filter(a__lt=3)) == 3
+        assert count(rows=TFoo.objects.filter(a__lt=2)) == 2
+        # Evicted from the process local cache, but still in the django cache
+        assert count(rows=TFoo.objects.all()) == 5
+        assert count(rows=TFoo.objects.order_by('-a')) == 5, 'ordering should not matter'
+
+    # The timeout has passed
+    monkeypatch.setattr('iommi.table.current_time', lambda: 10**12)
+    assert count(rows=TFoo.objects.all()) == 6
+
+    table = Table(
+        auto__model=TFoo,
+        page_size=2,
+        parts__page__count=count,
+    ).bind(request=req('get'))
+    assert table.paginator.count == 6
+    assert table.paginator.number_of_pages == 3
+
+
+@pytest.mark.django_db
+def test_cached_count_estimate():
+    cache.clear()
+    for i in range(5):
+        TFoo.objects.create(a=i, b=str(i))
+
+    count = cached_count(estimate=lambda rows: 1000)
+    assert count(rows=TFoo.objects.all()) == 1000
+    assert count(rows=TFoo.objects.all()).is_approximate
+    assert count(rows=TFoo.objects.filter(a__lt=2)) == 2
+    assert not getattr(count(rows=TFoo.objects.filter(a__lt=2)), 'is_approximate', False)
+
+    count = cached_count(estimate=lambda rows: None)
+    assert count(rows=TFoo.objects.all()) == 5
+
+    table = Table(
+        auto__model=TFoo,
+        page_size=2,
+        parts__page__count=cached_count(estimate=postgresql_estimated_count),
+        parts__page__template=Template('{% if approximate %}~{% endif %}{{ hits }}'),
+    ).bind(request=req('get'))
+    assert table.paginator.__html__() == '5'
+    assert table.paginator.count_is_approximate is False
+
+    table = Table(
+        auto__model=TFoo,
+        page_size=2,
+        parts__page__count=cached_count(estimate=lambda rows: 1000),
+        parts__page__template=Template('{% if approximate %}~{% endif %}{{ hits }}'),
+    )
+    assert table.bind(request=req('get')).paginator.__html__() == '~1000'
+
+    response = table.bind(request=req('get', **{'/count': ''})).render_to_response()
+    assert json.loads(response.content) == {'count': 1000, 'approximate': True}
+
+    # The default templates mark the estimated last page
+    table = Table(auto__model=TFoo, page_size=2, parts__page__count=cached_count(estimate=lambda rows: 1000))
+    assert 'title="~500">~&raquo;</a>' in table.bind(request=req('get')).paginator.__html__()
+
+
+@pytest.mark.django_db
+def test_estimated_count_does_not_change_the_pages():
+    cache.clear()
+    for i in range(5):
+        TFoo.objects.create(a=i, b=str(i))
+
+    def table(estimate):
+        return Table(
+            auto__model=TFoo,
+            page_size=2,
+            default_sort_order='a',
+            parts__page__count=cached_count(estimate=lambda rows: estimate),
+        )
+
+    def bind(estimate, page):
+        return table(estimate).bind(request=req('get', page=str(page))).paginator
+
+    # An underestimate doesn't hide the last rows
+    paginator = bind(1, 1)
+    assert paginator.count_is_approximate
+    assert paginator.number_of_pages == 2
+    assert [x.a for x in paginator.rows] == [0, 1]
+    paginator = bind(1, 3)
+    assert [x.a for x in paginator.rows] == [4]
+    assert paginator.number_of_pages == 3
+    assert paginator.count == 5
+    assert not paginator.count_is_approximate
+
+    # An overestimate doesn't add empty pages at the end
+    paginator = bind(1000, 3)
+    assert [x.a for x in paginator.rows] == [4]
+    assert paginator.number_of_pages == 3
+    paginator = bind(1000, 7)
+    assert [x.a for x in paginator.rows] == [4]
+    assert paginator.page == 3
+    assert paginator.count == 5
+
+    # A table with rows is not empty even if the estimate says so
+    assert not bind(0, 1).is_empty()
+    assert 'title="~500">~&raquo;</a>' in bind(1000, 1).__html__()
+
+
+def test_data_retrieval_plan():
+    assert data_retrieval_plan(TBar2, 'pk') == (None, None, 'pk')
+    assert data_retrieval_plan(TBar2, 'bar') == ('bar', None, 'bar')
+    assert data_retrieval_plan(TBar2, 'bar__foo__a') == ('bar__foo', None, 'bar__foo__a')
+    assert data_retrieval_plan(TBar2, 'bar__foo__tbar_set') == ('bar__foo', 'bar__foo__tbar_set', 'bar__foo')
+    assert data_retrieval_plan(TFoo, 'tbar_set') == (None, 'tbar_set', None)
+    with pytest.raises(FieldDoesNotExist):
+        data_retrieval_plan(TFoo, 'a__b')
+    with pytest.raises(FieldDoesNotExist):
+        data_retrieval_plan(TFoo, 'not_a_field')
+
+
+@pytest.mark.django_db
+def test_auto_data_retrieval():
+    foo = TFoo.objects.create(a=1, b='foo')
+    bar = TBar.objects.create(foo=foo, c=True)
+    TBar2.objects.create(bar=bar)
+
+    t = Table(
+        auto__model=TBar2,
+        columns__a=Column(attr='bar__foo__a'),
+    ).bind(request=req('get'))
+    assert t.sorted_and_filtered_rows.query.select_related == {'bar': {'foo': {}}}
+    assert t.sorted_and_filtered_rows.query.deferred_loading == (frozenset(), True)
+
+    t = Table(
+        auto__model=TFoo,
+        columns__tbar_set=Column(cell__format=lambda value, **_: len(value.all())),
+    ).bind(request=req('get'))
+    assert t.sorted_and_filtered_rows._prefetch_related_lookups == ('tbar_set',)
+
+    t = Table(
+        auto__model=TBar2,
+        auto_data_retrieval=False,
+        columns__a=Column(attr='bar__foo__a'),
+    ).bind(request=req('get'))
+    assert t.sorted_and_filtered_rows.query.select_related == {'bar': {}}
+
+
+@pytest.mark.django_db
+def test_auto_data_retrieval_respects_deferred_fields():
+    foo = TFoo.objects.create(a=1, b='foo')
+    TBar.objects.create(foo=foo, c=True)
+
+    def bind(rows):
+        return Table(auto__model=TBar, rows=rows, columns__a=Column(attr='foo__a')).bind(request=req('get'))
+
+    t = bind(TBar.objects.only('c'))
+    assert t.sorted_and_filtered_rows.query.select_related is False
+    assert '<td>1</td>' in t.__html__()
+
+    t = bind(TBar.objects.defer('foo'))
+    assert t.sorted_and_filtered_rows.query.select_related is False
+    t.__html__()
+
+    t = bind(TBar.objects.only('c', 'foo__a'))
+    assert t.sorted_and_filtered_rows.query.select_related == {'foo': {}}
+    t.__html__()
+
+    assert not is_deferred_path((frozenset(), True), 'foo__bar')
+    assert is_deferred_path((frozenset({'foo'}), True), 'foo__bar')
+    assert not is_deferred_path((frozenset({'foo'}), False), 'foo')
+    assert is_deferred_path((frozenset({'foo__a'}), False), 'foo__bar')
+
+
+@pytest.mark.django_db
+def test_only_needed_fields():
+    foo = TFoo.objects.create(a=1, b='foo')
+    TBar.objects.create(foo=foo, c=True)
+
+    def bind(**kwargs):
+        return Table(auto__model=TBar, only_needed_fields=True, **kwargs).bind(request=req('get'))
+
+    t = bind(auto__include=['c'], columns__a=Column(attr='foo__a'))
+    assert t.sorted_and_filtered_rows.query.deferred_loading == (frozenset({'c', 'foo__a'}), False)
+    assert [(x.c, x.foo.a) for x in t.sorted_and_filtered_rows] == [(True, 1)]
+
+    # foo is used as a whole, so we can't only load foo.a
+    t = bind(columns__a=Column(attr='foo__a'))
+    assert t.sorted_and_filtered_rows.query.deferred_loading == (frozenset({'c', 'foo'}), False)
+
+    t = Table(
+        auto__model=TBar,
+        auto__include=['c'],
+        only_needed_fields=['foo__b'],
+        columns__a=Column(attr='foo__a'),
+    ).bind(request=req('get'))
+    assert t.sorted_and_filtered_rows.query.deferred_loading == (frozenset({'c', 'foo__a', 'foo__b'}), False)
+
+    # We can't know what fields these use
+    t = bind(columns__x=Column(attr='not_a_field'))
+    assert t.sorted_and_filtered_rows.query.deferred_loading == (frozenset(), True)
+    t = bind(columns__x=Column(cell__value=lambda row, **_: row.c))
+    assert t.sorted_and_filtered_rows.query.deferred_loading == (frozenset(), True)
+
+
+@pytest.mark.django_db
+def test_batch_loader():
+    for x in range(5):
+        TFoo.objects.create(a=x, b='foo')
+
+    batches = []
+
+    def batch_loader(table, column, rows, **_):
+        batches.append([x.a for x in rows])
+        return {x.pk: x.a * 10 for x in rows}
+
+    t = Table(
+        auto__model=TFoo,
+        auto__include=['a'],
+        columns__ten_a=Column(batch_loader=batch_loader),
+        page_size=2,
+        only_needed_fields=True,
+    ).bind(request=req('get', page='2'))
+    assert t.sorted_and_filtered_rows.query.deferred_loading == (frozenset({'a'}), False)
+
+    assert [[cell.value for cell in cells] for cells in t.cells_for_rows()] == [[2, 20], [3, 30]]
+    assert batches == [[2, 3]]
+    assert t.columns.ten_a.batch_values == {x.pk: x.a * 10 for x in t.visible_rows}
+
+    # Streaming loads a batch per chunk
+    batches.clear()
+    t = Table(
+        auto__model=TFoo,
+        auto__include=['a'],
+        columns__ten_a=Column(batch_loader=batch_loader),
+        stream_chunk_size=2,
+    ).bind(request=req('get', **{'/csv': ''}))
+    values = [[cell.value for cell in cells] for cells in t.cells_for_rows(paginate=False, iterator_chunk_size=2)]
+    assert values == [[x, x * 10] for x in range(5)]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_batch_loader_on_objects():
+    class Row:
+        def __init__(self, name):
+            self.name = name
+
+    rows = [Row('a'), Row('b')]
+    t = Table(
+        columns__name=Column(),
+        columns__upper=Column(batch_loader=lambda rows, **_: {id(x): x.name.upper() for x in rows}),
+        rows=rows,
+    ).bind(request=req('get'))
+    assert [[cell.value for cell in cells] for cells in t.cells_for_rows()] == [['a', 'A'], ['b', 'B']]
+
+    t = Table(
+        columns__name=Column(attr=None, cell__value=lambda row, **_: row['name']),
+        columns__upper=Column(
+            batch_loader=lambda rows, **_: {x['name']: x['name'].upper() for x in rows},
+            batch_key=lambda row, **_: row['name'],
+        ),
+        rows=[dict(name='a'), dict(name='b')],
+    ).bind(request=req('get'))
+    assert [[cell.value for cell in cells] for cells in t.cells_for_rows()] == [['a', 'A'], ['b', 'B']]
+
+
 @pytest.mark.django_db
 def test_reinvoke():
     class MyTable(Table):
@@ -4092,3 +4779,53 @@ class TestTable(Table):
             </div>
         """,
     )
+
+
+@pytest.mark.django_db
+def test_render_to_streaming_response():
+    for i in range(5):
+        TFoo.objects.create(a=i, b=f'foo {i}')
+
+    table = Table(auto__model=TFoo, page_size=None, stream_chunk_size=2)
+
+    expected = table.bind(request=req('get')).render_to_response().content.decode()
+
+    bound = table.bind(request=req('get'))
+    response = bound.render_to_streaming_response()
+    chunks = [x.decode() for x in response.streaming_content]
+
+    assert ''.join(chunks) == expected
+    assert 'iommi-stream' not in expected
+    row_chunks = [x for x in chunks if '<tr data-pk' in x]
+    assert [x.count('<tr data-pk') for x in row_chunks] == [2, 2, 1]
+    # The rows are iterated without filling the QuerySet cache
+    assert bound.get_visible_rows()._result_cache is None
+
+
+@pytest.mark.django_db
+def test_render_after_streaming():
+    TFoo.objects.create(a=1, b='foo')
+
+    table = Table(auto__model=TFoo, page_size=None)
+    expected = table.bind(request=req('get')).__html__()
+
+    bound = table.bind(request=req('get'))
+    b''.join(bound.render_to_streaming_response().streaming_content)
+    html = bound.__html__()
+
+    assert 'iommi-stream' not in html
+    assert html == expected
+
+
+@pytest.mark.django_db
+def test_render_to_streaming_response_page():
+    TFoo.objects.create(a=1, b='foo')
+
+    class MyPage(Page):
+        foos = Table(auto__model=TFoo, page_size=None)
+        bars = Table(auto__model=TFoo, page_size=None, columns__b__include=False)
+
+    expected = MyPage().bind(request=req('get')).render_to_response().content.decode()
+    response = MyPage().bind(request=req('get')).render_to_streaming_response()
+
+    assert b''.join(response.streaming_content).decode() == expected
@@ -7,10 +7,15 @@
 )
 
 from iommi.attrs import (
+    Attrs,
+    attrs_are_static,
+    attrs_render_cache,
     evaluate_attrs,
 )
 from iommi.base import (
+    iommi_debug_on,
     items,
+    MISSING,
     NOT_BOUND_MESSAGE,
 )
 from iommi.declarative.namespace import Namespace
@@ -24,6 +29,7 @@
     has_catch_all_kwargs,
     is_callable,
     matches,
+    ParameterScope,
     signature_from_kwargs,
 )
 from iommi.refinable import (
@@ -48,6 +54,113 @@ class PathNotFoundException(Exception):
     pass
 
 
+def _can_copy_dict(cls):
+    # True if copy.copy(obj) would just create a new object with the same __dict__
+    return (
+        getattr(cls, '__copy__', None) is None
+        and cls.__reduce_ex__ is object.__reduce_ex__
+        and cls.__reduce__ is object.__reduce__
+        and getattr(cls, '__getstate__', None) is getattr(object, '__getstate__', None)
+        and not any('__slots__' in vars(c) for c in cls.__mro__[:-1])
+    )
+
+
+class BindPlan:
+    """
+    Internal class used by `Traversable.bind`. The parts of binding that only
+    depend on the refine_done'd declaration are worked out once and kept on
+    the declaration, so binding it again for the next request only does the
+    evaluation that is left.
+    """
+
+    def __init__(self, declaration):
+        cls = type(declaration)
+        self.copy_dict = _can_copy_dict(cls)
+
+        self.has_include = hasattr(declaration, 'include')
+        self.dynamic_include = self.has_include and is_callable(declaration.include)
+
+        self.has_attrs = hasattr(declaration, 'attrs')
+        self.attrs = getattr(declaration, 'attrs', None)
+        self.static_attrs = None
+        if self.attrs and isinstance(self.attrs, dict) and attrs_are_static(self.attrs):
+            # on_bind can write to the attrs of the declaration in place, so
+            # the snapshot is only used while the attrs still look like this
+            self.static_attrs = {
+                **{k: v for k, v in items(self.attrs) if k not in ('class', 'style')},
+                'class': dict(self.attrs.get('class') or {}),
+                'style': dict(self.attrs.get('style') or {}),
+            }
+
+        # Attrs evaluated once, that the binds share, like the attrs of static fragments
+        self.shared_attrs = getattr(declaration, '_shared_attrs', None)
+
+        self.has_extra_evaluated = hasattr(declaration, 'extra_evaluated')
+        self.extra_evaluated = getattr(declaration, 'extra_evaluated', None)
+        self.static_extra_evaluated = None
+        if not self.extra_evaluated:
+            self.static_extra_evaluated = {}
+        elif not any(is_callable(v) for v in self.extra_evaluated.values()):
+            self.static_extra_evaluated = dict(self.extra_evaluated)
+
+        # Only callables can fail the check that special evaluated refinables have been evaluated by on_bind
+        self.special_evaluated_to_check = [
+            k
+            for k in get_special_evaluated_attributes(declaration)
+            if is_callable(getattr(declaration, k)) and not isinstance(getattr(declaration, k), type)
+        ]
+
+    def copy(self, declaration):
+        if not self.copy_dict:
+            return copy.copy(declaration)
+        result = object.__new__(type(declaration))
+        result.__dict__.update(declaration.__dict__)
+        return result
+
+    def evaluate_attrs(self, result):
+        attrs = result.attrs
+        if (
+            self.shared_attrs is not None
+            and attrs is self.attrs
+            and self.static_attrs is not None
+            and not iommi_debug_on()
+            and self._attrs_unchanged(attrs)
+        ):
+            return self.shared_attrs
+        if attrs is self.attrs and self.static_attrs is not None and self._attrs_unchanged(attrs):
+            result = Attrs(
+                _parent=result,
+                **{
+                    **self.static_attrs,
+                    'class': dict(self.static_attrs['class']),
+                    'style': dict(self.static_attrs['style']),
+                },
+            )
+            result.set_render_cache(attrs_render_cache(attrs))
+            return result
+        return evaluate_attrs(result, **result.iommi_evaluate_parameters())
+
+    def _attrs_unchanged(self, attrs):
+        static_attrs = self.static_attrs
+        if len(attrs) != len(static_attrs) - ('class' not in attrs) - ('style' not in attrs):
+            return False
+        for k, v in items(attrs):
+            expected = static_attrs.get(k, MISSING)
+            if k in ('class', 'style') and not v:
+                # None and an empty dict both evaluate to an empty dict
+                v = {}
+            if type(v) is not type(expected) and not (isinstance(v, dict) and isinstance(expected, dict)):
+                return False
+            if v != expected:
+                return False
+        return True
+
+    def evaluate_extra_evaluated(self, result):
+        if result.extra_evaluated is self.extra_evaluated and self.static_extra_evaluated is not None:
+            return Struct(self.static_extra_evaluated)
+        return Struct(evaluate_as_needed(result.extra_evaluated or {}, result.iommi_evaluate_parameters()))
+
+
 class Traversable(RefinableObject):
     """
     Abstract API for objects that have a place in the iommi path structure.
@@ -59,6 +172,7 @@ class Traversable(RefinableObject):
     _parent = None
     _is_bound = False
     _request = None
+    _bind_plan = None
     context = None
 
     iommi_style: str = Refinable()
@@ -136,14 +250,14 @@ def iommi_dunder_path(self) -> str:
     def apply_style(self, iommi_style: Style, is_root=True):
         assert iommi_style.__class__.__name__ == "Style", iommi_style.__class__.__name__
 
-        refinements = iommi_style.resolve(obj=self, is_root=is_root)
+        refinements = iommi_style.resolve_refinements(obj=self, is_root=is_root)
 
         result = self
         del self
 
         if refinements:
             for refinement in refinements:
-                result = result.refine(Prio.style, **Namespace(refinement))
+                result = result.refine(Prio.style, **refinement)
         else:
             result = result.refine(Prio.style)
 
@@ -158,6 +272,7 @@ def on_refine_done(self, parent=None):
             find_static_items(attrs)
             find_static_items(attrs.get('style', None))
             find_static_items(attrs.get('class', None))
+            attrs_render_cache(attrs)
 
         extra_evaluated = getattr(self, 'extra_evaluated', None)
         if extra_evaluated:
@@ -167,13 +282,18 @@ def bind(self, *, parent=None, request=None):
         assert parent is None or parent._is_bound
         assert not self._is_bound
 
-        result = copy.copy(self)
+        if self.is_refine_done:
+            plan = self._bind_plan
+            if plan is None:
+                plan = BindPlan(self)
+                self._bind_plan = plan
+            result = plan.copy(self)
+        else:
+            result = self.refine_done(parent=parent)
+            plan = BindPlan(result)
 
         is_root = parent is None
 
-        if not result.is_refine_done:
-            result = result.refine_done(parent=parent)
-
         # todo drop _declared
         result._declared = self
         del self  # to prevent mistakes when changing the code below
@@ -188,23 +308,29 @@ def bind(self, *, parent=None, request=None):
         result._bound_members = Struct()
         result._is_bound = True
 
-        evaluate_parameters = {
-            **(parent.iommi_evaluate_parameters() if parent is not None else {}),
+        layer = {
             **result.own_evaluate_parameters(),
             'traversable': result,
         }
         if parent is None:
-            evaluate_parameters['request'] = request
+            layer['request'] = request
             if hasattr(request, 'iommi_view_params'):
                 params = request.iommi_view_params
                 extra_params = result.extra_params(request=request, **params)
                 assert isinstance(extra_params, dict), 'extra_params needs to return a dict with additional parameters'
                 params.update(extra_params)
-                evaluate_parameters['params'] = params
-        result._evaluate_parameters = evaluate_parameters
-
-        if hasattr(result, 'include'):
-            include = evaluate_strict(result.include, **evaluate_parameters)
+                layer['params'] = params
+        scope = ParameterScope.from_layer(parent._evaluate_parameters if parent is not None else None, layer)
+        result._evaluate_parameters = scope
+
+        if plan.has_include:
+            if plan.dynamic_include:
+                evaluate_parameters = scope.flat()
+                include = evaluate_strict(
+                    result.include, __signature=evaluate_parameters.signature, **evaluate_parameters
+                )
+            else:
+                include = result.include
             if not bool(include):
                 return None
 
@@ -216,15 +342,17 @@ def bind(self, *, parent=None, request=None):
         if result.include is False:
             return None
 
-        evaluate_members(result, **evaluate_parameters)
+        if result._refinables_dynamic:
+            evaluate_parameters = scope.flat()
+            evaluate_members(result, __signature=evaluate_parameters.signature, **evaluate_parameters)
 
-        if hasattr(result, 'attrs'):
-            result.attrs = evaluate_attrs(result, **result.iommi_evaluate_parameters())
+        if plan.has_attrs:
+            result.attrs = plan.evaluate_attrs(result)
 
-        if hasattr(result, 'extra_evaluated'):
-            result.extra_evaluated = Struct(evaluate_as_needed(result.extra_evaluated or {}, evaluate_parameters))
+        if plan.has_extra_evaluated:
+            result.extra_evaluated = plan.evaluate_extra_evaluated(result)
 
-        for k in get_special_evaluated_attributes(result):
+        for k in plan.special_evaluated_to_check:
             v = getattr(result, k)
             if is_callable(v) and not isinstance(v, type):
                 assert False, ('SpecialEvaluatedRefinable not evaluated', k, v, repr(result))
@@ -238,7 +366,8 @@ def own_evaluate_parameters(self):
         return {}
 
     def iommi_evaluate_parameters(self):
-        return self._evaluate_parameters
+        scope = self._evaluate_parameters
+        return scope.flat() if scope is not None else None
 
     def invoke_callback(self, callback, **kwargs):
         try:
@@ -330,50 +459,82 @@ def include_in_short_path(node):
     return getattr(node, '_name', None) is not None
 
 
+def _path_members(node):
+    if isinstance(node, RefinableObject):
+        members = declared_members(node)
+    elif isinstance(node, dict):
+        members = node
+        assert '_declared_members' not in members
+    else:
+        return []
+
+    result = []
+    for name, member in sorted(items(members), key=lambda item: item[0] == 'endpoints'):
+        assert name != '_declared_members'
+        if member:
+            result.append((name, member))
+    return result
+
+
+def _walk_path_subtree(node):
+    subtree = []
+    for name, member in _path_members(node):
+        included = include_in_short_path(member)
+        short_prefix = (name,) if included else ()
+        if included:
+            subtree.append(((name,), short_prefix, member))
+        for long_segments, short_segments, n in _path_subtree(member):
+            subtree.append(((name,) + long_segments, short_prefix + short_segments, n))
+    return subtree
+
+
+def _path_subtree(node):
+    """
+    The nodes below `node`, in the order `build_long_path_by_path` visits them, with the
+    long path segments and short path candidate segments relative to `node`.
+
+    Below a refine_done'd declaration this only depends on the declaration, so it is
+    computed once and shared by everything bound from it. Bound nodes can get members
+    at bind time, so they are walked every time.
+    """
+    if isinstance(node, RefinableObject) and node.is_refine_done and not getattr(node, '_is_bound', False):
+        try:
+            return node.__dict__['_iommi_declared_path_subtree']
+        except KeyError:
+            subtree = _walk_path_subtree(node)
+            node._iommi_declared_path_subtree = subtree
+            return subtree
+
+    return _walk_path_subtree(node)
+
+
 def build_long_path_by_path(root) -> Dict[str, str]:
     result = dict()
 
-    def _traverse(node, long_path_segments, short_path_candidate_segments):
-        if include_in_short_path(node):
-
-            def find_unique_suffix(parts):
-                for i in range(len(parts), -1, -1):
-                    candidate = '/'.join(parts[i:])
-                    if candidate not in result:
-                        return candidate
-
-            long_path = '/'.join(long_path_segments)
-            short_path = find_unique_suffix(short_path_candidate_segments)
-            if short_path is None:
-                less_short_path = find_unique_suffix(long_path_segments)
-                assert less_short_path is not None, (
-                    f"Ran out of names...\n"
-                    f"Any suitable short name for {'/'.join(long_path_segments)} already taken.\n\n"
-                    f"Result so far:\n" + '\n'.join(f'{k}   ->   {v}' for k, v in result.items())
-                )
-                short_path = less_short_path
-            result[short_path] = long_path
-
-            node._iommi_path_cache = short_path
+    def find_unique_suffix(parts):
+        for i in range(len(parts), -1, -1):
+            candidate = '/'.join(parts[i:])
+            if candidate not in result:
+                return candidate
+
+    def register(node, long_path_segments, short_path_candidate_segments):
+        long_path = '/'.join(long_path_segments)
+        short_path = find_unique_suffix(short_path_candidate_segments)
+        if short_path is None:
+            less_short_path = find_unique_suffix(long_path_segments)
+            assert less_short_path is not None, (
+                f"Ran out of names...\n"
+                f"Any suitable short name for {'/'.join(long_path_segments)} already taken.\n\n"
+                f"Result so far:\n" + '\n'.join(f'{k}   ->   {v}' for k, v in result.items())
+            )
+            short_path = less_short_path
+        result[short_path] = long_path
 
-        if isinstance(node, RefinableObject):
-            members = declared_members(node)
-        elif isinstance(node, dict):
-            members = node
-            assert '_declared_members' not in members
-        else:
-            return
-
-        for name, member in sorted(items(members), key=lambda item: item[0] == 'endpoints'):
-            assert name != '_declared_members'
-            if member:
-                _traverse(
-                    member,
-                    long_path_segments=long_path_segments + [name],
-                    short_path_candidate_segments=short_path_candidate_segments
-                    + ([name] if include_in_short_path(member) else []),
-                )
+        node._iommi_path_cache = short_path
 
-    _traverse(root, [], [])
+    if include_in_short_path(root):
+        register(root, (), ())
+    for long_path_segments, short_path_candidate_segments, node in _path_subtree(root):
+        register(node, long_path_segments, short_path_candidate_segments)
 
     return result
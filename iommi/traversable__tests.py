@@ -88,6 +88,22 @@ def test_traverse():
     assert len(keys(actual)) == len(set(keys(actual)))
 
 
+def test_traverse_reuses_declared_subtrees():
+    root = Box(
+        _name='root',
+        items__foo=Box(items__bar=Basket(fruits__baz=Fruit())),
+    ).refine_done()
+
+    expected = build_long_path_by_path(root)
+    foo = root.iommi_namespace['items']['foo']
+    subtree = foo._iommi_declared_path_subtree
+    assert [n._name for _, _, n in subtree] == ['bar', 'baz']
+
+    assert build_long_path_by_path(root.bind(request=None)) == expected
+    assert build_long_path_by_path(root.bind(request=None)) == expected
+    assert foo._iommi_declared_path_subtree is subtree
+
+
 @pytest.mark.django_db
 def test_traverse_on_iommi():
     class MyPage(Page):
@@ -131,6 +147,7 @@ class MyPage(Page):
         'columns/validate': 'parts/a_table/query/form/fields/columns/endpoints/validate',
         'config': 'parts/some_form/fields/fisk/endpoints/config',
         'csv': 'parts/a_table/endpoints/csv',
+        'count': 'parts/a_table/endpoints/count',
         'container': 'parts/a_table/container',
         'container/text': 'parts/a_table/container/children/text',
         'debug_tree': 'endpoints/debug_tree',
@@ -599,6 +616,79 @@ class MyTraversable(Traversable):
         ).bind()
 
 
+def test_bind_plan():
+    fragment = Fragment(
+        attrs__class__foo=True,
+        attrs__style__color='red',
+        attrs__title='static',
+        extra_evaluated__x=1,
+    ).refine_done()
+    assert fragment._bind_plan is None
+
+    first = fragment.bind(request=req('get'))
+    plan = fragment._bind_plan
+    assert plan is not None
+    assert plan.copy_dict
+    assert not plan.dynamic_include
+    assert plan.static_attrs is not None
+    assert plan.special_evaluated_to_check == []
+
+    second = fragment.bind(request=req('get'))
+    assert fragment._bind_plan is plan
+    assert second.attrs == first.attrs == Namespace(class__foo=True, style__color='red', title='static')
+    assert second.attrs['class'] is not first.attrs['class']
+    assert second.extra_evaluated == dict(x=1)
+    assert str(second.attrs) == ' class="foo" style="color: red" title="static"'
+
+
+def test_bind_plan_dynamic():
+    class MyFragment(Fragment):
+        def on_bind(self):
+            super().on_bind()
+            if self.extra.get('replace_attrs'):
+                self.attrs = Namespace(title=lambda fragment, **_: fragment._name)
+
+    fragment = MyFragment(
+        _name='frag',
+        include=lambda request, **_: request.GET.get('include') == '1',
+        attrs__class__foo=lambda request, **_: 'foo' in request.GET,
+        extra_evaluated__x=lambda request, **_: request.GET.get('x'),
+    ).refine_done()
+    plan = None
+    for i in range(2):
+        assert fragment.bind(request=req('get')) is None
+        bound = fragment.bind(request=req('get', include='1', foo='', x='y'))
+        assert bound.attrs == {'class': {'foo': True}, 'style': {}}
+        assert bound.extra_evaluated == dict(x='y')
+        plan = plan or fragment._bind_plan
+        assert fragment._bind_plan is plan
+    assert plan.dynamic_include
+    assert plan.static_attrs is None
+    assert plan.static_extra_evaluated is None
+
+    # The plan is not used for attrs that are replaced in on_bind
+    static = MyFragment(_name='frag', attrs__title='static', extra__replace_attrs=True).refine_done()
+    static.bind()
+    assert static._bind_plan.static_attrs is not None
+    assert static.bind().attrs == dict(title='frag', **{'class': {}, 'style': {}})
+
+
+@pytest.mark.django_db
+def test_bind_plan_attrs_written_in_on_bind():
+    class MyForm(Form):
+        def on_bind(self):
+            super().on_bind()
+            self.attrs['data-x'] = 'hello'
+            self.attrs['class']['bar'] = True
+
+    form = MyForm(auto__model=TFoo, attrs__class__foo=True).refine_done()
+    for _ in range(3):
+        bound = form.bind(request=req('get'))
+        assert bound.attrs['data-x'] == 'hello'
+        assert bound.attrs['class'] == dict(foo=True, bar=True)
+        assert 'data-x="hello"' in bound.__html__()
+
+
 def test_extra_params():
     class MyPage(Page):
         class Meta:
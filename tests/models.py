@@ -163,6 +163,13 @@ class Meta:
         ordering = ('pk',)
 
 
+class TNullableBar(Model):
+    foo = ForeignKey(TFoo, on_delete=CASCADE, null=True, related_name='+')
+
+    class Meta:
+        ordering = ('pk',)
+
+
 class TBaz(Model):
     foo = ManyToManyField(TFoo)
 